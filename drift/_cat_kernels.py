@@ -0,0 +1,68 @@
+# Compiled category counting for categorical drift metrics
+import numpy as np
+
+from drift._kernels import njit
+
+# Hash-table factorization is only used for bounded cardinality
+MAX_HASHED_CATEGORIES = 100_000
+
+
+@njit(cache=True)
+def _factorize_hashed(hashes, max_categories):
+    """
+    Assign dense integer codes to precomputed category hashes.
+    
+    Codes follow order of first appearance, like pd.factorize(sort=False).
+    
+    Args:
+        hashes: Category hashes (non-empty 1-D int64 array)
+        max_categories: Give up once more categories than this are seen
+    
+    Returns:
+        tuple: (codes, first, n_categories); first[c] is the position of
+            the first value with code c, and n_categories is -1 if the
+            limit was hit
+    """
+    codes = np.zeros(hashes.shape[0], dtype=np.int64)
+    first = np.zeros(hashes.shape[0], dtype=np.int64)
+    index = {hashes[0]: 0}
+    for i in range(1, hashes.shape[0]):
+        h = hashes[i]
+        if h in index:
+            codes[i] = index[h]
+        else:
+            code = len(index)
+            if code >= max_categories:
+                return codes, first, -1
+            index[h] = code
+            codes[i] = code
+            first[code] = i
+    
+    return codes, first, len(index)
+
+
+def factorize_strings(values, max_categories=MAX_HASHED_CATEGORIES):
+    """
+    Factorize a fixed-width string array through the compiled hash table.
+    
+    String hashing happens once at the Python boundary; the counting loop
+    then runs on int64 hashes without touching Python objects. Values that
+    share a hash share a code, so every value is then compared with the
+    first value of its code to rule out hash collisions.
+    
+    Args:
+        values: Non-empty NumPy array of dtype kind 'U' or 'S'
+        max_categories: Maximum cardinality handled by the hash table
+    
+    Returns:
+        tuple | None: (codes, n_categories), or None if values have more
+            than max_categories distinct categories or two distinct
+            categories share a hash
+    """
+    hashes = np.frompyfunc(hash, 1, 1)(values).astype(np.int64)
+    codes, first, n_categories = _factorize_hashed(hashes, max_categories)
+    if n_categories < 0:
+        return None
+    if not np.array_equal(values[first[:n_categories]][codes], values):
+        return None
+    return codes, n_categories
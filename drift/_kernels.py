@@ -0,0 +1,216 @@
+# Compiled numeric kernels for drift metrics
+#
+# numba is an optional dependency. When it is not installed, ``njit`` is a
+# no-op decorator so the kernels remain importable (and testable) as plain
+# Python; callers check NUMBA_AVAILABLE and use their NumPy path instead.
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """Fallback decorator used when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        
+        def decorator(func):
+            return func
+        
+        return decorator
+
+
+@njit(cache=True)
+def _psi_kernel(ref_props, curr, inner_edges):
+    """
+    Compute PSI of current data against precomputed reference proportions.
+    
+    Bins the current data in a single pass (see _bin_counts) and reduces
+    over the bins without temporary arrays. Not compiled with fastmath:
+    callees compiled for a fastmath caller can be cached with its flags,
+    and _bin_counts relies on NaN comparisons.
+    
+    Args:
+        ref_props: Reference bin proportions (zeros already replaced by epsilon)
+        curr: Current values (1-D numeric array)
+        inner_edges: Sorted interior bin edges (len(ref_props) - 1 values);
+            the outer bins are open-ended
+    
+    Returns:
+        float: PSI value
+    """
+    return _psi_from_counts(ref_props, _bin_counts(curr, inner_edges))
+
+
+@njit(cache=True)
+def _bin_counts(values, inner_edges):
+    """
+    Count values per bin in one pass, without an index array.
+    
+    Equivalent to np.bincount(np.searchsorted(inner_edges, values,
+    side='right'), minlength=len(inner_edges) + 1). Comparisons use the
+    same order as searchsorted, with NaN above every number: NaN values
+    land in the last bin, and NaN edges (from a reference holding NaN)
+    sit above every non-NaN value.
+    
+    Args:
+        values: Values to bin (1-D numeric array)
+        inner_edges: Sorted interior bin edges; the outer bins are open-ended
+    
+    Returns:
+        np.ndarray: Bin counts (int64, length len(inner_edges) + 1)
+    """
+    n_edges = inner_edges.shape[0]
+    counts = np.zeros(n_edges + 1, dtype=np.int64)
+    
+    # Bin i holds inner_edges[i-1] <= v < inner_edges[i]; the binary search
+    # is inlined so the compiler keeps it in registers
+    for v in values:
+        lo = 0
+        hi = n_edges
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            edge = inner_edges[mid]
+            if v < edge or (edge != edge and v == v):
+                hi = mid
+            else:
+                lo = mid + 1
+        counts[lo] += 1
+    
+    return counts
+
+
+@njit(cache=True, fastmath=True)
+def _psi_from_counts(ref_props, curr_counts):
+    """
+    Reduce current bin counts to PSI against reference proportions.
+    
+    Args:
+        ref_props: Reference bin proportions (zeros already replaced by epsilon)
+        curr_counts: Current bin counts (same length as ref_props)
+    
+    Returns:
+        float: PSI value
+    """
+    eps = 1e-10
+    n_curr = curr_counts.sum()
+    psi = 0.0
+    
+    # Single reduction over the bins; empty current bins use epsilon.
+    # log(q / p) is one division and one log per bin, which is already
+    # cheaper than log1p((q - p) / p) and gives the same PSI
+    for i in range(ref_props.shape[0]):
+        p = ref_props[i]
+        q = max(curr_counts[i] / n_curr, eps)
+        psi += (q - p) * math.log(q / p)
+    
+    return psi
+
+
+@njit(cache=True, parallel=True)
+def _psi_batch(ref_props, current, inner_edges):
+    """
+    Compute PSI for several features in parallel, one feature per thread.
+    
+    Each thread bins its feature's current values and reduces them to PSI,
+    so nothing is shared between threads and the loop runs without the GIL.
+    
+    Args:
+        ref_props: Reference proportions, shape (n_features, n_bins)
+            (zeros already replaced by epsilon)
+        current: Current values, shape (m_rows, n_features); column-major
+            order keeps each feature's values contiguous
+        inner_edges: Interior bin edges of each feature, shape
+            (n_features, n_bins - 1)
+    
+    Returns:
+        np.ndarray: PSI value of each feature
+    """
+    n_features = current.shape[1]
+    out = np.empty(n_features)
+    for j in prange(n_features):
+        out[j] = _psi_kernel(ref_props[j], current[:, j], inner_edges[j])
+    return out
+
+
+@njit(cache=True)
+def _ks_merge_statistic(a, b):
+    """
+    Two-sample KS statistic from a single merge over sorted samples.
+    
+    Walks both arrays once without allocating merged or searchsorted
+    arrays. The loop body is branchless: each step advances the side(s)
+    holding the smallest value via comparison results, and the CDF gap
+    (kept as an integer scaled by n1 * n2) only counts once a run of tied
+    values has been consumed on both sides.
+    
+    Args:
+        a: Sorted sample without NaN (1-D numeric array)
+        b: Sorted sample without NaN (1-D numeric array)
+    
+    Returns:
+        float: Largest absolute difference between the two CDFs
+    """
+    n1 = a.shape[0]
+    n2 = b.shape[0]
+    i = 0
+    j = 0
+    x = a[0]
+    max_gap = 0
+    
+    # Once either sample is exhausted its CDF is 1 and the gap only shrinks
+    while i < n1 and j < n2:
+        ai = a[i]
+        bj = b[j]
+        x = min(ai, bj)
+        i += ai <= bj
+        j += bj <= ai
+        
+        # Only the gap after the last value equal to x is a CDF difference
+        next_a = a[i] if i < n1 else np.inf
+        next_b = b[j] if j < n2 else np.inf
+        run_done = (next_a != x) & (next_b != x)
+        max_gap = max(max_gap, abs(i * n2 - j * n1) * run_done)
+    
+    # One side ran out inside a run of x: finish the run on the other side
+    while i < n1 and a[i] == x:
+        i += 1
+    while j < n2 and b[j] == x:
+        j += 1
+    max_gap = max(max_gap, abs(i * n2 - j * n1))
+    
+    return max_gap / (n1 * n2)
+
+
+@njit(cache=True)
+def _kolmogorov_sf(c):
+    """
+    Survival function of the asymptotic Kolmogorov distribution.
+    
+    Evaluates Q(c) = 2 * sum_{i>=1} (-1)^(i-1) * exp(-2 * i^2 * c^2),
+    stopping once terms drop below 1e-15 (a handful of terms for the
+    values of c that decide drift), and giving up after 100 terms.
+    
+    Args:
+        c: Scaled KS statistic
+    
+    Returns:
+        float: Asymptotic p-value in [0, 1]
+    """
+    total = 0.0
+    sign = 1.0
+    for i in range(1, 101):
+        term = math.exp(-2.0 * c * c * i * i)
+        total += sign * term
+        if term < 1e-15:
+            return min(max(2.0 * total, 0.0), 1.0)
+        sign = -sign
+    
+    # The series does not converge for very small c, where Q(c) -> 1
+    return 1.0
+
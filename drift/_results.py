@@ -0,0 +1,57 @@
+# Lightweight drift result type for streaming callers
+#
+# Kept free of NumPy and other heavy imports so the CLI can load it eagerly.
+from dataclasses import dataclass
+
+
+# Metric names indexed by DetectorBatch.metric_code
+METRIC_NAMES = ("psi", "ks", "chi_square")
+
+
+@dataclass(frozen=True)
+class DriftResult:
+    """
+    Single drift detection result without per-result dict allocation.
+    
+    The public detectors return dicts; callers scoring long streams can
+    hold DriftResult instances instead and pass them straight to
+    generate_alert, converting with to_dict() only when serializing.
+    
+    Attributes:
+        drift_detected: Whether drift was detected
+        metric: Metric name ("psi", "ks", or "chi_square")
+        value: PSI value or test statistic
+        threshold: Threshold used for detection
+        p_value: Test p-value (None for PSI)
+    """
+    # Explicit slots (dataclass(slots=True) needs Python 3.10)
+    __slots__ = ("drift_detected", "metric", "value", "threshold", "p_value")
+    
+    drift_detected: bool
+    metric: str
+    value: float
+    threshold: float
+    p_value: float
+    
+    def to_dict(self):
+        """
+        Convert to the dict shape returned by the matching detector.
+        
+        Returns:
+            dict: PSI results use a "value" key, KS/Chi-Square results use
+                "statistic" and "p_value"
+        """
+        if self.metric == "psi":
+            return {
+                "drift_detected": self.drift_detected,
+                "metric": self.metric,
+                "value": self.value,
+                "threshold": self.threshold
+            }
+        return {
+            "drift_detected": self.drift_detected,
+            "metric": self.metric,
+            "statistic": self.value,
+            "p_value": self.p_value,
+            "threshold": self.threshold
+        }
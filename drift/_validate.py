@@ -0,0 +1,126 @@
+# Input validation shared by metrics, baselines and the pipeline
+
+# Metric name -> (kind of data accepted, label used in error messages)
+_METRIC_INPUTS = {
+    "psi": ("numerical", "PSI"),
+    "ks": ("numerical", "KS test"),
+    "chi_square": ("categorical", "Chi-Square test"),
+}
+
+_FEATURE_TYPES = ("numerical", "categorical")
+
+
+def check_not_empty(values, name):
+    """
+    Raise ValueError if values is empty.
+    
+    Only the size is read, so callers can run this before any conversion
+    or allocation.
+    
+    Args:
+        values: Input array or DataFrame
+        name: Dataset name used in the error message ("reference" or "current")
+    """
+    if values.size == 0:
+        raise ValueError(f"{name} data cannot be empty")
+
+
+def check_one_dimensional(values, label):
+    """
+    Raise ValueError unless values is a 1-D array.
+    
+    Args:
+        values: Input NumPy array
+        label: Metric label used in the error message
+    """
+    if values.ndim != 1:
+        raise ValueError(f"{label} requires 1-D data, got {values.ndim}-D")
+
+
+def check_numerical(values, label):
+    """
+    Raise TypeError unless values hold real numbers or times.
+    
+    Checked on the dtype alone, so strings, objects, booleans and complex
+    numbers are rejected here instead of failing deep inside a kernel.
+    
+    Args:
+        values: Input NumPy array
+        label: Metric label used in the error message
+    """
+    # Signed/unsigned integer, float, timedelta, datetime
+    if values.dtype.kind not in ('i', 'u', 'f', 'm', 'M'):
+        raise TypeError(f"{label} requires numerical data, not categorical")
+
+
+def check_categorical(values, label):
+    """
+    Raise TypeError if values hold continuous (floating point or complex) data.
+    
+    Args:
+        values: Input NumPy array
+        label: Metric label used in the error message
+    """
+    if values.dtype.kind in ('f', 'c'):
+        raise TypeError(f"{label} requires categorical data, not continuous numerical")
+
+
+def validate_options(metric, threshold, feature_type):
+    """
+    Validate pipeline options that do not depend on the data.
+    
+    Args:
+        metric: Metric name ("psi", "ks", or "chi_square")
+        threshold: Threshold for drift detection
+        feature_type: Type of feature ("numerical" or "categorical")
+    
+    Raises:
+        ValueError: If metric or feature_type is unsupported, or threshold <= 0
+    """
+    if metric not in _METRIC_INPUTS:
+        raise ValueError(f"unsupported metric: {metric}")
+    if feature_type not in _FEATURE_TYPES:
+        raise ValueError(f"unsupported feature_type: {feature_type}")
+    if threshold <= 0:
+        raise ValueError("threshold must be greater than 0")
+
+
+def check_kind(values, metric):
+    """
+    Raise TypeError if the data kind does not match the metric.
+    
+    Args:
+        values: Input NumPy array
+        metric: Supported metric name
+    """
+    kind, label = _METRIC_INPUTS[metric]
+    check = check_numerical if kind == "numerical" else check_categorical
+    check(values, label)
+
+
+def validate_inputs(reference, current, metric, threshold, feature_type):
+    """
+    Validate all pipeline inputs in one place.
+    
+    Callers that run this may pass _validated=True to the metric functions
+    to skip their own per-call checks.
+    
+    Args:
+        reference: Reference NumPy array
+        current: Current NumPy array
+        metric: Metric name ("psi", "ks", or "chi_square")
+        threshold: Threshold for drift detection
+        feature_type: Type of feature ("numerical" or "categorical")
+    
+    Raises:
+        ValueError: If data is empty, metric or feature_type is unsupported,
+            or threshold <= 0
+        TypeError: If the data kind does not match the metric
+    """
+    validate_options(metric, threshold, feature_type)
+    
+    check_not_empty(reference, "reference")
+    check_not_empty(current, "current")
+    
+    check_kind(reference, metric)
+    check_kind(current, metric)
@@ -1,4 +1,28 @@
 # Alert generation and management
+import numpy as np
+
+from drift.detectors import METRIC_NAMES
+from drift._results import DriftResult
+
+# Keys every detector output must provide
+_REQUIRED = ("drift_detected", "metric")
+
+# Multiple of the threshold above which drift is "critical" rather than
+# "warning" (PSI convention: 0.1 moderate, 0.2 significant). Override per
+# metric as needed; unknown metrics use _DEFAULT_CRITICAL.
+_CRITICAL = {
+    "psi": 2.0,
+    "ks": 2.0,
+    "chi_square": 2.0,
+}
+_DEFAULT_CRITICAL = 2.0
+
+# Precomputed alert messages for the built-in metrics
+_MSG = {
+    "psi": "Drift detected using psi metric",
+    "ks": "Drift detected using ks metric",
+    "chi_square": "Drift detected using chi_square metric",
+}
 
 
 def generate_alert(detector_output):
@@ -6,69 +30,179 @@ def generate_alert(detector_output):
     Generate alert from drift detector output.
     
     Args:
-        detector_output: Dictionary containing detector results
+        detector_output: Dictionary containing detector results, or a
+            DriftResult
         
     Returns:
         dict | None: Alert dictionary if drift detected, None otherwise
         
     Raises:
-        TypeError: If detector_output is not a dict
+        TypeError: If detector_output is not a dict or DriftResult
         ValueError: If required keys are missing
     """
+    # DriftResult fields are always present; no key checks needed
+    if isinstance(detector_output, DriftResult):
+        return _alert_from_result(detector_output)
+    
     # Validate input type
     if not isinstance(detector_output, dict):
         raise TypeError("detector_output must be a dictionary")
     
     # Validate required keys
-    if "drift_detected" not in detector_output:
-        raise ValueError("drift_detected key is required")
-    if "metric" not in detector_output:
-        raise ValueError("metric key is required")
+    for key in _REQUIRED:
+        if key not in detector_output:
+            raise ValueError(f"{key} key is required")
     
     # No alert if no drift detected
     if not detector_output["drift_detected"]:
         return None
     
-    # Extract metric type
     metric = detector_output["metric"]
     
-    # Determine severity based on value vs threshold
-    # For PSI: use "value" and "threshold"
-    # For KS: use "statistic" and "threshold"
-    # For Chi-Square: p_value based, but we still need value for severity
-    
-    # Get the relevant value for severity calculation
+    # Get the relevant value for severity calculation:
+    # PSI reports "value", KS/Chi-Square report "statistic"
     if "value" in detector_output:
         value = detector_output["value"]
-    elif "statistic" in detector_output:
-        value = detector_output["statistic"]
-    elif "p_value" in detector_output:
-        # For chi-square, p_value is used for drift detection
-        # but we can't use it for severity mapping the same way
-        # We'll use a default or the statistic if available
-        value = detector_output.get("statistic", 0)
     else:
-        value = 0
+        value = detector_output.get("statistic", 0)
     
     threshold = detector_output.get("threshold", 0)
     
     # Determine severity
-    if value <= 2 * threshold:
-        severity = "warning"
-    else:
-        severity = "critical"
-    
-    # Create alert message
-    message = f"Drift detected using {metric} metric"
+    crit_cut = _CRITICAL.get(metric, _DEFAULT_CRITICAL) * threshold
+    severity = "critical" if value > crit_cut else "warning"
     
     # Create details dict from detector output (excluding drift_detected)
-    details = {k: v for k, v in detector_output.items() if k != "drift_detected"}
+    details = dict(detector_output)
+    del details["drift_detected"]
     
     return {
         "alert": True,
         "severity": severity,
         "metric": metric,
-        "message": message,
+        "message": _MSG.get(metric) or f"Drift detected using {metric} metric",
         "details": details
     }
 
+
+def _alert_from_result(result):
+    """Generate an alert from a DriftResult (see generate_alert)."""
+    if not result.drift_detected:
+        return None
+    
+    details = result.to_dict()
+    del details["drift_detected"]
+    
+    crit_cut = _CRITICAL.get(result.metric, _DEFAULT_CRITICAL) * result.threshold
+    
+    return {
+        "alert": True,
+        "severity": "critical" if result.value > crit_cut else "warning",
+        "metric": result.metric,
+        "message": _MSG.get(result.metric) or f"Drift detected using {result.metric} metric",
+        "details": details
+    }
+
+
+def _details(metric, value, p_value, threshold):
+    # Alert details in the scalar detector's layout (excluding drift_detected):
+    # PSI reports "value", KS/Chi-Square "statistic" and "p_value"
+    if metric == "psi":
+        return {"metric": metric, "value": value, "threshold": threshold}
+    return {"metric": metric, "statistic": value, "p_value": p_value, "threshold": threshold}
+
+
+def generate_alerts_batch(values, thresholds, metrics, drift_mask, p_values=None):
+    """
+    Generate alerts for many detector results at once.
+    
+    Severity is classified for all entries with one vectorized comparison;
+    alert dicts are only built for entries where drift was detected.
+    
+    Args:
+        values: PSI values or test statistics, used for severity
+            (array-like of floats)
+        thresholds: Drift thresholds (array-like of floats)
+        metrics: Metric name for each entry (sequence of str)
+        drift_mask: Whether drift was detected for each entry (array-like of bool)
+        p_values: Test p-values (array-like of floats); required when any
+            entry is a KS or Chi-Square result, ignored for PSI entries
+        
+    Returns:
+        list: Alert dictionaries (same shape as generate_alert output) for
+            entries with drift, in input order
+            
+    Raises:
+        ValueError: If inputs have different lengths, or p_values is
+            missing for KS/Chi-Square entries
+    """
+    values = np.asarray(values, dtype=np.float64)
+    thresholds = np.asarray(thresholds, dtype=np.float64)
+    drift_mask = np.asarray(drift_mask, dtype=bool)
+    
+    # Validate lengths
+    n = len(values)
+    if not (len(thresholds) == len(metrics) == len(drift_mask) == n):
+        raise ValueError("values, thresholds, metrics and drift_mask must have the same length")
+    if p_values is None:
+        if any(m != "psi" for m in metrics):
+            raise ValueError("p_values is required for ks and chi_square alerts")
+        p_values = [None] * n
+    elif len(p_values) != n:
+        raise ValueError("p_values must have the same length as values")
+    
+    # Classify severity for every entry in one pass
+    crit_mul = np.array([_CRITICAL.get(m, _DEFAULT_CRITICAL) for m in metrics])
+    severities = np.where(values > crit_mul * thresholds, "critical", "warning").tolist()
+    value_list = values.tolist()
+    threshold_list = thresholds.tolist()
+    p_value_list = np.asarray(p_values, dtype=object).tolist()
+    
+    return [
+        {
+            "alert": True,
+            "severity": severities[i],
+            "metric": metrics[i],
+            "message": _MSG.get(metrics[i]) or f"Drift detected using {metrics[i]} metric",
+            "details": _details(metrics[i], value_list[i], p_value_list[i], threshold_list[i])
+        }
+        for i in np.flatnonzero(drift_mask).tolist()
+    ]
+
+
+def generate_alerts_from_batch(batch, feature_names):
+    """
+    Generate per-feature alerts from a DetectorBatch.
+    
+    Detector results stay as parallel arrays until this point; dicts are
+    only built for features where drift was detected.
+    
+    Args:
+        batch: DetectorBatch with one entry per feature
+        feature_names: Feature name for each batch entry
+    
+    Returns:
+        list: Alert dictionaries (generate_alert shape plus a "feature" key)
+            for features with drift, in input order
+    """
+    crit_mul = np.array([_CRITICAL[m] for m in METRIC_NAMES])[batch.metric_code]
+    severities = np.where(batch.value > crit_mul * batch.threshold, "critical", "warning").tolist()
+    values = batch.value.tolist()
+    thresholds = batch.threshold.tolist()
+    p_values = batch.p_value.tolist()
+    codes = batch.metric_code.tolist()
+    
+    alerts = []
+    for i in np.flatnonzero(batch.drift).tolist():
+        metric = METRIC_NAMES[codes[i]]
+        alerts.append({
+            "alert": True,
+            "severity": severities[i],
+            "metric": metric,
+            "message": _MSG[metric],
+            "details": _details(metric, values[i], p_values[i], thresholds[i]),
+            "feature": feature_names[i]
+        })
+    
+    return alerts
+
@@ -0,0 +1,478 @@
+# Precomputed reference baselines for repeated drift checks
+import hashlib
+import math
+import threading
+
+import numpy as np
+
+from drift._kernels import (
+    NUMBA_AVAILABLE, _bin_counts, _kolmogorov_sf, _ks_merge_statistic, _psi_from_counts,
+    _psi_kernel
+)
+from drift._ks_exact import EXACT_MAX_PRODUCT, ks_exact_sf
+from drift._validate import check_not_empty, check_numerical, check_one_dimensional
+
+# Bin count up to which the NumPy PSI reduction runs as one scalar pass
+_PSI_SCALAR_MAX_BINS = 20
+
+# Combined input size up to which KS uses the merged-sort statistic without
+# numba; larger inputs amortize KSBaseline's distinct-value counting
+_KS_MERGE_MAX = 8192
+
+# Baselines built by reference_baseline, keyed by reference content and
+# least recently used first
+_cache = {}
+_CACHE_SIZE = 8
+_cache_lock = threading.Lock()
+
+
+def _ks_p_value(statistic, n, m):
+    """
+    Two-sided p-value of a two-sample KS statistic.
+    
+    Uses the exact distribution while n * m < EXACT_MAX_PRODUCT and the
+    asymptotic Kolmogorov distribution for larger samples, with Stephens'
+    finite-sample correction of the scaling (about 3x closer to the exact
+    p-value than the plain sqrt(n * m / (n + m)) scaling).
+    
+    Args:
+        statistic: KS statistic
+        n: Reference sample size
+        m: Current sample size
+    
+    Returns:
+        float: p-value in [0, 1]
+    """
+    if n * m < EXACT_MAX_PRODUCT:
+        return ks_exact_sf(statistic, n, m)
+    en = math.sqrt(n * m / (n + m))
+    return float(_kolmogorov_sf((en + 0.12 + 0.11 / en) * statistic))
+
+
+def _ks_sorted_statistic(a, b):
+    """
+    Two-sample KS statistic of two sorted samples.
+    
+    Uses the compiled merge scan when numba is available and both samples
+    are NaN-free numbers (NaN sorts last, so only the final values need
+    checking); otherwise counts values <= x on both sides at every value
+    with searchsorted.
+    
+    Args:
+        a: Sorted sample (validated NumPy array)
+        b: Sorted sample (validated NumPy array)
+    
+    Returns:
+        float: Largest absolute difference between the two CDFs
+    """
+    if (NUMBA_AVAILABLE and a.dtype.kind in 'iuf' and b.dtype.kind in 'iuf'
+            and not (np.isnan(a[-1]) or np.isnan(b[-1]))):
+        return float(_ks_merge_statistic(a, b))
+    
+    # CDF gaps scaled by n * m stay integers: one subtraction pass, no
+    # divisions, and the statistic is rounded only once
+    n = len(a)
+    m = len(b)
+    merged = np.concatenate([a, b])
+    gap = np.searchsorted(a, merged, side='right') * m
+    gap -= np.searchsorted(b, merged, side='right') * n
+    return float(max(gap.max(), -gap.min()) / (n * m))
+
+
+def _sorted_quantiles(sorted_values, q):
+    """
+    Linear-interpolation quantiles of an already sorted array.
+    
+    Reads the two neighbouring order statistics of each quantile directly
+    (O(len(q)) work) and interpolates exactly as np.quantile's default
+    'linear' method does, so results are bit-identical to it. Sorting
+    first is cheaper than np.quantile's partitioning for several
+    quantiles, and the sorted data also gives bin counts directly.
+    
+    Args:
+        sorted_values: Non-empty array sorted along axis 0 (2-D arrays
+            hold one feature per column)
+        q: Quantiles in [0, 1]
+    
+    Returns:
+        np.ndarray: Quantile values, shape (len(q),) + sorted_values.shape[1:]
+            (NaN/NaT for features that hold any)
+    """
+    n = len(sorted_values)
+    virtual = (n - 1) * q
+    below = np.floor(virtual).astype(np.intp)
+    gamma = (virtual - below).reshape((-1,) + (1,) * (sorted_values.ndim - 1))
+    a = sorted_values[below]
+    b = sorted_values[np.minimum(below + 1, n - 1)]
+    
+    # Interpolate from the nearer neighbour, like np.quantile
+    diff = b - a
+    result = a + diff * gamma
+    np.subtract(b, diff * (1 - gamma), out=result, where=gamma >= 0.5)
+    
+    # NaN/NaT sorts last and makes every quantile undefined
+    if sorted_values.dtype.kind in ('f', 'm', 'M'):
+        last = sorted_values[-1]
+        result = np.where(np.isnan(last), last, result)
+    return result
+
+
+def _has_nan(sorted_values):
+    """Whether sorted data holds NaN/NaT (per column for 2-D data); NaN sorts last."""
+    if sorted_values.dtype.kind not in ('f', 'm', 'M'):
+        return np.zeros(sorted_values.shape[1:], dtype=bool)
+    return np.isnan(sorted_values[-1])
+
+
+class PSIBaseline:
+    """
+    Reference-side PSI state (bin edges and proportions), computed once.
+    
+    The reference dataset is fixed across monitoring windows, so its
+    binning only needs to be done once; each score() call then processes
+    the current window alone.
+    
+    Bins are equal-frequency: interior edges are reference quantiles, so
+    heavy-tailed features do not leave most bins empty. The outer bins are
+    open-ended and catch current values outside the reference range.
+    
+    Attributes:
+        n_bins: Number of bins (fewer than requested when reference
+            quantiles coincide, e.g. for discrete or constant data)
+        inner_edges: Interior bin edges (n_bins - 1 reference quantiles)
+        ref_props: Reference bin proportions (zeros replaced by epsilon)
+    """
+    
+    def __init__(self, reference, n_bins=10, _validated=False, _sorted=False):
+        """
+        Build the PSI baseline from reference data.
+        
+        Args:
+            reference: Reference data (baseline)
+            n_bins: Number of equal-frequency bins
+            _validated: Skip input conversion and checks (input already validated)
+            _sorted: Reference is already sorted (e.g. KSBaseline.sorted_ref)
+        
+        Raises:
+            ValueError: If reference is empty or not 1-D
+            TypeError: If reference is categorical/string data
+        """
+        if not _validated:
+            reference = np.atleast_1d(reference)
+            check_not_empty(reference, "reference")
+            check_numerical(reference, "PSI")
+            check_one_dimensional(reference, "PSI")
+        
+        # Quantile edges and reference bin counts are both read off the
+        # sorted reference, so after the sort the work is O(n_bins log n)
+        if not _sorted:
+            reference = np.sort(reference)
+        
+        # Create equal-frequency bins from reference quantiles; duplicate
+        # edges would only produce bins that are always empty, so drop them
+        edges = _sorted_quantiles(reference, np.linspace(0, 1, n_bins + 1)[1:-1])
+        self.inner_edges = np.unique(edges)
+        self.n_bins = len(self.inner_edges) + 1
+        
+        # Bin i holds inner_edges[i-1] <= v < inner_edges[i], so counts are
+        # differences of the number of values below consecutive edges. NaN
+        # makes the edges NaN; bin such data exactly like current data
+        if _has_nan(reference):
+            ref_counts = self.count(reference)
+        else:
+            below = np.searchsorted(reference, self.inner_edges, side='left')
+            ref_counts = np.diff(below, prepend=0, append=len(reference))
+        
+        # Reference proportions, with empty bins replaced by epsilon
+        ref_props = ref_counts / len(reference)
+        self.ref_props = np.where(ref_props == 0, 1e-10, ref_props)
+    
+    def _bin_indices(self, values):
+        # Bin i holds inner_edges[i-1] <= v < inner_edges[i]; values outside
+        # the reference range land in the first/last bin
+        return np.searchsorted(self.inner_edges, values, side='right')
+    
+    def score(self, current, _validated=False):
+        """
+        Calculate PSI of current data against the baseline.
+        
+        Args:
+            current: Current data to compare against reference
+            _validated: Skip input conversion and checks (input already validated)
+        
+        Returns:
+            float: PSI value (>= 0)
+        
+        Raises:
+            ValueError: If current is empty or not 1-D
+            TypeError: If current is categorical/string data
+        """
+        if not _validated:
+            current = np.atleast_1d(current)
+            check_not_empty(current, "current")
+            check_numerical(current, "PSI")
+            check_one_dimensional(current, "PSI")
+        
+        # Fused single-pass kernel when numba is available
+        if NUMBA_AVAILABLE:
+            return float(_psi_kernel(self.ref_props, current, self.inner_edges))
+        
+        return self.score_counts(self.count(current))
+    
+    def count(self, current):
+        """
+        Count current values per bin.
+        
+        Counts from several chunks of current data can be summed and passed
+        to score_counts, so large inputs never need to be held in memory.
+        
+        Args:
+            current: Current data chunk (validated NumPy array)
+        
+        Returns:
+            np.ndarray: Bin counts (int64, length n_bins)
+        """
+        if NUMBA_AVAILABLE:
+            return _bin_counts(current, self.inner_edges)
+        return np.bincount(self._bin_indices(current), minlength=self.n_bins)
+    
+    def score_counts(self, curr_counts):
+        """
+        Calculate PSI from accumulated current bin counts.
+        
+        Args:
+            curr_counts: Summed output of count()
+        
+        Returns:
+            float: PSI value (>= 0)
+        """
+        # Compiled reduction when numba is available
+        if NUMBA_AVAILABLE:
+            return float(_psi_from_counts(self.ref_props, curr_counts))
+        
+        if self.n_bins <= _PSI_SCALAR_MAX_BINS:
+            # Few bins: one fused pass with a single accumulator; each ufunc
+            # call below costs more than the arithmetic on ~10 values
+            counts = curr_counts.tolist()
+            total = sum(counts)
+            psi = 0.0
+            for count, p in zip(counts, self.ref_props.tolist()):
+                q = max(count / total, 1e-10)
+                psi += (q - p) * math.log(q / p)
+            return psi
+        
+        curr_props = curr_counts / curr_counts.sum()
+        curr_props = np.where(curr_props == 0, 1e-10, curr_props)
+        
+        psi = np.sum((curr_props - self.ref_props) * np.log(curr_props / self.ref_props))
+        
+        return float(psi)
+
+
+class KSBaseline:
+    """
+    Reference-side KS state (sorted reference), computed once.
+    
+    NaN/NaT in either sample makes the statistic and p-value NaN, as with
+    scipy.stats.ks_2samp.
+    
+    Attributes:
+        sorted_ref: Sorted copy of the reference data
+        unique: Distinct reference values, ascending
+        ref_at_or_below: Number of reference values <= each distinct value
+        has_nan: Whether the reference holds NaN/NaT
+    """
+    
+    def __init__(self, reference, _validated=False):
+        """
+        Build the KS baseline from reference data.
+        
+        Args:
+            reference: Reference data (baseline)
+            _validated: Skip input conversion and checks (input already validated)
+        
+        Raises:
+            ValueError: If reference is empty or not 1-D
+            TypeError: If reference is categorical/string data
+        """
+        if not _validated:
+            reference = np.atleast_1d(reference)
+            check_not_empty(reference, "reference")
+            check_numerical(reference, "KS test")
+            check_one_dimensional(reference, "KS test")
+        
+        self.sorted_ref = np.sort(reference)
+        
+        self.has_nan = bool(_has_nan(self.sorted_ref))
+        
+        # Distinct values and the cumulative count at each, read off the
+        # sorted array (the last occurrence of each value ends its run)
+        n = len(self.sorted_ref)
+        run_end = np.flatnonzero(self.sorted_ref[1:] != self.sorted_ref[:-1])
+        self.unique = self.sorted_ref[np.append(run_end, n - 1)]
+        self.ref_at_or_below = np.append(run_end + 1, n)
+    
+    def score(self, current, _validated=False):
+        """
+        Calculate the two-sample KS statistic of current data against the baseline.
+        
+        The reference is sorted once, at construction. With numba, or for
+        small inputs, the sorted current data is merged against it;
+        otherwise it is located with searchsorted (see count/score_counts). The
+        p-value is exact for small samples and asymptotic otherwise.
+        
+        Args:
+            current: Current data to compare against reference
+            _validated: Skip input conversion and checks (input already validated)
+        
+        Returns:
+            dict: {"statistic": float, "p_value": float}
+        
+        Raises:
+            ValueError: If current is empty or not 1-D
+            TypeError: If current is categorical/string data
+        """
+        if not _validated:
+            current = np.atleast_1d(current)
+            check_not_empty(current, "current")
+            check_numerical(current, "KS test")
+            check_one_dimensional(current, "KS test")
+        
+        if NUMBA_AVAILABLE or len(self.sorted_ref) + len(current) <= _KS_MERGE_MAX:
+            current = np.sort(current)
+            if self.has_nan or _has_nan(current):
+                return self._result(math.nan, len(current))
+            statistic = _ks_sorted_statistic(self.sorted_ref, current)
+            return self._result(statistic, len(current))
+        
+        # Count current values against the distinct reference values; no
+        # merged array of reference and current values is built
+        return self.score_counts(self.count(current))
+    
+    def _result(self, statistic, m):
+        # Result dict with the p-value for a statistic against m current values
+        if math.isnan(statistic):
+            return {"statistic": math.nan, "p_value": math.nan}
+        return {
+            "statistic": statistic,
+            "p_value": _ks_p_value(statistic, len(self.sorted_ref), m)
+        }
+    
+    def count(self, current):
+        """
+        Count current values around each distinct reference value.
+        
+        Counts from several chunks of current data can be summed and passed
+        to score_counts, so large inputs never need to be held in memory.
+        
+        Args:
+            current: Current data chunk (validated NumPy array)
+        
+        Returns:
+            np.ndarray: Shape (2, k + 2) int64 counts for the k distinct
+                reference values u; over the first k + 1 columns, cumulative
+                sums of row 0 give #(current < u), of row 1 #(current <= u).
+                The last column counts NaN/NaT values
+        """
+        # Searching sorted values walks the reference in order (cache friendly)
+        current = np.sort(current)
+        
+        # NaN/NaT sorts last; count it apart from values above the reference
+        n_nan = int(np.isnan(current).sum()) if _has_nan(current) else 0
+        current = current[:len(current) - n_nan]
+        
+        size = len(self.unique) + 1
+        return np.stack([
+            np.append(np.bincount(np.searchsorted(self.unique, current, side='right'),
+                                  minlength=size), n_nan),
+            np.append(np.bincount(np.searchsorted(self.unique, current, side='left'),
+                                  minlength=size), n_nan)
+        ])
+    
+    def score_counts(self, counts):
+        """
+        Calculate the KS statistic from accumulated current counts.
+        
+        Between consecutive distinct reference values the reference CDF is
+        constant, so the largest CDF gap lies at an interval end; the counts
+        give the current CDF at exactly those points. Gaps are scaled by
+        n * m and kept integer, as in the in-memory path, so both round the
+        statistic once and agree exactly.
+        
+        Args:
+            counts: Summed output of count()
+        
+        Returns:
+            dict: {"statistic": float, "p_value": float}
+        """
+        m = int(counts[0].sum())
+        if self.has_nan or counts[0, -1]:
+            return self._result(math.nan, m)
+        
+        n = len(self.sorted_ref)
+        ref_at_or_below = self.ref_at_or_below * m
+        below = np.cumsum(counts[0, :-1])[:-1] * n        # n * m * F_curr just below u_j
+        at_or_below = np.cumsum(counts[1, :-1])[:-1] * n  # n * m * F_curr at u_j
+        
+        gap = max(
+            below[0],
+            np.max(np.abs(ref_at_or_below - at_or_below)),
+            np.max(np.abs(ref_at_or_below[:-1] - below[1:]), initial=0)
+        )
+        
+        return self._result(float(gap / (n * m)), m)
+
+
+def reference_baseline(cls, reference, **kwargs):
+    """
+    Return the baseline for reference data, reusing one built earlier.
+    
+    Monitoring compares many windows against one frozen reference, so the
+    reference-side work (sorting, quantile edges, bin counts) is done once
+    per distinct reference. Entries are keyed by a digest of the full
+    array contents, so an array modified in place is never matched with a
+    stale baseline; hashing is several times cheaper than rebuilding. A
+    PSIBaseline built for a reference that already has a cached
+    KSBaseline reuses its sorted array instead of sorting again.
+    
+    Args:
+        cls: Baseline class (PSIBaseline or KSBaseline)
+        reference: Reference data (validated NumPy array)
+        **kwargs: Extra baseline constructor arguments (e.g. n_bins)
+    
+    Returns:
+        PSIBaseline or KSBaseline: Baseline for reference (treat as read-only)
+    """
+    reference = np.ascontiguousarray(reference)
+    content = (
+        reference.dtype.str, reference.shape, hashlib.sha1(reference.view(np.uint8)).digest()
+    )
+    key = (cls, tuple(sorted(kwargs.items()))) + content
+    
+    with _cache_lock:
+        baseline = _cache.pop(key, None)
+        if baseline is not None:
+            _cache[key] = baseline
+            return baseline
+        ks_baseline = _cache.get((KSBaseline, ()) + content)
+    
+    if cls is PSIBaseline and ks_baseline is not None:
+        # Share the sort with the KS baseline of the same reference
+        baseline = PSIBaseline(ks_baseline.sorted_ref, _validated=True, _sorted=True, **kwargs)
+    else:
+        baseline = cls(reference, _validated=True, **kwargs)
+    with _cache_lock:
+        _cache[key] = baseline
+        while len(_cache) > _CACHE_SIZE:
+            _cache.pop(next(iter(_cache)))
+    return baseline
+
+
+def clear_baseline_cache():
+    """
+    Clear baselines memoized by reference_baseline.
+    
+    Entries never go stale; this only releases their memory.
+    """
+    with _cache_lock:
+        _cache.clear()
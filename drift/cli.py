@@ -1,15 +1,507 @@
 # CLI runner for drift monitoring
+#
+# pandas, pyarrow and the pipeline (which pulls in scipy and numba) are
+# imported on first use, so argument errors, --help and missing files do
+# not pay for loading them.
 import argparse
+import csv
+import functools
+import glob
+import hashlib
 import json
+import os
+import re
 import sys
-import pandas as pd
-from drift.pipeline import run_drift_pipeline
 
+from drift._results import METRIC_NAMES
 
-def main():
+try:
+    import orjson
+    
+    def _dumps(obj):
+        return orjson.dumps(
+            obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_SORT_KEYS
+        ).decode()
+except ImportError:
+    def _json_default(obj):
+        # NumPy arrays and scalars, as orjson's OPT_SERIALIZE_NUMPY handles them
+        import numpy as np
+        if isinstance(obj, (np.ndarray, np.generic)):
+            return obj.tolist()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    
+    def _dumps(obj):
+        # Same compact, key-sorted layout as the orjson path
+        return json.dumps(obj, sort_keys=True, separators=(',', ':'), default=_json_default)
+
+_ARROW_NAMES = ("pa", "pacsv", "pq")
+
+
+@functools.lru_cache(maxsize=None)
+def _arrow():
+    """
+    Import pyarrow on first use.
+    
+    Returns:
+        tuple: (pyarrow, pyarrow.csv, pyarrow.parquet), or None when
+            pyarrow is not installed
+    """
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pacsv
+        from pyarrow import parquet as pq
+    except ImportError:
+        return None
+    return pa, pacsv, pq
+
+
+def __getattr__(name):
+    # Lazily resolved module attributes (PEP 562): pd and the pyarrow modules
+    if name == "pd":
+        import pandas as pd
+        return pd
+    if name in _ARROW_NAMES:
+        arrow = _arrow()
+        return None if arrow is None else arrow[_ARROW_NAMES.index(name)]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Metrics that require numerical input; their column is parsed as float64
+_NUMERICAL_METRICS = ("psi", "ks")
+
+
+def _header(path):
+    # Read only the header row
+    with open(path, newline='') as f:
+        return next(csv.reader(f))
+
+
+def _first_column(path):
+    # Name of the analysed column
+    return _header(path)[0]
+
+
+def _iter_chunks(path, chunksize, numerical=False):
+    """
+    Yield the first column of a CSV file as NumPy arrays of chunksize rows.
+    
+    Categorical columns are read as strings: inferring each chunk's type
+    separately would turn "1" into the integer 1 in all-digit chunks but
+    keep it a string elsewhere, splitting one category in two.
+    
+    Args:
+        path: Path to CSV file
+        chunksize: Number of rows per chunk
+        numerical: Parse the column directly as float64
+        
+    Yields:
+        np.ndarray: Column values for each chunk
+    """
+    import pandas as pd
+    
+    first_column = _first_column(path)
+    reader = pd.read_csv(
+        path,
+        usecols=[first_column],
+        engine='c',
+        dtype={first_column: 'float64' if numerical else str},
+        chunksize=chunksize
+    )
+    with reader:
+        for chunk in reader:
+            yield chunk[first_column].to_numpy()
+
+
+def _read_table(path, numerical=False):
+    # Parse the first column with pyarrow's multithreaded CSV reader
+    pa, pacsv, _ = _arrow()
+    first_column = _first_column(path)
+    column_types = {first_column: pa.float64()} if numerical else None
+    return pacsv.read_csv(
+        path,
+        read_options=pacsv.ReadOptions(use_threads=True),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=[first_column], column_types=column_types
+        )
+    )
+
+
+def _read_csv(path, numerical=False):
+    """
+    Load the first column of a CSV file into a DataFrame.
+    
+    The pipeline only analyses the first column, so the rest of the file is
+    not converted. Uses pyarrow's multithreaded parser when available and
+    falls back to pd.read_csv otherwise.
+    
+    Args:
+        path: Path to CSV file
+        numerical: Parse the column directly as float64 instead of
+            inferring its type (non-numeric values raise an error)
+        
+    Returns:
+        pd.DataFrame: Single-column DataFrame
+    """
+    if _arrow() is None:
+        import pandas as pd
+        first_column = _first_column(path)
+        return pd.read_csv(
+            path,
+            usecols=[first_column],
+            engine='c',
+            dtype={first_column: 'float64'} if numerical else None,
+            memory_map=True
+        )
+    
+    return _read_table(path, numerical).to_pandas(split_blocks=True, self_destruct=True)
+
+
+def _cache_key(path):
+    # Content hash of the file head plus its size and mtime; cheap to
+    # compute and changes whenever the file is rewritten
+    with open(path, 'rb') as f:
+        digest = hashlib.sha1(f.read(65536))
+    stat = os.stat(path)
+    digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return digest.hexdigest()[:12]
+
+
+def _load_table(path, numerical=False, cache=False):
+    # pyarrow Table for the first column, through the Parquet sidecar cache
+    pq = _arrow()[2]
+    if not cache:
+        return _read_table(path, numerical)
+    
+    # Numerical and categorical parses of one file are cached side by side
+    mode = "num" if numerical else "cat"
+    sidecar = f"{path}.{mode}.{_cache_key(path)}.parquet"
+    if os.path.exists(sidecar):
+        return pq.read_table(sidecar, memory_map=True)
+    
+    table = _read_table(path, numerical)
+    
+    # Replace this mode's stale sidecars with one for the current file
+    # contents; only names this function writes are matched
+    prefix = f"{path}.{mode}."
+    try:
+        for stale in glob.glob(glob.escape(prefix) + "*.parquet"):
+            if re.fullmatch(r"[0-9a-f]{12}\.parquet", stale[len(prefix):]):
+                os.remove(stale)
+        pq.write_table(table, sidecar, compression='zstd')
+    except OSError:
+        pass
+    
+    return table
+
+
+def _load_frame(path, numerical=False, cache=False):
+    """
+    Load a CSV file, optionally through a Parquet sidecar cache.
+    
+    With cache set, the first read parses the CSV and writes
+    ``<path>.<num|cat>.<hash>.parquet`` next to it; later reads of the
+    unchanged file in the same mode load the Parquet file instead.
+    Sidecars of that mode from older versions of the file are removed.
+    Caching needs pyarrow and is skipped when it is not installed or the
+    directory is not writable.
+    
+    Args:
+        path: Path to CSV file
+        numerical: Parse the column directly as float64
+        cache: Use and maintain the Parquet sidecar
+        
+    Returns:
+        pd.DataFrame: Single-column DataFrame
+    """
+    if _arrow() is None:
+        return _read_csv(path, numerical)
+    
+    return _load_table(path, numerical, cache).to_pandas()
+
+
+def _open_frame(path_or_buf, numerical=False, cache=False):
+    """
+    Load the first column of a CSV from a path, '-' (stdin) or a buffer.
+    
+    File-like objects (e.g. io.StringIO) and stdin are parsed directly with
+    pd.read_csv; paths go through _load_frame and its optional Parquet
+    sidecar cache.
+    
+    Args:
+        path_or_buf: Path to CSV file, '-' for stdin, or an object with read()
+        numerical: Parse the column directly as float64
+        cache: Use and maintain the Parquet sidecar (paths only)
+        
+    Returns:
+        pd.DataFrame: Single-column DataFrame
+    """
+    if path_or_buf == '-':
+        path_or_buf = sys.stdin.buffer
+    
+    if hasattr(path_or_buf, 'read'):
+        import pandas as pd
+        return pd.read_csv(
+            path_or_buf,
+            usecols=[0],
+            engine='c',
+            dtype='float64' if numerical else None
+        )
+    
+    return _load_frame(path_or_buf, numerical, cache)
+
+
+def _load_column(path_or_buf, numerical=False, cache=False):
+    """
+    Load the first column of a CSV as a NumPy array.
+    
+    With pyarrow the column goes straight from the Arrow table to NumPy
+    (zero-copy for a single float64 chunk without nulls), skipping
+    DataFrame construction. Buffers, stdin and installs without pyarrow
+    read through _open_frame.
+    
+    Args:
+        path_or_buf: Path to CSV file, '-' for stdin, or an object with read()
+        numerical: Parse the column directly as float64
+        cache: Use and maintain the Parquet sidecar (paths only)
+        
+    Returns:
+        np.ndarray: Column values
+    """
+    if _arrow() is None or path_or_buf == '-' or hasattr(path_or_buf, 'read'):
+        return _open_frame(path_or_buf, numerical, cache).iloc[:, 0].to_numpy()
+    
+    return _load_table(path_or_buf, numerical, cache).column(0).to_numpy()
+
+
+def _read_columns(path_or_buf, numerical=False):
+    """
+    Load every column of a CSV into a DataFrame (for --all-columns).
+    
+    Args:
+        path_or_buf: Path to CSV file, '-' for stdin, or an object with read()
+        numerical: Parse all columns directly as float64
+        
+    Returns:
+        pd.DataFrame: DataFrame with one column per feature
+    """
+    if path_or_buf == '-':
+        path_or_buf = sys.stdin.buffer
+    
+    arrow = _arrow()
+    if arrow is None or hasattr(path_or_buf, 'read'):
+        import pandas as pd
+        return pd.read_csv(path_or_buf, engine='c', dtype='float64' if numerical else None)
+    
+    pa, pacsv, _ = arrow
+    column_types = dict.fromkeys(_header(path_or_buf), pa.float64()) if numerical else None
+    table = pacsv.read_csv(
+        path_or_buf,
+        read_options=pacsv.ReadOptions(use_threads=True),
+        convert_options=pacsv.ConvertOptions(column_types=column_types)
+    )
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+class _ArgumentParser(argparse.ArgumentParser):
+    """ArgumentParser that raises ArgumentError for every usage error."""
+    
+    def error(self, message):
+        # exit_on_error=False does not cover missing required or unrecognized
+        # arguments, which call error() and would exit with status 2, the
+        # code main uses for "drift detected"
+        raise argparse.ArgumentError(None, message)
+
+
+def _build_parser():
+    # Built once at import; parse errors raise argparse.ArgumentError
+    # (mapped to exit code 1 by main) instead of exiting
+    parser = _ArgumentParser(description='Drift monitoring CLI', exit_on_error=False)
+    parser.add_argument('reference', help="Path to reference CSV file ('-' for stdin)")
+    parser.add_argument('current', help="Path to current CSV file ('-' for stdin)")
+    parser.add_argument('--metric', required=True, choices=METRIC_NAMES, help='Drift metric')
+    parser.add_argument('--threshold', type=float, required=True, help='Drift detection threshold')
+    parser.add_argument('--feature-type', default='numerical', choices=('numerical', 'categorical'),
+                        help='Feature type')
+    parser.add_argument('--chunksize', type=int, default=None,
+                        help='Stream CSV files in chunks of this many rows (e.g. 262144)')
+    parser.add_argument('--cache', action=argparse.BooleanOptionalAction, default=False,
+                        help='Cache parsed CSV files as Parquet sidecars next to them '
+                             '(requires pyarrow)')
+    parser.add_argument('--all-columns', action='store_true',
+                        help='Analyse every column instead of only the first')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker threads for --all-columns with ks or chi_square '
+                             '(default: executor default)')
+    parser.add_argument('--fail-fast', action='store_true',
+                        help='With --all-columns, stop at the first column that drifts')
+    return parser
+
+
+_PARSER = _build_parser()
+
+
+def parse_args(argv=None):
+    """
+    Parse command line arguments.
+    
+    Args:
+        argv: Argument list (defaults to sys.argv[1:])
+        
+    Returns:
+        argparse.Namespace: Parsed arguments
+        
+    Raises:
+        argparse.ArgumentError: If an argument value is invalid, or
+            --fail-fast is given without --all-columns
+    """
+    args = _PARSER.parse_args(argv)
+    if args.fail_fast and not args.all_columns:
+        _PARSER.error("--fail-fast requires --all-columns")
+    return args
+
+
+def load_inputs(args):
+    """
+    Load the reference and current data named by the parsed arguments.
+    
+    Args:
+        args: Parsed arguments (see parse_args)
+        
+    Returns:
+        tuple: (reference, current) NumPy arrays of the first column,
+            DataFrames of all columns when args.all_columns is set, or
+            iterators of NumPy chunks when args.chunksize is set
+        
+    Raises:
+        ValueError: If chunksize is not positive or is combined with
+            all_columns
+    """
+    numerical = args.metric in _NUMERICAL_METRICS
+    
+    if args.all_columns:
+        if args.chunksize is not None:
+            raise ValueError("chunksize cannot be combined with all_columns")
+        return (
+            _read_columns(args.reference, numerical),
+            _read_columns(args.current, numerical)
+        )
+    
+    if args.chunksize is not None:
+        # Stream both files; chunks are read lazily by run()
+        if args.chunksize <= 0:
+            raise ValueError("chunksize must be greater than 0")
+        return (
+            _iter_chunks(args.reference, args.chunksize, numerical),
+            _iter_chunks(args.current, args.chunksize, numerical)
+        )
+    
+    return (
+        _load_column(args.reference, numerical, args.cache),
+        _load_column(args.current, numerical, args.cache)
+    )
+
+
+def run(reference, current, args):
+    """
+    Run the drift pipeline on loaded data.
+    
+    Args:
+        reference: Reference data as returned by load_inputs
+        current: Current data as returned by load_inputs
+        args: Parsed arguments (see parse_args)
+        
+    Returns:
+        dict: Pipeline result
+    """
+    from drift.pipeline import (
+        run_drift_pipeline, run_drift_pipeline_chunked, run_drift_pipeline_columnar
+    )
+    
+    if args.all_columns:
+        # Same feature type and threshold for every column
+        columns = list(reference.columns)
+        if args.fail_fast:
+            return _first_drift(reference, current, columns, args)
+        return run_drift_pipeline_columnar(
+            reference,
+            current,
+            feature_types=dict.fromkeys(columns, args.feature_type),
+            metric=args.metric,
+            thresholds=dict.fromkeys(columns, args.threshold),
+            n_jobs=args.workers
+        )
+    
+    # Chunk iterators aggregate counts chunk by chunk
+    pipeline = run_drift_pipeline if args.chunksize is None else run_drift_pipeline_chunked
+    
+    return pipeline(
+        reference,
+        current,
+        feature_type=args.feature_type,
+        metric=args.metric,
+        threshold=args.threshold
+    )
+
+
+def _first_drift(reference, current, columns, args):
+    """
+    Score columns in order and stop at the first one that drifts.
+    
+    Returns:
+        dict: run_drift_pipeline_columnar layout, with the per-feature
+            entries truncated to the columns scored before stopping
+    """
+    from drift.pipeline import iter_feature_drift
+    
+    features = []
+    values = []
+    p_values = []
+    drift = []
+    alerts = []
+    for column, result in iter_feature_drift(
+        reference,
+        current,
+        feature_types=dict.fromkeys(columns, args.feature_type),
+        metric=args.metric,
+        thresholds=dict.fromkeys(columns, args.threshold)
+    ):
+        # PSI reports a bare value, the tests a statistic and p-value
+        metric_result = result["metrics"][args.metric]
+        if args.metric == "psi":
+            values.append(metric_result)
+        else:
+            values.append(metric_result["statistic"])
+            p_values.append(metric_result["p_value"])
+        features.append(column)
+        drift.append(result["drift_detected"])
+        alerts.extend(dict(alert, feature=column) for alert in result["alerts"])
+        if result["drift_detected"]:
+            break
+    
+    output = {
+        "drift_detected": any(drift),
+        "metric": args.metric,
+        "features": features,
+        "values": values,
+        "thresholds": [args.threshold] * len(features),
+        "drift": drift,
+        "alerts": alerts,
+        "window": {
+            "reference_size": len(reference),
+            "current_size": len(current)
+        }
+    }
+    if args.metric != "psi":
+        output["p_values"] = p_values
+    return output
+
+
+def main(argv=None):
     """
     Main CLI entry point for drift monitoring.
     
+    Args:
+        argv: Argument list (defaults to sys.argv[1:])
+    
     Returns:
         int: Exit code
             0 - No drift detected
@@ -17,31 +509,22 @@ def main():
             2 - Drift detected
     """
     try:
-        # Parse arguments
-        parser = argparse.ArgumentParser(description='Drift monitoring CLI')
-        parser.add_argument('reference', help='Path to reference CSV file')
-        parser.add_argument('current', help='Path to current CSV file')
-        parser.add_argument('--metric', required=True, help='Drift metric (psi, ks, chi_square)')
-        parser.add_argument('--threshold', type=float, required=True, help='Drift detection threshold')
-        parser.add_argument('--feature-type', default='numerical', help='Feature type (numerical, categorical)')
-        
-        args = parser.parse_args()
-        
-        # Load CSV files
-        reference_data = pd.read_csv(args.reference)
-        current_data = pd.read_csv(args.current)
-        
-        # Run drift pipeline
-        result = run_drift_pipeline(
-            reference_data,
-            current_data,
-            feature_type=args.feature_type,
-            metric=args.metric,
-            threshold=args.threshold
-        )
+        try:
+            args = parse_args(argv)
+        except argparse.ArgumentError as e:
+            sys.stderr.write(f"error: {e}\n")
+            return 1
+        
+        # Report missing files before any CSV or numeric library is loaded
+        for path in (args.reference, args.current):
+            if path != '-' and not os.path.isfile(path):
+                sys.stderr.write(f"error: file not found: {path}\n")
+                return 1
+        
+        result = run(*load_inputs(args), args)
         
         # Print JSON output
-        print(json.dumps(result))
+        sys.stdout.write(_dumps(result) + "\n")
         
         # Return appropriate exit code
         if result["drift_detected"]:
@@ -1,5 +1,58 @@
 # Configuration management for drift monitoring
 
+# Metrics the pipeline can compute
+_VALID_METRICS = frozenset({"psi", "ks", "chi_square"})
+
+# Marks a lookup-table entry that is absent (None is a valid configured value)
+_MISSING = object()
+
+
+class CompiledConfig:
+    """
+    Flat threshold lookup tables compiled from a configuration dictionary.
+    
+    Attributes:
+        _overrides: (metric, feature) -> feature-specific threshold
+        _defaults: metric -> default threshold
+        _metrics: Names of all configured metrics
+    """
+    __slots__ = ("_overrides", "_defaults", "_metrics")
+    
+    def __init__(self, overrides, defaults, metrics):
+        self._overrides = overrides
+        self._defaults = defaults
+        self._metrics = metrics
+
+
+def compile_config(config):
+    """
+    Compile a configuration dictionary for repeated threshold lookups.
+    
+    The result is a snapshot: later edits to the dictionary are not seen,
+    so compile again after changing it.
+    
+    Args:
+        config: Configuration dictionary
+    
+    Returns:
+        CompiledConfig: Lookup tables accepted by get_threshold
+    
+    Raises:
+        ValueError: If metrics configuration is missing
+    """
+    if "metrics" not in config:
+        raise ValueError("metrics configuration is required")
+    
+    overrides = {}
+    defaults = {}
+    for metric, metric_config in config["metrics"].items():
+        for feature, threshold in metric_config.get("feature_thresholds", {}).items():
+            overrides[(metric, feature)] = threshold
+        if "default_threshold" in metric_config:
+            defaults[metric] = metric_config["default_threshold"]
+    
+    return CompiledConfig(overrides, defaults, frozenset(config["metrics"]))
+
 
 def get_threshold(config, metric, feature):
     """
@@ -9,33 +62,65 @@ def get_threshold(config, metric, feature):
     1. Feature-specific override (if exists)
     2. Metric default threshold
     
+    Configuration dictionaries are read on every call, so in-place edits
+    are always picked up. For many lookups against a fixed configuration,
+    compile it once with compile_config and pass the CompiledConfig.
+    
     Args:
-        config: Configuration dictionary
+        config: Configuration dictionary or CompiledConfig
         metric: Metric name (e.g., "psi", "ks", "chi_square")
         feature: Feature name
-        
+    
     Returns:
         float: Resolved threshold value
-        
+    
     Raises:
-        ValueError: If metric is not configured or default_threshold is missing
+        ValueError: If metric is unsupported or not configured, or
+            default_threshold is missing
     """
-    # Validate metric exists in config
+    if isinstance(config, CompiledConfig):
+        return _compiled_threshold(config, metric, feature)
+    
     if "metrics" not in config:
         raise ValueError("metrics configuration is required")
     
+    # Validate metric exists in config
     if metric not in config["metrics"]:
-        raise ValueError(f"metric '{metric}' is not configured")
+        _raise_unconfigured(metric)
     
     metric_config = config["metrics"][metric]
     
     # Check for feature-specific override
-    if "feature_thresholds" in metric_config:
-        if feature in metric_config["feature_thresholds"]:
-            return metric_config["feature_thresholds"][feature]
+    feature_thresholds = metric_config.get("feature_thresholds", {})
+    if feature in feature_thresholds:
+        return feature_thresholds[feature]
     
     # Fall back to default threshold
     if "default_threshold" not in metric_config:
         raise ValueError(f"default_threshold is required for metric '{metric}'")
     
     return metric_config["default_threshold"]
+
+
+def _compiled_threshold(config, metric, feature):
+    # Same resolution as get_threshold, from the flat lookup tables; entries
+    # are matched by presence, so a configured None is returned as is
+    threshold = config._overrides.get((metric, feature), _MISSING)
+    if threshold is not _MISSING:
+        return threshold
+    
+    threshold = config._defaults.get(metric, _MISSING)
+    if threshold is not _MISSING:
+        return threshold
+    
+    if metric not in config._metrics:
+        _raise_unconfigured(metric)
+    
+    raise ValueError(f"default_threshold is required for metric '{metric}'")
+
+
+def _raise_unconfigured(metric):
+    # Unknown metric names and supported-but-missing metrics get distinct errors
+    if metric not in _VALID_METRICS:
+        raise ValueError(f"unsupported metric: {metric}")
+    raise ValueError(f"metric '{metric}' is not configured")
@@ -1,4 +1,62 @@
 # Drift detection logic
+import operator
+from typing import NamedTuple
+
+import numpy as np
+
+from drift._results import METRIC_NAMES, DriftResult
+
+
+# Metric -> (comparison against the threshold, result field it is applied to).
+# Chi-Square flags drift on a small p-value, the others on a large value.
+_CMP = {"psi": operator.gt, "ks": operator.gt, "chi_square": operator.lt}
+_FIELD = {"psi": "value", "ks": "statistic", "chi_square": "p_value"}
+
+
+class DetectorBatch(NamedTuple):
+    """
+    Detector results for many features, stored as parallel arrays.
+    
+    Attributes:
+        drift: Whether drift was detected (bool array)
+        value: PSI value or test statistic (float64 array)
+        threshold: Threshold used for detection (float64 array)
+        p_value: Test p-value, NaN for PSI (float64 array)
+        metric_code: Index into METRIC_NAMES (uint8 array)
+    """
+    drift: np.ndarray
+    value: np.ndarray
+    threshold: np.ndarray
+    p_value: np.ndarray
+    metric_code: np.ndarray
+
+
+def _detect(metric, threshold, **fields):
+    """
+    Shared implementation of the public detectors.
+    
+    Args:
+        metric: Metric name ("psi", "ks", or "chi_square")
+        threshold: Threshold for drift detection
+        **fields: Reported result fields, in output order; must include
+            _FIELD[metric]
+        
+    Returns:
+        dict: {"drift_detected", "metric", **fields, "threshold"}
+        
+    Raises:
+        ValueError: If threshold <= 0
+    """
+    # Validate threshold (also rejects NaN)
+    if not threshold > 0:
+        raise ValueError("threshold must be greater than 0")
+    
+    return {
+        "drift_detected": bool(_CMP[metric](fields[_FIELD[metric]], threshold)),
+        "metric": metric,
+        **fields,
+        "threshold": threshold
+    }
 
 
 def detect_psi_drift(psi_value, threshold):
@@ -19,19 +77,7 @@ def detect_psi_drift(psi_value, threshold):
     Raises:
         ValueError: If threshold <= 0
     """
-    # Validate threshold
-    if threshold <= 0:
-        raise ValueError("threshold must be greater than 0")
-    
-    # Determine drift
-    drift_detected = psi_value > threshold
-    
-    return {
-        "drift_detected": drift_detected,
-        "metric": "psi",
-        "value": psi_value,
-        "threshold": threshold
-    }
+    return _detect("psi", threshold, value=psi_value)
 
 
 def detect_ks_drift(statistic, p_value, threshold):
@@ -54,20 +100,8 @@ def detect_ks_drift(statistic, p_value, threshold):
     Raises:
         ValueError: If threshold <= 0
     """
-    # Validate threshold
-    if threshold <= 0:
-        raise ValueError("threshold must be greater than 0")
-    
-    # Determine drift (based on statistic, not p_value)
-    drift_detected = statistic > threshold
-    
-    return {
-        "drift_detected": drift_detected,
-        "metric": "ks",
-        "statistic": statistic,
-        "p_value": p_value,
-        "threshold": threshold
-    }
+    # Drift is based on statistic, not p_value
+    return _detect("ks", threshold, statistic=statistic, p_value=p_value)
 
 
 def detect_chi_square_drift(statistic, p_value, threshold):
@@ -90,18 +124,197 @@ def detect_chi_square_drift(statistic, p_value, threshold):
     Raises:
         ValueError: If threshold <= 0
     """
-    # Validate threshold
-    if threshold <= 0:
+    # Drift is based on p_value
+    return _detect("chi_square", threshold, statistic=statistic, p_value=p_value)
+
+
+def _detect_result(metric, value, threshold, p_value=None):
+    """
+    Detect drift for one metric result without building a dict.
+    
+    Same decision rules as the public detectors, which return dicts; the
+    pipeline uses this to avoid a dict per detection.
+    
+    Args:
+        metric: Metric name ("psi", "ks", or "chi_square")
+        value: PSI value or test statistic
+        threshold: Threshold for drift detection
+        p_value: Test p-value (None for PSI)
+        
+    Returns:
+        DriftResult: Detection result
+        
+    Raises:
+        ValueError: If threshold <= 0
+    """
+    if not threshold > 0:
         raise ValueError("threshold must be greater than 0")
     
-    # Determine drift (based on p_value)
-    drift_detected = p_value < threshold
+    primary = p_value if _FIELD[metric] == "p_value" else value
+    drift_detected = bool(_CMP[metric](primary, threshold))
     
+    return DriftResult(drift_detected, metric, value, threshold, p_value)
+
+
+def _batch_arrays(values, thresholds):
+    # Convert batch inputs to float64 arrays and validate thresholds (the
+    # scalar detectors' check, which also rejects NaN)
+    values = np.asarray(values, dtype=np.float64)
+    thresholds = np.broadcast_to(np.asarray(thresholds, dtype=np.float64), values.shape)
+    if not (thresholds > 0).all():
+        raise ValueError("threshold must be greater than 0")
+    return values, thresholds
+
+
+def _detect_psi_batch(psi_values, thresholds):
+    """
+    Detect drift for many PSI values at once.
+    
+    Args:
+        psi_values: PSI metric values (array-like)
+        thresholds: Thresholds (array-like, or a scalar applied to all)
+    
+    Returns:
+        DetectorBatch: Drift where psi_value > threshold
+    
+    Raises:
+        ValueError: If any threshold <= 0
+    """
+    values, thresholds = _batch_arrays(psi_values, thresholds)
+    return DetectorBatch(
+        drift=values > thresholds,
+        value=values,
+        threshold=thresholds,
+        p_value=np.full(values.shape, np.nan),
+        metric_code=np.full(values.shape, METRIC_NAMES.index("psi"), dtype=np.uint8)
+    )
+
+
+def _detect_ks_batch(statistics, p_values, thresholds):
+    """
+    Detect drift for many KS results at once.
+    
+    Args:
+        statistics: KS test statistics (array-like)
+        p_values: KS test p-values (array-like)
+        thresholds: Thresholds (array-like, or a scalar applied to all)
+    
+    Returns:
+        DetectorBatch: Drift where statistic > threshold
+    
+    Raises:
+        ValueError: If any threshold <= 0
+    """
+    values, thresholds = _batch_arrays(statistics, thresholds)
+    return DetectorBatch(
+        drift=values > thresholds,
+        value=values,
+        threshold=thresholds,
+        p_value=np.asarray(p_values, dtype=np.float64),
+        metric_code=np.full(values.shape, METRIC_NAMES.index("ks"), dtype=np.uint8)
+    )
+
+
+def _detect_chi_square_batch(statistics, p_values, thresholds):
+    """
+    Detect drift for many Chi-Square results at once.
+    
+    Args:
+        statistics: Chi-Square test statistics (array-like)
+        p_values: Chi-Square test p-values (array-like)
+        thresholds: Thresholds (array-like, or a scalar applied to all)
+    
+    Returns:
+        DetectorBatch: Drift where p_value < threshold
+    
+    Raises:
+        ValueError: If any threshold <= 0
+    """
+    values, thresholds = _batch_arrays(statistics, thresholds)
+    p_values = np.asarray(p_values, dtype=np.float64)
+    return DetectorBatch(
+        drift=p_values < thresholds,
+        value=values,
+        threshold=thresholds,
+        p_value=p_values,
+        metric_code=np.full(values.shape, METRIC_NAMES.index("chi_square"), dtype=np.uint8)
+    )
+
+
+def detect_psi_drift_batch(psi_values, thresholds):
+    """
+    Detect PSI drift for many features with one vectorized comparison.
+    
+    Args:
+        psi_values: PSI metric values (array-like)
+        thresholds: Thresholds (array-like, or a scalar applied to all)
+        
+    Returns:
+        dict: Same keys as detect_psi_drift, with arrays as values:
+            - drift_detected (np.ndarray[bool]): psi_values > thresholds
+            - metric (str): "psi"
+            - value (np.ndarray): PSI values
+            - threshold (np.ndarray): Thresholds
+            
+    Raises:
+        ValueError: If any threshold <= 0
+    """
+    batch = _detect_psi_batch(psi_values, thresholds)
     return {
-        "drift_detected": drift_detected,
-        "metric": "chi_square",
-        "statistic": statistic,
-        "p_value": p_value,
-        "threshold": threshold
+        "drift_detected": batch.drift,
+        "metric": "psi",
+        "value": batch.value,
+        "threshold": batch.threshold
     }
 
+
+def detect_ks_drift_batch(statistics, p_values, thresholds):
+    """
+    Detect KS drift for many features with one vectorized comparison.
+    
+    Args:
+        statistics: KS test statistics (array-like)
+        p_values: KS test p-values (array-like)
+        thresholds: Thresholds (array-like, or a scalar applied to all)
+        
+    Returns:
+        dict: Same keys as detect_ks_drift, with arrays as values;
+            drift_detected is statistics > thresholds
+            
+    Raises:
+        ValueError: If any threshold <= 0
+    """
+    batch = _detect_ks_batch(statistics, p_values, thresholds)
+    return {
+        "drift_detected": batch.drift,
+        "metric": "ks",
+        "statistic": batch.value,
+        "p_value": batch.p_value,
+        "threshold": batch.threshold
+    }
+
+
+def detect_chi_square_drift_batch(statistics, p_values, thresholds):
+    """
+    Detect Chi-Square drift for many features with one vectorized comparison.
+    
+    Args:
+        statistics: Chi-Square test statistics (array-like)
+        p_values: Chi-Square test p-values (array-like)
+        thresholds: Thresholds (array-like, or a scalar applied to all)
+        
+    Returns:
+        dict: Same keys as detect_chi_square_drift, with arrays as values;
+            drift_detected is p_values < thresholds
+            
+    Raises:
+        ValueError: If any threshold <= 0
+    """
+    batch = _detect_chi_square_batch(statistics, p_values, thresholds)
+    return {
+        "drift_detected": batch.drift,
+        "metric": "chi_square",
+        "statistic": batch.value,
+        "p_value": batch.p_value,
+        "threshold": batch.threshold
+    }
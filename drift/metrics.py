@@ -1,113 +1,185 @@
 # Drift metrics implementation
+import math
+
 import numpy as np
-from scipy import stats
+import pandas as pd
+from scipy.special import chdtrc
+
+from drift._cat_kernels import factorize_strings
+from drift._kernels import NUMBA_AVAILABLE, _psi_batch
+from drift.baselines import (
+    KSBaseline, PSIBaseline, _has_nan, _sorted_quantiles, reference_baseline
+)
+from drift._validate import (
+    check_categorical, check_not_empty, check_numerical, check_one_dimensional
+)
+
+# Category count up to which the chi-square test runs as one scalar pass
+_CHI_SCALAR_MAX_CATEGORIES = 20
 
 
-def calculate_psi(reference, current):
+def calculate_psi(reference, current, _validated=False):
     """
     Calculate Population Stability Index (PSI) for numerical features.
     
     Args:
         reference: Reference data (baseline)
         current: Current data to compare against reference
+        _validated: Skip input conversion and checks (inputs already
+            validated, e.g. by the pipeline)
         
     Returns:
         float: PSI value (>= 0)
         
     Raises:
-        ValueError: If inputs are empty
+        ValueError: If inputs are empty or not 1-D
         TypeError: If inputs are categorical/string data
     """
-    # Convert to numpy arrays
-    reference = np.asarray(reference)
-    current = np.asarray(current)
-    
-    # Validate non-empty
-    if len(reference) == 0:
-        raise ValueError("reference data cannot be empty")
-    if len(current) == 0:
-        raise ValueError("current data cannot be empty")
+    if not _validated:
+        reference = np.atleast_1d(reference)
+        current = np.atleast_1d(current)
+        check_not_empty(reference, "reference")
+        check_not_empty(current, "current")
+        check_numerical(reference, "PSI")
+        check_one_dimensional(reference, "PSI")
+        check_numerical(current, "PSI")
+        check_one_dimensional(current, "PSI")
     
-    # Validate numerical data (reject categorical)
-    if reference.dtype.kind in ('U', 'S', 'O'):  # Unicode, byte string, or object
-        raise TypeError("PSI requires numerical data, not categorical")
-    if current.dtype.kind in ('U', 'S', 'O'):
-        raise TypeError("PSI requires numerical data, not categorical")
+    # Reference binning is cached across calls with the same reference
+    return reference_baseline(PSIBaseline, reference).score(current, _validated=True)
+
+
+def calculate_psi_batch(reference, current, n_bins=10, _validated=False):
+    """
+    Calculate PSI for every column of two 2-D arrays at once.
     
-    # Use fixed number of bins for deterministic behavior
-    n_bins = 10
+    The reference is sorted column-wise once; quantile edges and reference
+    bin counts are read off the sorted columns. Binning of the current
+    data and the PSI reduction run in a parallel compiled loop over
+    features with numba, otherwise vectorized across features, so the
+    Python overhead does not grow with the number of columns. Results match calculate_psi
+    applied to each column: duplicate quantile edges only create bins that
+    are empty on both sides, which contribute exactly zero.
     
-    # Create bins based on reference data
-    bins = np.linspace(reference.min(), reference.max(), n_bins + 1)
-    bins[0] = -np.inf  # Extend first bin to catch all values
-    bins[-1] = np.inf  # Extend last bin to catch all values
+    Args:
+        reference: Reference data, shape (n_rows, n_features)
+        current: Current data, shape (m_rows, n_features)
+        n_bins: Number of equal-frequency bins per feature
+        _validated: Skip input conversion and checks (inputs already
+            validated, e.g. by the pipeline)
+        
+    Returns:
+        np.ndarray: PSI value of each feature
+        
+    Raises:
+        ValueError: If inputs are empty or have different numbers of columns
+        TypeError: If inputs are categorical/string data
+    """
+    if not _validated:
+        reference = np.asarray(reference)
+        current = np.asarray(current)
+        check_not_empty(reference, "reference")
+        check_not_empty(current, "current")
+        check_numerical(reference, "PSI")
+        check_numerical(current, "PSI")
+        if reference.ndim != 2 or current.ndim != 2 or reference.shape[1] != current.shape[1]:
+            raise ValueError("reference and current must be 2-D with the same number of columns")
     
-    # Calculate histograms
-    ref_counts, _ = np.histogram(reference, bins=bins)
-    curr_counts, _ = np.histogram(current, bins=bins)
+    # Interior quantile edges of every feature, shape (n_bins - 1, n_features);
+    # one column-wise sort is cheaper than partitioning for every quantile
+    sorted_ref = np.sort(reference, axis=0)
+    inner_edges = _sorted_quantiles(sorted_ref, np.linspace(0, 1, n_bins + 1)[1:-1])
     
-    # Convert to proportions
+    # Reference counts are differences of the number of values below each
+    # edge; features with NaN (and so NaN edges) are binned like current data
+    below = np.stack([
+        np.searchsorted(sorted_ref[:, j], inner_edges[:, j], side='left')
+        for j in range(sorted_ref.shape[1])
+    ])
+    ref_counts = np.diff(below, axis=1, prepend=0, append=len(reference))
+    nan_features = np.flatnonzero(_has_nan(sorted_ref))
+    if len(nan_features):
+        ref_counts[nan_features] = _bin_counts_2d(
+            reference[:, nan_features], inner_edges[:, nan_features]
+        )
     ref_props = ref_counts / len(reference)
-    curr_props = curr_counts / len(current)
+    ref_props = np.where(ref_props == 0, 1e-10, ref_props)
     
-    # Avoid division by zero - add small epsilon
-    epsilon = 1e-10
-    ref_props = np.where(ref_props == 0, epsilon, ref_props)
-    curr_props = np.where(curr_props == 0, epsilon, curr_props)
+    if NUMBA_AVAILABLE:
+        # One feature per thread; column-major current keeps features contiguous
+        return _psi_batch(
+            ref_props, np.asfortranarray(current), np.ascontiguousarray(inner_edges.T)
+        )
     
-    # Calculate PSI
-    psi = np.sum((curr_props - ref_props) * np.log(curr_props / ref_props))
+    curr_props = _bin_counts_2d(current, inner_edges) / len(current)
+    curr_props = np.where(curr_props == 0, 1e-10, curr_props)
     
-    return float(psi)
+    return np.sum((curr_props - ref_props) * np.log(curr_props / ref_props), axis=1)
 
 
-def calculate_ks(reference, current):
+def _bin_counts_2d(values, inner_edges):
+    """Count each column of values into its own bins; returns shape (n_features, n_bins)."""
+    # Bin index = number of edges <= v (searchsorted side='right'). As in
+    # searchsorted, NaN sorts above every number: NaN values land in the
+    # last bin, and a NaN edge (reference with NaN) is above all numbers
+    index = np.zeros(values.shape, dtype=np.intp)
+    value_nan = None
+    for edge in inner_edges:
+        below = values < edge
+        edge_nan = np.isnan(edge)
+        if edge_nan.any():
+            if value_nan is None:
+                value_nan = np.isnan(values)
+            below |= edge_nan & ~value_nan
+        index += ~below
+    
+    # Offset each column into its own block of bins and count in one pass
+    n_features = values.shape[1]
+    n_bins = len(inner_edges) + 1
+    index += np.arange(n_features) * n_bins
+    return np.bincount(index.ravel(), minlength=n_features * n_bins).reshape(n_features, n_bins)
+
+
+def calculate_ks(reference, current, _validated=False):
     """
     Calculate Kolmogorov-Smirnov test statistic for numerical features.
     
     Args:
         reference: Reference data (baseline)
         current: Current data to compare against reference
+        _validated: Skip input conversion and checks (inputs already
+            validated, e.g. by the pipeline)
         
     Returns:
         dict: {"statistic": float, "p_value": float}
         
     Raises:
-        ValueError: If inputs are empty
+        ValueError: If inputs are empty or not 1-D
         TypeError: If inputs are categorical/string data
     """
-    # Convert to numpy arrays
-    reference = np.asarray(reference)
-    current = np.asarray(current)
+    if not _validated:
+        reference = np.atleast_1d(reference)
+        current = np.atleast_1d(current)
+        check_not_empty(reference, "reference")
+        check_not_empty(current, "current")
+        check_numerical(reference, "KS test")
+        check_one_dimensional(reference, "KS test")
+        check_numerical(current, "KS test")
+        check_one_dimensional(current, "KS test")
     
-    # Validate non-empty
-    if len(reference) == 0:
-        raise ValueError("reference data cannot be empty")
-    if len(current) == 0:
-        raise ValueError("current data cannot be empty")
-    
-    # Validate numerical data (reject categorical)
-    if reference.dtype.kind in ('U', 'S', 'O'):
-        raise TypeError("KS test requires numerical data, not categorical")
-    if current.dtype.kind in ('U', 'S', 'O'):
-        raise TypeError("KS test requires numerical data, not categorical")
-    
-    # Perform KS test
-    statistic, p_value = stats.ks_2samp(reference, current)
-    
-    return {
-        "statistic": float(statistic),
-        "p_value": float(p_value)
-    }
+    # Sorted reference is cached across calls with the same reference
+    return reference_baseline(KSBaseline, reference).score(current, _validated=True)
 
 
-def calculate_chi_square(reference, current):
+def calculate_chi_square(reference, current, _validated=False):
     """
     Calculate Chi-Square test statistic for categorical features.
     
     Args:
         reference: Reference data (baseline) - categorical
         current: Current data to compare against reference - categorical
+        _validated: Skip input conversion and checks (inputs already
+            validated, e.g. by the pipeline)
         
     Returns:
         dict: {"statistic": float, "p_value": float}
@@ -116,38 +188,208 @@ def calculate_chi_square(reference, current):
         ValueError: If inputs are empty
         TypeError: If inputs are continuous numerical data
     """
-    # Convert to numpy arrays
-    reference = np.asarray(reference)
-    current = np.asarray(current)
+    if not _validated:
+        reference = np.atleast_1d(reference)
+        current = np.atleast_1d(current)
+        check_not_empty(reference, "reference")
+        check_not_empty(current, "current")
+        
+        # Reject continuous (floating point) data
+        check_categorical(reference, "Chi-Square test")
+        check_categorical(current, "Chi-Square test")
+    
+    counts = _packed_string_counts(reference, current)
+    if counts is not None:
+        ref_counts, curr_counts = counts
+    elif reference.dtype.kind in ('U', 'S', 'O') or current.dtype.kind in ('U', 'S', 'O'):
+        # String/object categories: factorize both arrays together into
+        # shared integer codes, then count with bincount on a compact buffer
+        combined = np.concatenate([reference, current])
+        factorized = None
+        if NUMBA_AVAILABLE and combined.dtype.kind in ('U', 'S'):
+            factorized = factorize_strings(combined)
+        if factorized is None:
+            codes, uniques = pd.factorize(combined, sort=False, use_na_sentinel=False)
+            factorized = codes, len(uniques)
+        codes, n_categories = factorized
+        if n_categories < 65536:
+            codes = codes.astype(np.uint16)
+        ref_counts = np.bincount(codes[:len(reference)], minlength=n_categories)
+        curr_counts = np.bincount(codes[len(reference):], minlength=n_categories)
+    else:
+        counts = _dense_int_counts(reference, current)
+        if counts is None:
+            counts = _sorted_counts(reference, current)
+        ref_counts, curr_counts = counts
+    
+    return _chi_square_from_counts(ref_counts, curr_counts)
+
+
+def _sorted_counts(reference, current):
+    """Count categories of each array and align them on the sorted union."""
+    # Count occurrences in each dataset (single pass per array)
+    ref_cats, ref_c = np.unique(reference, return_counts=True)
+    curr_cats, curr_c = np.unique(current, return_counts=True)
+    
+    # Align counts onto the union of categories from both datasets
+    all_categories = np.union1d(ref_cats, curr_cats)
+    ref_counts = np.zeros(len(all_categories), dtype=np.int64)
+    curr_counts = np.zeros(len(all_categories), dtype=np.int64)
+    ref_counts[np.searchsorted(all_categories, ref_cats)] = ref_c
+    curr_counts[np.searchsorted(all_categories, curr_cats)] = curr_c
+    
+    return ref_counts, curr_counts
+
+
+def _packed_string_counts(reference, current):
+    """
+    Count short fixed-width strings by reinterpreting them as integers.
+    
+    Strings of up to 8 bytes (e.g. '<U2', 'S8') are null-padded to 1, 2,
+    4 or 8 bytes and viewed as unsigned integers, so equal strings map to
+    equal integers and categories are counted with an integer sort instead
+    of hashing Python string objects.
+    
+    Args:
+        reference: Reference NumPy array
+        current: Current NumPy array
+        
+    Returns:
+        tuple | None: (ref_counts, curr_counts), or None if the inputs are
+            not fixed-width strings of one kind and at most 8 bytes
+    """
+    kind = reference.dtype.kind
+    if kind not in ('U', 'S') or current.dtype.kind != kind:
+        return None
     
-    # Validate non-empty
-    if len(reference) == 0:
-        raise ValueError("reference data cannot be empty")
-    if len(current) == 0:
-        raise ValueError("current data cannot be empty")
+    itemsize = max(reference.dtype.itemsize, current.dtype.itemsize)
+    if itemsize > 8:
+        return None
     
-    # Validate categorical data (reject continuous numerical)
-    # Check if data is floating point (continuous)
-    if reference.dtype.kind == 'f':
-        raise TypeError("Chi-Square test requires categorical data, not continuous numerical")
-    if current.dtype.kind == 'f':
-        raise TypeError("Chi-Square test requires categorical data, not continuous numerical")
+    # Padding with nulls does not change string equality
+    width = 1 << (itemsize - 1).bit_length()
+    dtype = np.dtype(f"U{width // 4}" if kind == 'U' else f"S{width}")
+    packed = np.dtype(f"u{width}")
+    return _sorted_counts(
+        reference.astype(dtype, copy=False).view(packed),
+        current.astype(dtype, copy=False).view(packed)
+    )
+
+
+def _dense_int_counts(reference, current):
+    """
+    Count integer categories directly by value when their range is compact.
     
-    # Get unique categories from both datasets
-    all_categories = np.unique(np.concatenate([reference, current]))
+    Integer (or boolean) codes spanning a small range are counted with one
+    bincount per array (no sorting); categories absent from both arrays
+    produce zero columns, which _chi_square_from_counts drops.
     
-    # Count occurrences in each dataset
-    ref_counts = np.array([np.sum(reference == cat) for cat in all_categories])
-    curr_counts = np.array([np.sum(current == cat) for cat in all_categories])
+    Args:
+        reference: Reference NumPy array
+        current: Current NumPy array
+        
+    Returns:
+        tuple | None: (ref_counts, curr_counts), or None if the data is not
+            integer or its value range is too wide to count densely
+    """
+    if reference.dtype.kind not in ('b', 'i', 'u') or current.dtype.kind not in ('b', 'i', 'u'):
+        return None
     
-    # Create contingency table
-    contingency_table = np.array([ref_counts, curr_counts])
+    lo = min(int(reference.min()), int(current.min()))
+    hi = max(int(reference.max()), int(current.max()))
+    span = hi - lo + 1
+    if span > max(len(reference) + len(current), 65536) or hi > np.iinfo(np.int64).max:
+        return None
     
-    # Perform chi-square test
-    chi2, p_value, _, _ = stats.chi2_contingency(contingency_table)
+    # Offsets are computed in int64 so narrow integer types cannot overflow
+    return (
+        np.bincount(reference.astype(np.int64, copy=False) - lo, minlength=span),
+        np.bincount(current.astype(np.int64, copy=False) - lo, minlength=span)
+    )
+
+
+def _chi_square_from_counts(ref_counts, curr_counts):
+    """
+    Chi-Square test on per-category counts aligned across both datasets.
+    
+    Args:
+        ref_counts: Reference count per category (int array)
+        curr_counts: Current count per category, same category order
+        
+    Returns:
+        dict: {"statistic": float, "p_value": float}
+    """
+    if len(ref_counts) <= _CHI_SCALAR_MAX_CATEGORIES:
+        return _chi_square_scalar(ref_counts.tolist(), curr_counts.tolist())
+    
+    # Expected frequencies of the 2 x k contingency table; categories with
+    # no observations in either dataset carry no information
+    col_tot = ref_counts + curr_counts
+    mask = col_tot > 0
+    observed = np.array([ref_counts[mask], curr_counts[mask]], dtype=np.float64)
+    col_tot = col_tot[mask]
+    row_tot = observed.sum(axis=1, keepdims=True)
+    expected = row_tot * col_tot / col_tot.sum()
+    
+    dof = len(col_tot) - 1
+    if dof == 0:
+        # A single category cannot differ between datasets
+        return {"statistic": 0.0, "p_value": 1.0}
+    
+    if dof == 1:
+        # Yates' continuity correction for 2 x 2 tables (as chi2_contingency)
+        diff = expected - observed
+        observed = observed + np.sign(diff) * np.minimum(0.5, np.abs(diff))
+    
+    # Pearson statistic and upper-tail chi-square probability; chdtrc is the
+    # C ufunc behind chi2.sf (gammaincc(dof / 2, chi2 / 2)) without the
+    # frozen-distribution overhead
+    chi2 = float(np.sum((observed - expected) ** 2 / expected))
+    p_value = float(chdtrc(dof, chi2))
     
     return {
-        "statistic": float(chi2),
-        "p_value": float(p_value)
+        "statistic": chi2,
+        "p_value": p_value
     }
 
+
+def _chi_square_scalar(ref_counts, curr_counts):
+    """
+    Chi-Square test on short per-category count lists.
+    
+    Same test as _chi_square_from_counts in one pass of float arithmetic;
+    with a handful of categories each NumPy call costs more than the
+    arithmetic itself.
+    
+    Args:
+        ref_counts: Reference count per category (list of int)
+        curr_counts: Current count per category, same category order
+        
+    Returns:
+        dict: {"statistic": float, "p_value": float}
+    """
+    columns = [(r, c) for r, c in zip(ref_counts, curr_counts) if r + c > 0]
+    dof = len(columns) - 1
+    if dof == 0:
+        return {"statistic": 0.0, "p_value": 1.0}
+    
+    ref_total = float(sum(r for r, _ in columns))
+    curr_total = float(sum(c for _, c in columns))
+    total = ref_total + curr_total
+    
+    # Rows of the 2 x k table in the same order as the NumPy version
+    chi2 = 0.0
+    for row, row_total in ((0, ref_total), (1, curr_total)):
+        for column in columns:
+            observed = column[row]
+            expected = row_total * (column[0] + column[1]) / total
+            if dof == 1:
+                # Yates' continuity correction for 2 x 2 tables
+                diff = expected - observed
+                observed += math.copysign(min(0.5, abs(diff)), diff)
+            chi2 += (observed - expected) ** 2 / expected
+    
+    return {
+        "statistic": chi2,
+        "p_value": float(chdtrc(dof, chi2))
+    }
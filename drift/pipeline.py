@@ -1,7 +1,160 @@
 # Main drift detection pipeline
-from drift.metrics import calculate_psi, calculate_ks, calculate_chi_square
-from drift.detectors import detect_psi_drift, detect_ks_drift, detect_chi_square_drift
-from drift.alerts import generate_alert
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from drift.baselines import KSBaseline, PSIBaseline
+from drift.metrics import (
+    calculate_psi, calculate_psi_batch, calculate_ks, calculate_chi_square, _chi_square_from_counts
+)
+from drift.detectors import (
+    _detect_result, _detect_psi_batch, _detect_ks_batch, _detect_chi_square_batch
+)
+from drift.alerts import generate_alert, generate_alerts_from_batch
+from drift._validate import check_kind, check_not_empty, validate_inputs, validate_options
+
+
+def _psi_fields(metric_result):
+    # PSI results are the bare value, without a p-value
+    return metric_result, None
+
+
+def _test_fields(metric_result):
+    # Hypothesis tests report a statistic and a p-value
+    return metric_result["statistic"], metric_result["p_value"]
+
+
+def _detect_psi_fields(values, p_values, thresholds):
+    # PSI batch detection ignores the (absent) p-values
+    return _detect_psi_batch(values, thresholds)
+
+
+# Metric name -> (metric function, input dtype, result -> (value, p_value),
+# batch detector taking (values, p_values, thresholds)).
+# Numerical metrics get a float64 buffer; categorical data keeps its own dtype.
+_DISPATCH = {
+    "psi": (calculate_psi, np.float64, _psi_fields, _detect_psi_fields),
+    "ks": (calculate_ks, np.float64, _test_fields, _detect_ks_batch),
+    "chi_square": (calculate_chi_square, None, _test_fields, _detect_chi_square_batch),
+}
+
+
+def _first_column(data):
+    # First column of a DataFrame; 1-D arrays already are the column.
+    # A single-column frame is read through one to_numpy view, which skips
+    # building an intermediate Series
+    if isinstance(data, np.ndarray):
+        return data
+    if data.shape[1] == 1:
+        return data.to_numpy(copy=False)[:, 0]
+    return data.iloc[:, 0].to_numpy()
+
+
+def _column_values(data, column):
+    # One named column as a NumPy array, so the metric path never converts
+    # a Series itself; a view of the frame's block for NumPy dtypes
+    return data[column].to_numpy()
+
+
+def _frame_values(data, columns):
+    # Columns of a DataFrame as one column-major float64 array, converted in
+    # a single call instead of column by column (a view for float frames)
+    if list(data.columns) != columns:
+        data = data[columns]
+    return np.asfortranarray(data.to_numpy(dtype=np.float64))
+
+
+def _detect_batch(metric, metric_results, thresholds):
+    """Run the batch detector for metric over a list of metric results."""
+    _, _, fields, detect = _DISPATCH[metric]
+    pairs = [fields(r) for r in metric_results]
+    return detect([v for v, _ in pairs], [p for _, p in pairs], thresholds)
+
+
+def _score_feature(reference, current, feature_type, metric, threshold):
+    """
+    Validate a single feature column and compute its drift metric.
+    
+    Args:
+        reference: Reference column (pandas Series or 1-D array)
+        current: Current column (pandas Series or 1-D array)
+        feature_type: Type of feature ("numerical" or "categorical")
+        metric: Drift metric to use ("psi", "ks", or "chi_square")
+        threshold: Threshold for drift detection
+    
+    Returns:
+        Metric result (float for PSI, dict for KS/Chi-Square)
+    """
+    # Validate metric
+    try:
+        calc, dtype, _, _ = _DISPATCH[metric]
+    except KeyError:
+        raise ValueError(f"unsupported metric: {metric}") from None
+    
+    # Validate the raw column once, so non-numeric data raises TypeError
+    # before any conversion; the metric functions then skip their checks
+    ref_values = np.asarray(reference)
+    curr_values = np.asarray(current)
+    validate_inputs(ref_values, curr_values, metric, threshold, feature_type)
+    
+    # Numerical metrics work on a contiguous float64 buffer
+    if dtype is not None:
+        ref_values = ref_values.astype(dtype, copy=False)
+        curr_values = curr_values.astype(dtype, copy=False)
+    
+    return calc(ref_values, curr_values, _validated=True)
+
+
+def _run_feature(reference, current, feature_type, metric, threshold):
+    """
+    Run metric, detector and alert generation for a single feature column.
+    
+    Args:
+        reference: Reference column (pandas Series or 1-D array)
+        current: Current column (pandas Series or 1-D array)
+        feature_type: Type of feature ("numerical" or "categorical")
+        metric: Drift metric to use ("psi", "ks", or "chi_square")
+        threshold: Threshold for drift detection
+        
+    Returns:
+        dict: Dictionary containing drift_detected, alerts and metrics
+    """
+    metric_result = _score_feature(reference, current, feature_type, metric, threshold)
+    return _feature_result(metric, metric_result, threshold)
+
+
+def _feature_result(metric, metric_result, threshold, window=None):
+    """
+    Run the detector and alert generation on a computed metric result.
+    
+    The window, when given, is included in the result (see _make_result).
+    """
+    value, p_value = _DISPATCH[metric][2](metric_result)
+    detection = _detect_result(metric, value, threshold, p_value)
+    
+    # Generate alert if drift detected
+    alert = generate_alert(detection)
+    alerts = [alert] if alert is not None else []
+    
+    if window is not None:
+        return _make_result(detection.drift_detected, alerts, {metric: metric_result}, window)
+    return {
+        "drift_detected": detection.drift_detected,
+        "alerts": alerts,
+        "metrics": {metric: metric_result}
+    }
+
+
+def _make_result(drift_detected, alerts, metrics, window):
+    """Build a single-feature pipeline result as one dict literal."""
+    return {
+        "drift_detected": drift_detected,
+        "alerts": alerts,
+        "metrics": metrics,
+        "window": window
+    }
 
 
 def run_drift_pipeline(reference_data, current_data, *, feature_type, metric, threshold):
@@ -9,7 +162,8 @@ def run_drift_pipeline(reference_data, current_data, *, feature_type, metric, th
     Run end-to-end drift detection pipeline.
     
     Args:
-        reference_data: Reference dataset (baseline)
+        reference_data: Reference dataset (baseline); its first column is
+            analysed. A 1-D NumPy array is used as the column directly.
         current_data: Current dataset to compare against reference
         feature_type: Type of feature ("numerical" or "categorical")
         metric: Drift metric to use ("psi", "ks", or "chi_square")
@@ -23,62 +177,340 @@ def run_drift_pipeline(reference_data, current_data, *, feature_type, metric, th
             - window (dict): Window information
             
     Raises:
-        ValueError: If data is empty or metric is unsupported
+        ValueError: If data is empty, metric or feature_type is unsupported,
+            or threshold <= 0
+        TypeError: If the data kind does not match the metric
     """
-    # Validate inputs
-    if len(reference_data) == 0:
-        raise ValueError("reference data cannot be empty")
-    if len(current_data) == 0:
-        raise ValueError("current data cannot be empty")
+    # Fail fast on empty datasets, before any column is extracted
+    check_not_empty(reference_data, "reference")
+    check_not_empty(current_data, "current")
     
-    # Validate metric
-    supported_metrics = ["psi", "ks", "chi_square"]
-    if metric not in supported_metrics:
-        raise ValueError(f"unsupported metric: {metric}")
-    
-    # Extract first column for analysis
-    ref_values = reference_data.iloc[:, 0].values
-    curr_values = current_data.iloc[:, 0].values
-    
-    # Compute metric
-    if metric == "psi":
-        metric_result = calculate_psi(ref_values, curr_values)
-        metric_output = {"psi": metric_result}
-        # Detect drift
-        detector_output = detect_psi_drift(psi_value=metric_result, threshold=threshold)
-    elif metric == "ks":
-        metric_result = calculate_ks(ref_values, curr_values)
-        metric_output = {"ks": metric_result}
-        # Detect drift
-        detector_output = detect_ks_drift(
-            statistic=metric_result["statistic"],
-            p_value=metric_result["p_value"],
-            threshold=threshold
+    # Analyse the first column
+    metric_result = _score_feature(
+        _first_column(reference_data),
+        _first_column(current_data),
+        feature_type,
+        metric,
+        threshold
+    )
+    
+    return _feature_result(metric, metric_result, threshold, {
+        "reference_size": len(reference_data),
+        "current_size": len(current_data)
+    })
+
+
+def _numerical_frames(reference_data, current_data, columns, feature_types, metric, thresholds):
+    """Validate numerical columns and convert them to column-major float64 arrays."""
+    # Validate the raw columns first, so non-numeric data raises TypeError
+    # instead of failing in the float64 conversion
+    for column in columns:
+        validate_inputs(
+            reference_data[column], current_data[column], metric,
+            thresholds[column], feature_types[column]
         )
-    elif metric == "chi_square":
-        metric_result = calculate_chi_square(ref_values, curr_values)
-        metric_output = {"chi_square": metric_result}
-        # Detect drift
-        detector_output = detect_chi_square_drift(
-            statistic=metric_result["statistic"],
-            p_value=metric_result["p_value"],
-            threshold=threshold
+    
+    # Convert every column to float64 in one go
+    return _frame_values(reference_data, columns), _frame_values(current_data, columns)
+
+
+def _score_features(reference_data, current_data, feature_types, metric, thresholds, n_jobs):
+    """
+    Compute metrics and batch detector results for every reference column.
+    
+    Returns:
+        tuple: (columns, metric_results, DetectorBatch), in column order
+    """
+    columns = list(reference_data.columns)
+    
+    # Validate that both datasets describe the same features
+    missing = [c for c in columns if c not in current_data.columns]
+    if missing:
+        raise ValueError(f"current data is missing columns: {missing}")
+    
+    if metric == "psi" and columns:
+        # One batch over all features (parallel compiled loop with numba);
+        # n_jobs does not apply
+        reference, current = _numerical_frames(
+            reference_data, current_data, columns, feature_types, metric, thresholds
         )
+        metric_results = calculate_psi_batch(reference, current, _validated=True).tolist()
+    else:
+        if metric == "ks" and columns:
+            reference, current = _numerical_frames(
+                reference_data, current_data, columns, feature_types, metric, thresholds
+            )
+            
+            def score_one(j):
+                return calculate_ks(reference[:, j], current[:, j], _validated=True)
+        else:
+            features = [
+                (_column_values(reference_data, c), _column_values(current_data, c))
+                for c in columns
+            ]
+            
+            def score_one(j):
+                column = columns[j]
+                return _score_feature(
+                    *features[j],
+                    feature_types[column],
+                    metric,
+                    thresholds[column]
+                )
+        
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            metric_results = list(executor.map(score_one, range(len(columns))))
     
-    # Generate alert if drift detected
-    alert = generate_alert(detector_output)
-    alerts = [alert] if alert is not None else []
+    # Detect drift over all features at once
+    batch = _detect_batch(metric, metric_results, [thresholds[c] for c in columns])
+    return columns, metric_results, batch
+
+
+def run_drift_pipeline_multi(reference_data, current_data, *, feature_types, metric,
+                             thresholds, n_jobs=None):
+    """
+    Run drift detection on every column of the reference dataset.
+    
+    Features are independent, so their metrics are computed concurrently
+    on a thread pool (the NumPy/numba kernels do their heavy lifting
+    outside the GIL). PSI for all features is scored at once with
+    calculate_psi_batch.
+    Detection and alerting then run once over arrays of per-feature
+    results.
+    
+    Args:
+        reference_data: Reference dataset (baseline)
+        current_data: Current dataset; must contain every reference column
+        feature_types: Dict mapping column name to feature type
+        metric: Drift metric to use ("psi", "ks", or "chi_square")
+        thresholds: Dict mapping column name to drift threshold
+        n_jobs: Maximum number of worker threads for KS and Chi-Square (None
+            for the executor default); PSI uses the batch kernel and ignores it
+        
+    Returns:
+        dict: Dictionary containing:
+            - drift_detected (bool): Whether drift was detected in any feature
+            - alerts (list): Alerts from all features, each with a "feature" key
+            - features (dict): Per-feature results (drift_detected, alerts, metrics)
+            - window (dict): Window information
+            
+    Raises:
+        ValueError: If a reference column is missing from current data, or
+            any per-feature validation fails
+    """
+    columns, metric_results, batch = _score_features(
+        reference_data, current_data, feature_types, metric, thresholds, n_jobs
+    )
+    alerts = generate_alerts_from_batch(batch, columns)
+    
+    # Per-feature view of the batch results
+    drift_flags = batch.drift.tolist()
+    results = {
+        column: {
+            "drift_detected": drift_flags[i],
+            "alerts": [],
+            "metrics": {metric: metric_results[i]}
+        }
+        for i, column in enumerate(columns)
+    }
+    for alert in alerts:
+        results[alert["feature"]]["alerts"].append(
+            {k: v for k, v in alert.items() if k != "feature"}
+        )
     
-    # Assemble result
     return {
-        "drift_detected": detector_output["drift_detected"],
+        "drift_detected": any(drift_flags),
         "alerts": alerts,
-        "metrics": metric_output,
+        "features": results,
+        "window": {
+            "reference_size": len(reference_data),
+            "current_size": len(current_data)
+        }
+    }
+
+
+def run_drift_pipeline_columnar(reference_data, current_data, *, feature_types, metric,
+                                thresholds, n_jobs=None):
+    """
+    Run multi-feature drift detection and return per-feature results as arrays.
+    
+    Same computation as run_drift_pipeline_multi, but per-feature results
+    are parallel NumPy arrays (one entry per column) instead of a dict of
+    per-feature dicts, which keeps results for many features compact and
+    cheap to aggregate.
+    
+    Args:
+        reference_data: Reference dataset (baseline)
+        current_data: Current dataset; must contain every reference column
+        feature_types: Dict mapping column name to feature type
+        metric: Drift metric to use ("psi", "ks", or "chi_square")
+        thresholds: Dict mapping column name to drift threshold
+        n_jobs: Maximum number of worker threads for KS and Chi-Square (None
+            for the executor default); PSI uses the batch kernel and ignores it
+        
+    Returns:
+        dict: Dictionary containing:
+            - drift_detected (bool): Whether drift was detected in any feature
+            - metric (str): Metric name
+            - features (list): Column names
+            - values (np.ndarray): PSI value or test statistic per feature
+            - p_values (np.ndarray): Test p-value per feature (KS/Chi-Square only)
+            - thresholds (np.ndarray): Threshold per feature
+            - drift (np.ndarray): Whether drift was detected, per feature
+            - alerts (list): Alerts from all features, each with a "feature" key
+            - window (dict): Window information
+            
+    Raises:
+        ValueError: If a reference column is missing from current data, or
+            any per-feature validation fails
+    """
+    columns, _, batch = _score_features(
+        reference_data, current_data, feature_types, metric, thresholds, n_jobs
+    )
+    
+    result = {
+        "drift_detected": bool(batch.drift.any()),
+        "metric": metric,
+        "features": columns,
+        "values": batch.value,
+        "thresholds": batch.threshold,
+        "drift": batch.drift,
+        "alerts": generate_alerts_from_batch(batch, columns),
         "window": {
             "reference_size": len(reference_data),
             "current_size": len(current_data)
         }
     }
+    if metric != "psi":
+        result["p_values"] = batch.p_value
+    return result
+
+
+def iter_feature_drift(reference_data, current_data, *, feature_types, metric, thresholds):
+    """
+    Run drift detection lazily, one reference column at a time.
+    
+    Each feature is only scored when the consumer asks for it, so callers
+    that only need to know whether any feature drifted can stop at the
+    first drifted one.
+    
+    Args:
+        reference_data: Reference dataset (baseline)
+        current_data: Current dataset; must contain every reference column
+        feature_types: Dict mapping column name to feature type
+        metric: Drift metric to use ("psi", "ks", or "chi_square")
+        thresholds: Dict mapping column name to drift threshold
+        
+    Yields:
+        tuple: (column, result) where result contains drift_detected,
+            alerts and metrics for that column, in column order
+            
+    Raises:
+        ValueError: If a reference column is missing from current data, or
+            any per-feature validation fails
+    """
+    columns = list(reference_data.columns)
+    
+    # Validate that both datasets describe the same features
+    missing = [c for c in columns if c not in current_data.columns]
+    if missing:
+        raise ValueError(f"current data is missing columns: {missing}")
+    
+    for column in columns:
+        yield column, _run_feature(
+            _column_values(reference_data, column),
+            _column_values(current_data, column),
+            feature_types[column],
+            metric,
+            thresholds[column]
+        )
+
+
+def _count_categories(chunks, metric):
+    """Validate categorical chunks and count values across all of them."""
+    counts = Counter()
+    size = 0
+    for chunk in chunks:
+        check_kind(chunk, metric)
+        counts.update(pd.Series(chunk).value_counts(dropna=False).to_dict())
+        size += len(chunk)
+    return counts, size
+
+
+def _numerical_chunk(chunk, metric):
+    """Validate a numerical chunk and return it as float64."""
+    chunk = np.asarray(chunk)
+    check_kind(chunk, metric)
+    return chunk.astype(np.float64, copy=False)
+
+
+def run_drift_pipeline_chunked(reference_chunks, current_chunks, *, feature_type, metric,
+                               threshold):
+    """
+    Run drift detection on data that arrives in chunks.
+    
+    The current data is reduced chunk by chunk into bin/category counts, so
+    it never has to be held in memory. PSI and KS need the full reference
+    (for quantile bin edges and the sorted reference CDF), so its chunks
+    are concatenated; Chi-Square counts both sides incrementally. Results
+    match run_drift_pipeline on the concatenated data.
+    
+    Args:
+        reference_chunks: Iterable of 1-D NumPy arrays (reference data)
+        current_chunks: Iterable of 1-D NumPy arrays (current data)
+        feature_type: Type of feature ("numerical" or "categorical")
+        metric: Drift metric to use ("psi", "ks", or "chi_square")
+        threshold: Threshold for drift detection
+        
+    Returns:
+        dict: Same structure as run_drift_pipeline
+        
+    Raises:
+        ValueError: If data is empty, metric or feature_type is unsupported,
+            or threshold <= 0
+        TypeError: If the data kind does not match the metric
+    """
+    validate_options(metric, threshold, feature_type)
+    
+    if metric == "chi_square":
+        ref_counts, reference_size = _count_categories(reference_chunks, metric)
+        curr_counts, current_size = _count_categories(current_chunks, metric)
+        if reference_size == 0:
+            raise ValueError("reference data cannot be empty")
+        if current_size == 0:
+            raise ValueError("current data cannot be empty")
+        
+        # Align counts onto the union of categories
+        categories = list(ref_counts) + [c for c in curr_counts if c not in ref_counts]
+        metric_result = _chi_square_from_counts(
+            np.array([ref_counts[c] for c in categories]),
+            np.array([curr_counts[c] for c in categories])
+        )
+    else:
+        reference = np.concatenate([_numerical_chunk(c, metric) for c in reference_chunks] or [[]])
+        check_not_empty(reference, "reference")
+        
+        baseline_cls = PSIBaseline if metric == "psi" else KSBaseline
+        baseline = baseline_cls(reference, _validated=True)
+        reference_size = len(reference)
+        
+        # Accumulate current counts chunk by chunk
+        counts = None
+        current_size = 0
+        for chunk in current_chunks:
+            chunk = _numerical_chunk(chunk, metric)
+            chunk_counts = baseline.count(chunk)
+            counts = chunk_counts if counts is None else counts + chunk_counts
+            current_size += len(chunk)
+        if current_size == 0:
+            raise ValueError("current data cannot be empty")
+        
+        metric_result = baseline.score_counts(counts)
+    
+    return _feature_result(metric, metric_result, threshold, {
+        "reference_size": reference_size,
+        "current_size": current_size
+    })
 
 
 def run_pipeline(reference_data, current_data):
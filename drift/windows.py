@@ -1,7 +1,8 @@
 # Windowing strategies for drift detection
+import numpy as np
 
 
-def get_windows(data, reference_size, current_size):
+def get_windows(data, reference_size, current_size, columns=None):
     """
     Extract reference and current windows from data.
     
@@ -9,9 +10,16 @@ def get_windows(data, reference_size, current_size):
         data: Input dataset (pandas DataFrame)
         reference_size: Number of rows for reference window (first N rows)
         current_size: Number of rows for current window (last N rows)
+        columns: Optional column name or list of column names. When given,
+            the columns are materialized to a NumPy array once and the
+            windows are returned as views into it. Materializing is
+            zero-copy only when the selection lies in a single block of
+            one dtype (e.g. one column); columns spanning several blocks
+            or dtypes are copied into a new array (upcast to a common dtype).
         
     Returns:
-        tuple: (reference_window, current_window)
+        tuple: (reference_window, current_window) as DataFrames, or as
+            slices of the materialized NumPy array when columns is given
         
     Raises:
         ValueError: If window sizes are invalid or exceed data size
@@ -35,6 +43,12 @@ def get_windows(data, reference_size, current_size):
     if current_size > data_size:
         raise ValueError(f"current_size ({current_size}) exceeds data size ({data_size})")
     
+    # Slices of one materialized array; to_numpy copies unless the columns
+    # share a single same-dtype block
+    if columns is not None:
+        arr = data[columns].to_numpy(copy=False)
+        return (arr[:reference_size], arr[-current_size:])
+    
     # Extract reference window (first N rows)
     reference_window = data.iloc[:reference_size]
     
@@ -43,3 +57,45 @@ def get_windows(data, reference_size, current_size):
     
     return (reference_window, current_window)
 
+
+def get_windows_stream(data, reference_size, current_size, stride=1):
+    """
+    Iterate sliding (reference, current) window pairs over an array.
+    
+    Each pair is two adjacent slices: reference rows [i, i + reference_size)
+    followed by current rows [i + reference_size, i + reference_size + current_size),
+    with i advancing by stride. Slices are views, so sliding does not copy.
+    
+    Args:
+        data: Input array (NumPy array or array-like, converted once)
+        reference_size: Number of rows in each reference window
+        current_size: Number of rows in each current window
+        stride: Number of rows to advance between consecutive pairs
+        
+    Returns:
+        iterator: (reference_window, current_window) tuples of array views
+        
+    Raises:
+        ValueError: If window sizes or stride are invalid or exceed data size
+    """
+    # Validate sizes
+    if reference_size <= 0:
+        raise ValueError("reference_size must be greater than 0")
+    if current_size <= 0:
+        raise ValueError("current_size must be greater than 0")
+    if stride <= 0:
+        raise ValueError("stride must be greater than 0")
+    
+    arr = np.asarray(data)
+    data_size = len(arr)
+    span = reference_size + current_size
+    
+    if span > data_size:
+        raise ValueError(
+            f"reference_size + current_size ({span}) exceeds data size ({data_size})"
+        )
+    
+    return (
+        (arr[start:start + reference_size], arr[start + reference_size:start + span])
+        for start in range(0, data_size - span + 1, stride)
+    )
@@ -0,0 +1,39 @@
+"""
+Shared pytest fixtures.
+
+Tests that need CSV files on disk write them under pytest's tmp_path.
+pytest honours TMPDIR, so CI can point it at a tmpfs mount (for example
+TMPDIR=/dev/shm on Linux) to keep these files in memory.
+"""
+
+import pytest
+
+from drift.windows import get_windows as _get_windows
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    """Return a factory that writes CSV text to a file and returns its path."""
+    def write(text, name="data.csv"):
+        path = tmp_path / name
+        path.write_text(text)
+        return str(path)
+    
+    return write
+
+
+@pytest.fixture(scope="session")
+def identical_csvs(tmp_path_factory):
+    """Write identical reference/current CSV files once per session and return their paths."""
+    directory = tmp_path_factory.mktemp("identical")
+    ref = directory / "ref.csv"
+    curr = directory / "curr.csv"
+    ref.write_text("feature\n1.0\n2.0\n3.0\n4.0\n5.0\n")
+    curr.write_text(ref.read_text())
+    return str(ref), str(curr)
+
+
+@pytest.fixture(scope="session")
+def get_windows():
+    """Return drift.windows.get_windows, bound once per session."""
+    return _get_windows
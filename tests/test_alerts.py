@@ -8,6 +8,7 @@ This module tests behavioral contracts for alert generation:
 """
 
 import pytest
+from unittest.mock import patch
 
 
 def test_generate_alert_function_exists():
@@ -282,3 +283,127 @@ def test_alert_for_chi_square_detector_output():
     assert result is not None
     assert result["metric"] == "chi_square"
 
+
+def test_generate_alert_accepts_drift_result():
+    """Test that a DriftResult gives the same alert as the detector dict."""
+    from drift.alerts import generate_alert
+    from drift.detectors import detect_ks_drift
+    from drift._results import DriftResult
+    
+    result = DriftResult(drift_detected=True, metric="ks", value=0.7, threshold=0.3, p_value=0.01)
+    expected = generate_alert(detect_ks_drift(statistic=0.7, p_value=0.01, threshold=0.3))
+    
+    assert generate_alert(result) == expected, "DriftResult alert must match dict alert"
+    assert generate_alert(
+        DriftResult(drift_detected=False, metric="psi", value=0.05, threshold=0.1, p_value=None)
+    ) is None, "No alert must be generated without drift"
+
+
+def test_generate_alerts_batch_only_alerts_on_drift():
+    """Test that batch alerts are produced only for entries with drift."""
+    from drift.alerts import generate_alerts_batch
+    
+    alerts = generate_alerts_batch(
+        values=[0.05, 0.15, 0.25],
+        thresholds=[0.1, 0.1, 0.1],
+        metrics=["psi", "psi", "psi"],
+        drift_mask=[False, True, True]
+    )
+    
+    assert len(alerts) == 2, "Should alert only where drift_mask is True"
+    assert [a["severity"] for a in alerts] == ["warning", "critical"]
+
+
+def test_generate_alerts_batch_matches_generate_alert():
+    """Test that batch alerts match the scalar generate_alert output."""
+    from drift.alerts import generate_alert, generate_alerts_batch
+    
+    detector_outputs = [
+        {"drift_detected": True, "metric": "psi", "value": 0.2, "threshold": 0.1},
+        {"drift_detected": True, "metric": "psi", "value": 0.35, "threshold": 0.1},
+    ]
+    
+    alerts = generate_alerts_batch(
+        values=[d["value"] for d in detector_outputs],
+        thresholds=[d["threshold"] for d in detector_outputs],
+        metrics=[d["metric"] for d in detector_outputs],
+        drift_mask=[d["drift_detected"] for d in detector_outputs]
+    )
+    
+    assert alerts == [generate_alert(d) for d in detector_outputs]
+
+
+def test_generate_alerts_batch_matches_generate_alert_for_ks():
+    """Test that batch KS alerts carry statistic/p_value details like generate_alert."""
+    from drift.alerts import generate_alert, generate_alerts_batch
+    from drift.detectors import detect_ks_drift
+    
+    statistics = [0.1, 0.35, 0.9]
+    p_values = [0.6, 0.02, 0.001]
+    detector_outputs = [
+        detect_ks_drift(statistic=statistic, p_value=p_value, threshold=0.3)
+        for statistic, p_value in zip(statistics, p_values)
+    ]
+    
+    alerts = generate_alerts_batch(
+        values=statistics,
+        thresholds=[0.3] * 3,
+        metrics=["ks"] * 3,
+        drift_mask=[d["drift_detected"] for d in detector_outputs],
+        p_values=p_values
+    )
+    
+    expected = [generate_alert(d) for d in detector_outputs if d["drift_detected"]]
+    assert alerts == expected, "Batch KS alerts must match generate_alert"
+
+
+def test_generate_alerts_batch_requires_p_values_for_tests():
+    """Test that KS/Chi-Square batch alerts raise ValueError without p_values."""
+    from drift.alerts import generate_alerts_batch
+    
+    with pytest.raises(ValueError, match="p_values is required"):
+        generate_alerts_batch([0.5], [0.3], ["ks"], [True])
+
+
+def test_generate_alerts_batch_raises_error_for_length_mismatch():
+    """Test that batch alerts raise ValueError for inputs of different lengths."""
+    from drift.alerts import generate_alerts_batch
+    
+    with pytest.raises(ValueError, match="same length"):
+        generate_alerts_batch([0.1, 0.2], [0.1], ["psi", "psi"], [True, True])
+
+
+def test_generate_alerts_from_batch_matches_generate_alert():
+    """Test that batch alerts match generate_alert on the scalar detector output."""
+    from drift.alerts import generate_alert, generate_alerts_from_batch
+    from drift.detectors import _detect_ks_batch, detect_ks_drift
+    
+    statistics = [0.1, 0.35, 0.9]
+    p_values = [0.6, 0.02, 0.001]
+    batch = _detect_ks_batch(statistics, p_values, 0.3)
+    
+    alerts = generate_alerts_from_batch(batch, ["a", "b", "c"])
+    
+    assert [a["feature"] for a in alerts] == ["b", "c"], \
+        "Alerts must only be generated for drifted features"
+    for alert, i in zip(alerts, [1, 2]):
+        expected = generate_alert(
+            detect_ks_drift(statistic=statistics[i], p_value=p_values[i], threshold=0.3)
+        )
+        assert {k: v for k, v in alert.items() if k != "feature"} == expected, \
+            "Batch alert must match generate_alert"
+
+
+def test_severity_uses_per_metric_critical_multiplier():
+    """Test that the critical cut-off follows the per-metric multiplier."""
+    from drift import alerts
+    from drift.alerts import generate_alert
+    
+    detector_output = {"drift_detected": True, "metric": "psi", "value": 0.25, "threshold": 0.1}
+    
+    with patch.dict(alerts._CRITICAL, {"psi": 3.0}):
+        assert generate_alert(detector_output)["severity"] == "warning", \
+            "value below 3x threshold must be a warning"
+    
+    assert generate_alert(detector_output)["severity"] == "critical", \
+        "value above 2x threshold must be critical by default"
@@ -0,0 +1,349 @@
+"""
+Test suite for precomputed reference baselines.
+
+This module tests behavioral contracts for:
+- PSIBaseline (cached reference bins and proportions)
+- KSBaseline (cached sorted reference)
+"""
+
+import pytest
+import numpy as np
+from scipy import stats
+
+
+# ============================================================================
+# PSIBaseline Tests
+# ============================================================================
+
+def test_psi_baseline_matches_calculate_psi():
+    """Test that PSIBaseline.score matches calculate_psi."""
+    from drift.baselines import PSIBaseline
+    from drift.metrics import calculate_psi
+    
+    reference = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0])
+    current = np.array([1.5, 2.5, 3.5, 4.5, 9.0])
+    
+    baseline = PSIBaseline(reference)
+    
+    assert baseline.score(current) == calculate_psi(reference, current), \
+        "PSIBaseline must match calculate_psi"
+
+
+def test_psi_baseline_reused_across_windows():
+    """Test that one PSIBaseline scores several current windows consistently."""
+    from drift.baselines import PSIBaseline
+    from drift.metrics import calculate_psi
+    
+    reference = np.array([10.0, 20.0, 30.0, 40.0, 50.0])
+    windows = [
+        np.array([10.0, 20.0, 30.0, 40.0, 50.0]),
+        np.array([15.0, 25.0, 35.0, 45.0, 55.0]),
+        np.array([50.0, 60.0, 70.0]),
+    ]
+    
+    baseline = PSIBaseline(reference)
+    
+    for window in windows:
+        assert baseline.score(window) == calculate_psi(reference, window), \
+            "Baseline must give the same PSI for every window"
+
+
+def test_psi_baseline_identical_data_has_zero_psi():
+    """Test that scoring the reference against itself gives PSI == 0."""
+    from drift.baselines import PSIBaseline
+    
+    reference = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+    
+    assert PSIBaseline(reference).score(reference) == pytest.approx(0.0), \
+        "PSI of identical data must be 0"
+
+
+def test_psi_baseline_handles_constant_reference():
+    """Test that a constant reference does not produce NaN or inf."""
+    from drift.baselines import PSIBaseline
+    
+    baseline = PSIBaseline(np.array([3.0, 3.0, 3.0]))
+    
+    assert np.isfinite(baseline.score(np.array([3.0, 4.0, 5.0]))), \
+        "PSI must be finite for constant reference"
+
+
+def test_psi_baseline_uses_equal_frequency_bins():
+    """Test that heavy-tailed reference data is spread evenly over the bins."""
+    from drift.baselines import PSIBaseline
+    
+    reference = np.random.default_rng(0).lognormal(sigma=2.0, size=1000)
+    
+    baseline = PSIBaseline(reference)
+    
+    assert np.allclose(baseline.ref_props, 0.1), \
+        "Each bin must hold an equal share of the reference data"
+
+
+def test_psi_baseline_drops_duplicate_quantile_edges():
+    """Test that tied reference quantiles collapse into strictly increasing edges."""
+    from drift.baselines import PSIBaseline
+    
+    baseline = PSIBaseline(np.array([1.0, 1.0, 1.0, 1.0, 2.0]))
+    
+    assert np.all(np.diff(baseline.inner_edges) > 0), "Edges must be strictly increasing"
+    assert baseline.n_bins == len(baseline.inner_edges) + 1
+    assert len(baseline.ref_props) == baseline.n_bins
+
+
+def test_psi_baseline_raises_error_for_empty_reference():
+    """Test that PSIBaseline raises ValueError for empty reference data."""
+    from drift.baselines import PSIBaseline
+    
+    with pytest.raises(ValueError, match="reference.*empty"):
+        PSIBaseline(np.array([]))
+
+
+def test_psi_baseline_raises_error_for_empty_current():
+    """Test that PSIBaseline.score raises ValueError for empty current data."""
+    from drift.baselines import PSIBaseline
+    
+    baseline = PSIBaseline(np.array([1.0, 2.0, 3.0]))
+    
+    with pytest.raises(ValueError, match="current.*empty"):
+        baseline.score(np.array([]))
+
+
+def test_psi_baseline_rejects_categorical_data():
+    """Test that PSIBaseline raises TypeError for categorical data."""
+    from drift.baselines import PSIBaseline
+    
+    with pytest.raises(TypeError):
+        PSIBaseline(np.array(["a", "b", "c"]))
+
+
+def test_psi_baseline_score_counts_matches_numpy_formula():
+    """Test that the fused PSI reduction matches the vectorized formula."""
+    from drift.baselines import PSIBaseline
+    
+    rng = np.random.default_rng(6)
+    baseline = PSIBaseline(rng.normal(0, 1, 500))
+    counts = baseline.count(rng.normal(3.0, 1, 300))  # leaves some bins empty
+    
+    curr_props = counts / counts.sum()
+    curr_props = np.where(curr_props == 0, 1e-10, curr_props)
+    expected = np.sum((curr_props - baseline.ref_props) * np.log(curr_props / baseline.ref_props))
+    
+    assert baseline.score_counts(counts) == pytest.approx(expected), \
+        "PSI must match the NumPy formula, including empty current bins"
+
+
+def test_psi_baseline_reference_counts_match_count():
+    """Test that reference bin counts read off the sorted data match count()."""
+    from drift.baselines import PSIBaseline
+    
+    rng = np.random.default_rng(7)
+    reference = np.round(rng.normal(0, 1, 400), 1)  # ties on the edges
+    
+    baseline = PSIBaseline(reference)
+    counts = baseline.count(reference)
+    
+    assert np.allclose(np.maximum(counts / len(reference), 1e-10), baseline.ref_props), \
+        "Reference proportions must match binning the reference with count()"
+
+
+@pytest.mark.parametrize("reference", [
+    np.random.default_rng(8).normal(0, 1, 101),
+    np.random.default_rng(9).integers(-3, 4, 57),
+    np.array([2.5]),
+    np.array([1.0, np.nan, 3.0])
+], ids=["normal", "integers", "single", "nan"])
+def test_sorted_quantiles_match_numpy(reference):
+    """Test that quantiles read off sorted data are bit-identical to np.quantile."""
+    from drift.baselines import _sorted_quantiles
+    
+    q = np.linspace(0, 1, 11)[1:-1]
+    
+    assert np.array_equal(_sorted_quantiles(np.sort(reference), q), np.quantile(reference, q),
+                          equal_nan=True), "Quantiles must match np.quantile exactly"
+
+
+def test_sorted_quantiles_match_numpy_per_column():
+    """Test that column-wise quantiles of sorted 2-D data match np.quantile along axis 0."""
+    from drift.baselines import _sorted_quantiles
+    
+    rng = np.random.default_rng(11)
+    reference = np.column_stack([
+        rng.normal(0, 1, 64), np.round(rng.normal(0, 1, 64)), rng.normal(0, 1, 64)
+    ])
+    reference[5, 2] = np.nan
+    q = np.linspace(0, 1, 11)[1:-1]
+    
+    result = _sorted_quantiles(np.sort(reference, axis=0), q)
+    
+    assert np.array_equal(result, np.quantile(reference, q, axis=0), equal_nan=True), \
+        "Each column must match np.quantile exactly"
+
+
+# ============================================================================
+# KSBaseline Tests
+# ============================================================================
+
+def test_ks_baseline_statistic_matches_scipy():
+    """Test that KSBaseline statistic matches scipy's two-sample KS statistic."""
+    from drift.baselines import KSBaseline
+    
+    reference = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+    current = np.array([1.5, 2.5, 3.5, 4.5, 5.5, 8.0, 9.0])
+    
+    result = KSBaseline(reference).score(current)
+    
+    assert result["statistic"] == pytest.approx(stats.ks_2samp(reference, current).statistic), \
+        "KS statistic must match scipy"
+
+
+def test_ks_baseline_p_value_in_valid_range():
+    """Test that KSBaseline p_value is in [0, 1]."""
+    from drift.baselines import KSBaseline
+    
+    result = KSBaseline(np.array([1.0, 2.0, 3.0])).score(np.array([2.0, 3.0, 4.0]))
+    
+    assert 0 <= result["p_value"] <= 1, "KS p_value must be in [0, 1]"
+
+
+def test_ks_baseline_raises_error_for_empty_current():
+    """Test that KSBaseline.score raises ValueError for empty current data."""
+    from drift.baselines import KSBaseline
+    
+    baseline = KSBaseline(np.array([1.0, 2.0, 3.0]))
+    
+    with pytest.raises(ValueError, match="current.*empty"):
+        baseline.score(np.array([]))
+
+
+def test_ks_baseline_rejects_categorical_data():
+    """Test that KSBaseline raises TypeError for categorical data."""
+    from drift.baselines import KSBaseline
+    
+    with pytest.raises(TypeError):
+        KSBaseline(np.array(["a", "b", "c"]))
+
+
+# ============================================================================
+# Chunked Counting Tests
+# ============================================================================
+
+def test_psi_baseline_chunked_counts_match_score():
+    """Test that summed per-chunk PSI counts give the same PSI as score."""
+    from drift.baselines import PSIBaseline
+    
+    rng = np.random.default_rng(3)
+    reference = rng.normal(0, 1, 200)
+    current = rng.normal(0.5, 1, 150)
+    
+    baseline = PSIBaseline(reference)
+    counts = sum(baseline.count(chunk) for chunk in np.array_split(current, 4))
+    
+    assert baseline.score_counts(counts) == pytest.approx(baseline.score(current)), \
+        "Chunked PSI must match PSI on the full data"
+
+
+def test_ks_baseline_chunked_counts_match_score():
+    """Test that summed per-chunk KS counts give the same result as score."""
+    from drift.baselines import KSBaseline
+    
+    rng = np.random.default_rng(4)
+    reference = np.round(rng.normal(0, 1, 120), 1)  # rounded to create ties
+    current = np.round(rng.normal(0.3, 1, 90), 1)
+    
+    baseline = KSBaseline(reference)
+    counts = sum(baseline.count(chunk) for chunk in np.array_split(current, 3))
+    
+    result = baseline.score_counts(counts)
+    expected = baseline.score(current)
+    
+    assert result["statistic"] == pytest.approx(expected["statistic"]), \
+        "Chunked KS statistic must match the full-data statistic"
+    assert result["p_value"] == pytest.approx(expected["p_value"]), \
+        "Chunked KS p_value must match the full-data p_value"
+
+
+@pytest.mark.parametrize("reference,current", [
+    ([0.0, 1.0, 2.0, 3.0, 4.0], [1.0, 2.0, 3.0, 4.0, 5.0]),
+    (list(range(1, 11)), list(range(3, 13))),
+    ([3.0, 4.0, 4.0, 7.0, 8.0, 0.0], [5.0, 3.0, 6.0, 5.0, 2.0, 3.0, 7.0, 5.0, 5.0, 3.0, 7.0]),
+])
+def test_ks_baseline_chunked_statistic_equals_score_exactly(reference, current):
+    """Test that the counted KS statistic is bit-identical to the in-memory one."""
+    from drift.baselines import KSBaseline
+    
+    baseline = KSBaseline(np.array(reference, dtype=float))
+    current = np.array(current, dtype=float)
+    counts = sum(baseline.count(chunk) for chunk in np.array_split(current, 2))
+    
+    assert baseline.score_counts(counts) == baseline.score(current), \
+        "Counted and in-memory KS must round the statistic identically"
+
+
+@pytest.mark.parametrize("reference,current", [
+    ([1.0, 2.0, 3.0], [1.0, 2.0, np.nan]),
+    ([1.0, np.nan, 3.0], [1.0, 2.0, 3.0]),
+])
+def test_ks_baseline_propagates_nan(reference, current):
+    """Test that NaN in either sample gives a NaN KS result on every path."""
+    from drift.baselines import KSBaseline
+    
+    baseline = KSBaseline(np.array(reference))
+    current = np.array(current)
+    
+    for result in (baseline.score(current), baseline.score_counts(baseline.count(current))):
+        assert np.isnan(result["statistic"]) and np.isnan(result["p_value"]), \
+            "NaN input must give NaN statistic and p_value, as scipy does"
+
+
+# ============================================================================
+# Reference Cache Tests
+# ============================================================================
+
+def test_reference_baseline_reused_for_equal_contents():
+    """Test that references with equal contents share one cached baseline."""
+    from drift.baselines import PSIBaseline, clear_baseline_cache, reference_baseline
+    
+    clear_baseline_cache()
+    reference = np.random.default_rng(5).normal(0, 1, 300)
+    
+    first = reference_baseline(PSIBaseline, reference)
+    
+    assert reference_baseline(PSIBaseline, reference.copy()) is first, \
+        "An equal reference must reuse the cached baseline"
+    assert reference_baseline(PSIBaseline, reference, n_bins=5) is not first, \
+        "Different constructor arguments must build a new baseline"
+
+
+def test_reference_baseline_not_reused_after_in_place_change():
+    """Test that modifying a reference in place does not return a stale baseline."""
+    from drift.baselines import KSBaseline, reference_baseline
+    from drift.metrics import calculate_ks
+    
+    reference = np.arange(100, dtype=float)
+    current = np.arange(50, 150, dtype=float)
+    calculate_ks(reference, current)
+    
+    reference[40:60] += 1000.0
+    
+    assert calculate_ks(reference, current) == pytest.approx(KSBaseline(reference).score(current)), \
+        "KS must reflect the modified reference"
+    assert np.array_equal(reference_baseline(KSBaseline, reference).sorted_ref, np.sort(reference))
+
+
+def test_psi_reference_baseline_reuses_cached_ks_sort():
+    """Test that a PSI baseline built from a cached KS baseline's sort is unchanged."""
+    from drift.baselines import (
+        KSBaseline, PSIBaseline, clear_baseline_cache, reference_baseline
+    )
+    
+    clear_baseline_cache()
+    reference = np.random.default_rng(10).normal(0, 1, 300)
+    reference_baseline(KSBaseline, reference)
+    
+    shared = reference_baseline(PSIBaseline, reference)
+    expected = PSIBaseline(reference)
+    
+    assert np.array_equal(shared.inner_edges, expected.inner_edges)
+    assert np.array_equal(shared.ref_props, expected.ref_props), \
+        "Sharing the KS sort must not change the PSI baseline"
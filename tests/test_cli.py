@@ -9,7 +9,6 @@ This module tests the drift monitoring CLI:
 
 import pytest
 import json
-import tempfile
 import os
 from io import StringIO
 from unittest.mock import patch
@@ -23,125 +22,79 @@ def test_main_function_exists():
     assert callable(main), "main must be a callable function"
 
 
-def test_main_returns_int():
+def test_main_returns_int(identical_csvs):
     """Test that main returns an integer exit code."""
     from drift.cli import main
     
-    # Create temporary CSV files
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as ref_file:
-        ref_file.write("feature\n1.0\n2.0\n3.0\n4.0\n5.0\n")
-        ref_path = ref_file.name
+    # Shared identical CSV files
+    ref_path, curr_path = identical_csvs
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as curr_file:
-        curr_file.write("feature\n1.0\n2.0\n3.0\n4.0\n5.0\n")
-        curr_path = curr_file.name
+    with patch('sys.argv', ['cli', ref_path, curr_path, '--metric', 'psi', '--threshold', '0.5']):
+        result = main()
     
-    try:
-        with patch('sys.argv', ['cli', ref_path, curr_path, '--metric', 'psi', '--threshold', '0.5']):
-            result = main()
-        
-        assert isinstance(result, int), "main must return an integer exit code"
-    finally:
-        os.unlink(ref_path)
-        os.unlink(curr_path)
+    assert isinstance(result, int), "main must return an integer exit code"
 
 
-def test_successful_execution_no_drift_returns_zero():
+def test_successful_execution_no_drift_returns_zero(identical_csvs):
     """Test that main returns 0 when no drift is detected."""
     from drift.cli import main
     
-    # Create identical datasets - no drift
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as ref_file:
-        ref_file.write("feature\n1.0\n2.0\n3.0\n4.0\n5.0\n")
-        ref_path = ref_file.name
+    # Identical datasets - no drift
+    ref_path, curr_path = identical_csvs
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as curr_file:
-        curr_file.write("feature\n1.0\n2.0\n3.0\n4.0\n5.0\n")
-        curr_path = curr_file.name
+    with patch('sys.argv', ['cli', ref_path, curr_path, '--metric', 'psi', '--threshold', '0.5']):
+        exit_code = main()
     
-    try:
-        with patch('sys.argv', ['cli', ref_path, curr_path, '--metric', 'psi', '--threshold', '0.5']):
-            exit_code = main()
-        
-        assert exit_code == 0, "Should return 0 when no drift detected"
-    finally:
-        os.unlink(ref_path)
-        os.unlink(curr_path)
+    assert exit_code == 0, "Should return 0 when no drift detected"
 
 
-def test_drift_detected_returns_two():
+def test_drift_detected_returns_two(csv_path):
     """Test that main returns 2 when drift is detected."""
     from drift.cli import main
     
     # Create very different datasets - drift expected
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as ref_file:
-        ref_file.write("feature\n1.0\n2.0\n3.0\n4.0\n5.0\n")
-        ref_path = ref_file.name
+    ref_path = csv_path("feature\n1.0\n2.0\n3.0\n4.0\n5.0\n", "ref.csv")
+    
+    curr_path = csv_path("feature\n10.0\n20.0\n30.0\n40.0\n50.0\n", "curr.csv")
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as curr_file:
-        curr_file.write("feature\n10.0\n20.0\n30.0\n40.0\n50.0\n")
-        curr_path = curr_file.name
+    with patch('sys.argv', ['cli', ref_path, curr_path, '--metric', 'psi', '--threshold', '0.01']):
+        exit_code = main()
     
-    try:
-        with patch('sys.argv', ['cli', ref_path, curr_path, '--metric', 'psi', '--threshold', '0.01']):
-            exit_code = main()
-        
-        assert exit_code == 2, "Should return 2 when drift detected"
-    finally:
-        os.unlink(ref_path)
-        os.unlink(curr_path)
+    assert exit_code == 2, "Should return 2 when drift detected"
 
 
-def test_json_output_produced_on_success():
+def test_json_output_produced_on_success(identical_csvs):
     """Test that JSON output is produced to stdout."""
     from drift.cli import main
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as ref_file:
-        ref_file.write("feature\n1.0\n2.0\n3.0\n4.0\n5.0\n")
-        ref_path = ref_file.name
+    ref_path, curr_path = identical_csvs
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as curr_file:
-        curr_file.write("feature\n1.0\n2.0\n3.0\n4.0\n5.0\n")
-        curr_path = curr_file.name
+    with patch('sys.argv', ['cli', ref_path, curr_path, '--metric', 'psi', '--threshold', '0.5']):
+        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+            main()
+            output = mock_stdout.getvalue()
     
-    try:
-        with patch('sys.argv', ['cli', ref_path, curr_path, '--metric', 'psi', '--threshold', '0.5']):
-            with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-                main()
-                output = mock_stdout.getvalue()
-        
-        # Should be valid JSON
-        result = json.loads(output)
-        assert isinstance(result, dict), "Output should be valid JSON dict"
-    finally:
-        os.unlink(ref_path)
-        os.unlink(curr_path)
-
-
-def test_json_output_contains_drift_detected_field():
+    # Should be valid JSON
+    result = json.loads(output)
+    assert isinstance(result, dict), "Output should be valid JSON dict"
+
+
+def test_json_output_contains_drift_detected_field(csv_path):
     """Test that JSON output contains drift_detected field."""
     from drift.cli import main
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as ref_file:
-        ref_file.write("feature\n1.0\n2.0\n3.0\n4.0\n5.0\n")
-        ref_path = ref_file.name
+    ref_path = csv_path("feature\n1.0\n2.0\n3.0\n4.0\n5.0\n", "ref.csv")
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as curr_file:
-        curr_file.write("feature\n10.0\n20.0\n30.0\n40.0\n50.0\n")
-        curr_path = curr_file.name
+    curr_path = csv_path("feature\n10.0\n20.0\n30.0\n40.0\n50.0\n", "curr.csv")
     
-    try:
-        with patch('sys.argv', ['cli', ref_path, curr_path, '--metric', 'psi', '--threshold', '0.01']):
-            with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-                main()
-                output = mock_stdout.getvalue()
-        
-        result = json.loads(output)
-        assert "drift_detected" in result, "JSON output must contain drift_detected field"
-        assert result["drift_detected"] is True, "drift_detected should be True for drifted data"
-    finally:
-        os.unlink(ref_path)
-        os.unlink(curr_path)
+    with patch('sys.argv', ['cli', ref_path, curr_path, '--metric', 'psi', '--threshold', '0.01']):
+        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+            main()
+            output = mock_stdout.getvalue()
+    
+    result = json.loads(output)
+    assert "drift_detected" in result, "JSON output must contain drift_detected field"
+    assert result["drift_detected"] is True, "drift_detected should be True for drifted data"
 
 
 def test_invalid_file_path_returns_one():
@@ -154,100 +107,413 @@ def test_invalid_file_path_returns_one():
     assert exit_code == 1, "Should return 1 for invalid file path"
 
 
-def test_invalid_metric_returns_one():
+def test_missing_file_reported_on_stderr(identical_csvs):
+    """Test that a missing file is named on stderr and returns 1."""
+    from drift.cli import main
+    
+    ref_path, _ = identical_csvs
+    
+    with patch('sys.stderr', new_callable=StringIO) as mock_stderr:
+        exit_code = main([ref_path, '/nonexistent/file.csv', '--metric', 'psi', '--threshold', '0.1'])
+    
+    assert exit_code == 1, "Missing current file must return 1"
+    assert mock_stderr.getvalue() == "error: file not found: /nonexistent/file.csv\n", \
+        "Missing file must be reported on stderr"
+
+
+def test_invalid_metric_returns_one(identical_csvs):
     """Test that main returns 1 for unsupported metric."""
     from drift.cli import main
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as ref_file:
-        ref_file.write("feature\n1.0\n2.0\n3.0\n4.0\n5.0\n")
-        ref_path = ref_file.name
+    ref_path, curr_path = identical_csvs
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as curr_file:
-        curr_file.write("feature\n1.0\n2.0\n3.0\n4.0\n5.0\n")
-        curr_path = curr_file.name
+    with patch('sys.argv', ['cli', ref_path, curr_path, '--metric', 'invalid_metric', '--threshold', '0.1']):
+        exit_code = main()
     
-    try:
-        with patch('sys.argv', ['cli', ref_path, curr_path, '--metric', 'invalid_metric', '--threshold', '0.1']):
-            exit_code = main()
-        
-        assert exit_code == 1, "Should return 1 for unsupported metric"
-    finally:
-        os.unlink(ref_path)
-        os.unlink(curr_path)
+    assert exit_code == 1, "Should return 1 for unsupported metric"
 
 
-def test_cli_is_deterministic():
+@pytest.mark.parametrize("extra_args,message", [
+    (['--threshold', '0.1'], "required: --metric"),
+    (['--metric', 'psi', '--threshold', '0.1', '--bogus'], "unrecognized arguments: --bogus"),
+    (['--metric', 'psi', '--threshold', '0.1', '--fail-fast'], "--fail-fast requires --all-columns"),
+])
+def test_usage_error_returns_one(identical_csvs, extra_args, message):
+    """Test that usage errors return 1 (not the drift exit code 2) and are reported on stderr."""
+    from drift.cli import main
+    
+    ref_path, curr_path = identical_csvs
+    
+    with patch('sys.stderr', new_callable=StringIO) as mock_stderr:
+        exit_code = main([ref_path, curr_path] + extra_args)
+    
+    assert exit_code == 1, "Usage errors must return 1"
+    assert message in mock_stderr.getvalue(), "Usage error must be reported on stderr"
+
+
+def test_cli_is_deterministic(csv_path):
     """Test that CLI returns same result for same inputs."""
     from drift.cli import main
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as ref_file:
-        ref_file.write("feature\n1.0\n2.0\n3.0\n4.0\n5.0\n")
-        ref_path = ref_file.name
-    
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as curr_file:
-        curr_file.write("feature\n1.5\n2.5\n3.5\n4.5\n5.5\n")
-        curr_path = curr_file.name
-    
-    try:
-        with patch('sys.argv', ['cli', ref_path, curr_path, '--metric', 'psi', '--threshold', '0.1']):
-            with patch('sys.stdout', new_callable=StringIO) as mock_stdout1:
-                exit_code1 = main()
-                output1 = mock_stdout1.getvalue()
-        
-        with patch('sys.argv', ['cli', ref_path, curr_path, '--metric', 'psi', '--threshold', '0.1']):
-            with patch('sys.stdout', new_callable=StringIO) as mock_stdout2:
-                exit_code2 = main()
-                output2 = mock_stdout2.getvalue()
-        
-        assert exit_code1 == exit_code2, "CLI must be deterministic (same exit code)"
-        
-        result1 = json.loads(output1)
-        result2 = json.loads(output2)
-        assert result1["drift_detected"] == result2["drift_detected"], "CLI must be deterministic (same drift decision)"
-    finally:
-        os.unlink(ref_path)
-        os.unlink(curr_path)
-
-
-def test_cli_with_ks_metric():
+    ref_path = csv_path("feature\n1.0\n2.0\n3.0\n4.0\n5.0\n", "ref.csv")
+    
+    curr_path = csv_path("feature\n1.5\n2.5\n3.5\n4.5\n5.5\n", "curr.csv")
+    
+    with patch('sys.argv', ['cli', ref_path, curr_path, '--metric', 'psi', '--threshold', '0.1']):
+        with patch('sys.stdout', new_callable=StringIO) as mock_stdout1:
+            exit_code1 = main()
+            output1 = mock_stdout1.getvalue()
+    
+    with patch('sys.argv', ['cli', ref_path, curr_path, '--metric', 'psi', '--threshold', '0.1']):
+        with patch('sys.stdout', new_callable=StringIO) as mock_stdout2:
+            exit_code2 = main()
+            output2 = mock_stdout2.getvalue()
+    
+    assert exit_code1 == exit_code2, "CLI must be deterministic (same exit code)"
+    
+    result1 = json.loads(output1)
+    result2 = json.loads(output2)
+    assert result1["drift_detected"] == result2["drift_detected"], "CLI must be deterministic (same drift decision)"
+
+
+def test_cli_with_ks_metric(csv_path):
     """Test that CLI works with KS metric."""
     from drift.cli import main
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as ref_file:
-        ref_file.write("feature\n1.0\n2.0\n3.0\n4.0\n5.0\n")
-        ref_path = ref_file.name
+    ref_path = csv_path("feature\n1.0\n2.0\n3.0\n4.0\n5.0\n", "ref.csv")
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as curr_file:
-        curr_file.write("feature\n1.5\n2.5\n3.5\n4.5\n5.5\n")
-        curr_path = curr_file.name
+    curr_path = csv_path("feature\n1.5\n2.5\n3.5\n4.5\n5.5\n", "curr.csv")
     
-    try:
-        with patch('sys.argv', ['cli', ref_path, curr_path, '--metric', 'ks', '--threshold', '0.3']):
-            exit_code = main()
-        
-        assert exit_code in [0, 2], "Should return valid exit code for KS metric"
-    finally:
-        os.unlink(ref_path)
-        os.unlink(curr_path)
+    with patch('sys.argv', ['cli', ref_path, curr_path, '--metric', 'ks', '--threshold', '0.3']):
+        exit_code = main()
+    
+    assert exit_code in [0, 2], "Should return valid exit code for KS metric"
 
 
-def test_cli_with_chi_square_metric():
+def test_cli_with_chi_square_metric(csv_path):
     """Test that CLI works with Chi-Square metric."""
     from drift.cli import main
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as ref_file:
-        ref_file.write("feature\na\nb\nc\na\nb\n")
-        ref_path = ref_file.name
+    ref_path = csv_path("feature\na\nb\nc\na\nb\n", "ref.csv")
+    
+    curr_path = csv_path("feature\na\nb\nc\nc\nb\n", "curr.csv")
+    
+    with patch('sys.argv', ['cli', ref_path, curr_path, '--metric', 'chi_square', '--threshold', '0.05', '--feature-type', 'categorical']):
+        exit_code = main()
+    
+    assert exit_code in [0, 2], "Should return valid exit code for Chi-Square metric"
+
+
+def test_read_csv_loads_only_first_column(csv_path):
+    """Test that the CLI CSV loader keeps only the analysed (first) column."""
+    from drift.cli import _read_csv
+    
+    path = csv_path("feature,other\n1.5,x\n2.5,y\n3.5,z\n", "data.csv")
+    
+    data = _read_csv(path)
+    
+    assert list(data.columns) == ["feature"], "Only the first column must be loaded"
+    assert data["feature"].tolist() == [1.5, 2.5, 3.5], "Values must match the file"
+
+
+def test_read_csv_numerical_parses_float64(csv_path):
+    """Test that numerical columns are parsed straight to float64."""
+    from drift.cli import _read_csv
+    
+    path = csv_path("feature\n1\n2\n3\n", "data.csv")
+    
+    data = _read_csv(path, numerical=True)
+    
+    assert data["feature"].dtype == "float64", "Numerical column must be float64"
+
+
+def test_numerical_metric_on_string_csv_returns_one(csv_path):
+    """Test that PSI on a non-numeric CSV column returns exit code 1."""
+    from drift.cli import main
+    
+    path = csv_path("feature\na\nb\nc\n", "data.csv")
+    
+    with patch('sys.argv', ['cli', path, path, '--metric', 'psi', '--threshold', '0.1']):
+        exit_code = main()
+    
+    assert exit_code == 1, "Non-numeric data must return exit code 1"
+
+
+def test_chunksize_gives_same_output_as_full_read(csv_path):
+    """Test that --chunksize streaming prints the same result as a full read."""
+    from drift.cli import main
+    
+    ref_path = csv_path("feature\n" + "\n".join(str(v) for v in range(40)) + "\n", "ref.csv")
+    
+    curr_path = csv_path("feature\n" + "\n".join(str(v) for v in range(10, 60)) + "\n", "curr.csv")
+    
+    outputs = []
+    for extra in ([], ['--chunksize', '7']):
+        with patch('sys.argv', ['cli', ref_path, curr_path, '--metric', 'ks', '--threshold', '0.2'] + extra):
+            with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+                exit_code = main()
+                outputs.append((exit_code, json.loads(mock_stdout.getvalue())))
+    
+    assert outputs[0][0] == outputs[1][0], "Exit codes must match"
+    assert outputs[0][1]["window"] == outputs[1][1]["window"], "Window sizes must match"
+    assert outputs[0][1]["metrics"]["ks"]["statistic"] == pytest.approx(
+        outputs[1][1]["metrics"]["ks"]["statistic"]
+    ), "KS statistic must match"
+
+
+def test_chunksize_counts_categories_like_full_read(csv_path):
+    """Test that chunks of differing inferred types count one category once."""
+    from drift.cli import main
+    
+    # With chunks of 3, "1" lands in an all-digit chunk on one side only
+    ref_path = csv_path("feature\n1\n1\n1\na\nb\n", "ref.csv")
+    curr_path = csv_path("feature\na\n1\n1\n1\nb\n", "curr.csv")
+    
+    outputs = []
+    for extra in ([], ['--chunksize', '3']):
+        with patch('sys.argv', ['cli', ref_path, curr_path, '--metric', 'chi_square',
+                                '--threshold', '0.05', '--feature-type', 'categorical'] + extra):
+            with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+                exit_code = main()
+                outputs.append((exit_code, json.loads(mock_stdout.getvalue())))
+    
+    assert outputs[0] == outputs[1], "Chunked and full reads must give the same result"
+    assert outputs[1][1]["metrics"]["chi_square"]["statistic"] == pytest.approx(0.0), \
+        "Identical category counts must give a zero statistic"
+
+
+def test_parquet_cache_is_written_and_reused(csv_path):
+    """Test that the first load writes a Parquet sidecar that later loads reuse."""
+    pytest.importorskip("pyarrow")
+    import glob
+    from drift.cli import _load_frame
+    
+    path = csv_path("feature\n1.0\n2.0\n3.0\n", "data.csv")
+    
+    first = _load_frame(path, numerical=True, cache=True)
+    sidecars = glob.glob(path + ".*.parquet")
+    second = _load_frame(path, numerical=True, cache=True)
+    
+    assert len(sidecars) == 1, "First load must write one Parquet sidecar"
+    assert second.equals(first), "Cached load must return the same data"
+
+
+def test_no_cache_does_not_write_sidecar(csv_path):
+    """Test that cache=False leaves no Parquet sidecar behind."""
+    import glob
+    from drift.cli import _load_frame
+    
+    path = csv_path("feature\n1.0\n2.0\n3.0\n", "data.csv")
+    
+    _load_frame(path, numerical=True, cache=False)
+    
+    assert glob.glob(path + ".*.parquet") == [], "No sidecar must be written"
+
+
+def test_cli_does_not_cache_by_default(csv_path):
+    """Test that the CLI only writes Parquet sidecars when --cache is given."""
+    import glob
+    from drift.cli import main
+    
+    ref_path = csv_path("feature\n1.0\n2.0\n3.0\n", "ref.csv")
+    curr_path = csv_path("feature\n1.0\n2.0\n3.0\n", "curr.csv")
+    
+    with patch('sys.stdout', new_callable=StringIO):
+        main([ref_path, curr_path, '--metric', 'psi', '--threshold', '0.1'])
+    
+    assert glob.glob(ref_path + ".*.parquet") == [], "Caching must be opt-in"
+
+
+def test_parquet_cache_keeps_each_mode_and_unrelated_files(csv_path):
+    """Test that sidecar cleanup only removes stale sidecars of the same mode."""
+    pytest.importorskip("pyarrow")
+    import glob
+    import os
+    from drift.cli import _load_frame
+    
+    path = csv_path("feature\n1\n2\n3\n", "data.csv")
+    unrelated = path + ".backup12345.parquet"
+    with open(unrelated, "wb") as f:
+        f.write(b"user data")
+    
+    _load_frame(path, numerical=True, cache=True)
+    _load_frame(path, numerical=False, cache=True)
+    
+    assert len(glob.glob(path + ".num.*.parquet")) == 1, "Numerical sidecar must be kept"
+    assert len(glob.glob(path + ".cat.*.parquet")) == 1, "Categorical sidecar must be written"
+    assert os.path.exists(unrelated), "Files the cache did not write must not be removed"
+    
+    # Rewriting the file replaces only the stale sidecar of the mode read
+    with open(path, "w") as f:
+        f.write("feature\n4\n5\n6\n")
+    _load_frame(path, numerical=True, cache=True)
+    
+    assert len(glob.glob(path + ".num.*.parquet")) == 1, "Stale numerical sidecar must be replaced"
+    assert len(glob.glob(path + ".cat.*.parquet")) == 1, "Categorical sidecar must be untouched"
+
+
+def test_json_output_has_sorted_keys():
+    """Test that CLI JSON output is compact with sorted keys."""
+    from drift.cli import _dumps
+    
+    result = {"window": {"size": 3}, "alerts": [], "drift_detected": False}
+    
+    assert _dumps(result) == json.dumps(result, sort_keys=True, separators=(',', ':')), \
+        "Output must be key-sorted compact JSON"
+
+
+def test_open_frame_reads_file_like_object():
+    """Test that _open_frame parses an in-memory CSV buffer."""
+    from drift.cli import _open_frame
+    
+    data = _open_frame(StringIO("feature\n1\n2\n3\n"), numerical=True)
+    
+    assert data["feature"].dtype == "float64", "Numerical column must be float64"
+    assert data["feature"].tolist() == [1.0, 2.0, 3.0], "Buffer values must be read"
+
+
+def test_stdin_reference_matches_file_input(csv_path):
+    """Test that '-' reads a CSV from stdin with the same result as a path."""
+    from io import BytesIO, TextIOWrapper
+    from drift.cli import main
+    
+    text = "feature\n1.0\n2.0\n3.0\n4.0\n5.0\n"
+    ref_path = csv_path(text, "ref.csv")
+    curr_path = csv_path("feature\n10.0\n20.0\n30.0\n40.0\n50.0\n", "curr.csv")
+    
+    outputs = []
+    for reference, stdin in ((ref_path, None), ('-', TextIOWrapper(BytesIO(text.encode())))):
+        with patch('sys.argv', ['cli', reference, curr_path, '--metric', 'psi', '--threshold', '0.1']):
+            with patch('sys.stdin', stdin), patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+                exit_code = main()
+                outputs.append((exit_code, json.loads(mock_stdout.getvalue())))
+    
+    assert outputs[0] == outputs[1], "stdin input must give the same result as the file"
+
+
+def test_run_accepts_preloaded_frames():
+    """Test that run() scores DataFrames without reading files."""
+    from drift.cli import parse_args, run
+    
+    args = parse_args(['ref.csv', 'curr.csv', '--metric', 'ks', '--threshold', '0.5'])
+    data = pd.DataFrame({"feature": [1.0, 2.0, 3.0, 4.0, 5.0]})
+    
+    result = run(data, data, args)
+    
+    assert result["drift_detected"] is False, "Identical frames must not drift"
+
+
+def test_main_accepts_argv(identical_csvs):
+    """Test that main parses an explicit argv list instead of sys.argv."""
+    from drift.cli import main
+    
+    ref_path, curr_path = identical_csvs
+    
+    with patch('sys.stdout', new_callable=StringIO):
+        exit_code = main([ref_path, curr_path, '--metric', 'psi', '--threshold', '0.5'])
+    
+    assert exit_code == 0, "Identical files must return 0"
+
+
+def test_invalid_feature_type_returns_one(identical_csvs):
+    """Test that an unknown --feature-type returns exit code 1."""
+    from drift.cli import main
+    
+    ref_path, curr_path = identical_csvs
+    
+    exit_code = main([ref_path, curr_path, '--metric', 'psi', '--threshold', '0.5',
+                      '--feature-type', 'text'])
+    
+    assert exit_code == 1, "Unknown feature type must return 1"
+
+
+def test_load_column_returns_numpy_array(csv_path):
+    """Test that _load_column returns the first column as a NumPy array."""
+    import numpy as np
+    from drift.cli import _load_column
+    
+    path = csv_path("feature,other\n1.5,x\n2.5,y\n3.5,z\n", "data.csv")
+    
+    values = _load_column(path, numerical=True, cache=False)
+    
+    assert isinstance(values, np.ndarray), "Column must be a NumPy array"
+    assert values.dtype == np.float64, "Numerical column must be float64"
+    assert values.tolist() == [1.5, 2.5, 3.5], "Values of the first column must be read"
+
+
+def test_all_columns_reports_every_feature(csv_path):
+    """Test that --all-columns scores each column and exits 2 if any drifts."""
+    from drift.cli import main
+    
+    ref_path = csv_path("a,b\n1.0,1.0\n2.0,2.0\n3.0,3.0\n4.0,4.0\n5.0,5.0\n", "ref.csv")
+    curr_path = csv_path("a,b\n1.0,10.0\n2.0,20.0\n3.0,30.0\n4.0,40.0\n5.0,50.0\n", "curr.csv")
+    
+    with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+        exit_code = main([ref_path, curr_path, '--metric', 'psi', '--threshold', '0.1',
+                          '--all-columns', '--workers', '2'])
+        output = json.loads(mock_stdout.getvalue())
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as curr_file:
-        curr_file.write("feature\na\nb\nc\nc\nb\n")
-        curr_path = curr_file.name
+    assert exit_code == 2, "Drift in one column must return 2"
+    assert output["features"] == ["a", "b"], "Features must be listed in column order"
+    assert output["drift"] == [False, True], "Only column b must drift"
+    assert len(output["values"]) == 2, "One PSI value per column"
+
+
+def test_fail_fast_stops_at_first_drifted_column(csv_path):
+    """Test that --fail-fast returns 2 without scoring columns after the first drift."""
+    from drift.cli import main
+    
+    # Column c holds floats and would fail Chi-Square validation if scored
+    ref_path = csv_path("a,b,c\n" + "x,x,1.5\ny,x,2.5\n" * 5, "ref.csv")
+    curr_path = csv_path("a,b,c\n" + "x,y,1.5\ny,y,2.5\n" * 5, "curr.csv")
+    
+    with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+        exit_code = main([ref_path, curr_path, '--metric', 'chi_square', '--threshold', '0.05',
+                          '--feature-type', 'categorical', '--all-columns', '--fail-fast'])
+        output = json.loads(mock_stdout.getvalue())
+    
+    assert exit_code == 2, "First drifted column must return 2"
+    assert output["features"] == ["a", "b"], "Columns after the first drift must be skipped"
+    assert output["drift"] == [False, True], "Only column b must drift"
+    assert len(output["values"]) == len(output["p_values"]) == 2, "One result per scored column"
+    assert [alert["feature"] for alert in output["alerts"]] == ["b"], "Alert must name column b"
+
+
+def test_fail_fast_keeps_all_columns_layout(csv_path):
+    """Test that --fail-fast prints the same JSON layout as --all-columns alone."""
+    from drift.cli import main
+    
+    ref_path = csv_path("a,b\n" + "x,x\ny,x\n" * 5, "ref.csv")
+    curr_path = csv_path("a,b\n" + "x,x\ny,x\n" * 5, "curr.csv")
+    
+    outputs = []
+    for extra in ([], ['--fail-fast']):
+        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+            exit_code = main([ref_path, curr_path, '--metric', 'chi_square', '--threshold', '0.05',
+                              '--feature-type', 'categorical', '--all-columns'] + extra)
+            outputs.append((exit_code, json.loads(mock_stdout.getvalue())))
+    
+    assert outputs[0] == outputs[1], "Without drift, --fail-fast must print the full columnar result"
+
+
+def test_import_does_not_load_pandas_or_pipeline():
+    """Test that importing drift.cli defers NumPy, pandas and the pipeline to first use."""
+    import subprocess
+    import sys
+    
+    code = ("import sys, drift.cli; "
+            "print('numpy' in sys.modules, 'pandas' in sys.modules, 'drift.pipeline' in sys.modules)")
+    root = os.path.join(os.path.dirname(__file__), "..")
+    output = subprocess.run(
+        [sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True
+    ).stdout
+    
+    assert output.split() == ["False", "False", "False"], \
+        "numpy, pandas and drift.pipeline must load lazily"
+
+
+def test_pd_attribute_resolves_lazily():
+    """Test that drift.cli.pd is still available as a module attribute."""
+    import drift.cli
     
-    try:
-        with patch('sys.argv', ['cli', ref_path, curr_path, '--metric', 'chi_square', '--threshold', '0.05', '--feature-type', 'categorical']):
-            exit_code = main()
-        
-        assert exit_code in [0, 2], "Should return valid exit code for Chi-Square metric"
-    finally:
-        os.unlink(ref_path)
-        os.unlink(curr_path)
+    assert drift.cli.pd is pd, "drift.cli.pd must resolve to pandas"
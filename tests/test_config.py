@@ -91,6 +91,22 @@ def test_raises_error_for_missing_metric_config():
         get_threshold(config, metric="nonexistent_metric", feature="feature1")
 
 
+def test_raises_error_for_supported_but_unconfigured_metric():
+    """Test that a supported metric missing from the config is reported as not configured."""
+    from drift.config import get_threshold
+    
+    config = {
+        "metrics": {
+            "psi": {
+                "default_threshold": 0.1
+            }
+        }
+    }
+    
+    with pytest.raises(ValueError, match="metric 'ks' is not configured"):
+        get_threshold(config, metric="ks", feature="feature1")
+
+
 def test_raises_error_for_missing_default_threshold():
     """Test that error is raised when default_threshold is missing."""
     from drift.config import get_threshold
@@ -208,3 +224,88 @@ def test_config_with_multiple_metrics():
     assert get_threshold(config, metric="psi", feature="f1") == 0.1
     assert get_threshold(config, metric="ks", feature="f1") == 0.3
     assert get_threshold(config, metric="chi_square", feature="f1") == 0.05
+
+
+def test_get_threshold_sees_in_place_config_changes():
+    """Test that editing a config dictionary in place changes the resolved threshold."""
+    from drift.config import get_threshold
+    
+    config = {"metrics": {"psi": {"default_threshold": 0.1}}}
+    
+    assert get_threshold(config, metric="psi", feature="f1") == 0.1
+    
+    config["metrics"]["psi"]["default_threshold"] = 0.5
+    
+    assert get_threshold(config, metric="psi", feature="f1") == 0.5, \
+        "threshold must reflect the edited config"
+
+
+def test_get_threshold_returns_configured_none_default():
+    """Test that a default_threshold of None is returned as configured."""
+    from drift.config import get_threshold
+    
+    config = {"metrics": {"psi": {"default_threshold": None, "feature_thresholds": {"a": 0.2}}}}
+    
+    assert get_threshold(config, metric="psi", feature="a") == 0.2
+    assert get_threshold(config, metric="psi", feature="b") is None, \
+        "a configured None default must not be reported as missing"
+
+
+def test_repeated_lookups_see_in_place_config_changes():
+    """Test that in-place edits between repeated lookups are not hidden by compiled state."""
+    from drift.config import get_threshold
+    
+    config = {"metrics": {"psi": {"default_threshold": 0.1, "feature_thresholds": {"a": 0.2}}}}
+    
+    for _ in range(3):
+        assert get_threshold(config, metric="psi", feature="a") == 0.2
+        assert get_threshold(config, metric="psi", feature="b") == 0.1
+    
+    config["metrics"]["psi"]["feature_thresholds"]["a"] = 0.3
+    config["metrics"]["psi"]["default_threshold"] = 0.5
+    config["metrics"]["ks"] = {"default_threshold": 0.05}
+    
+    assert get_threshold(config, metric="psi", feature="a") == 0.3, "edited override must be used"
+    assert get_threshold(config, metric="psi", feature="b") == 0.5, "edited default must be used"
+    assert get_threshold(config, metric="ks", feature="a") == 0.05, "added metric must be used"
+
+
+def test_compiled_config_returns_configured_none_like_raw_config():
+    """Test that a CompiledConfig resolves None entries the same way as the raw config."""
+    from drift.config import compile_config, get_threshold
+    
+    config = {
+        "metrics": {
+            "psi": {"default_threshold": None, "feature_thresholds": {"a": None}},
+            "ks": {"default_threshold": 0.05, "feature_thresholds": {"a": None}}
+        }
+    }
+    compiled = compile_config(config)
+    
+    for metric in ["psi", "ks"]:
+        for feature in ["a", "b"]:
+            assert get_threshold(compiled, metric=metric, feature=feature) == \
+                get_threshold(config, metric=metric, feature=feature), \
+                f"compiled lookup must match raw lookup for {metric}/{feature}"
+
+
+def test_compiled_config_matches_raw_config():
+    """Test that get_threshold gives the same result for a CompiledConfig."""
+    from drift.config import compile_config, get_threshold
+    
+    config = {
+        "metrics": {
+            "psi": {
+                "default_threshold": 0.1,
+                "feature_thresholds": {"age": 0.2}
+            }
+        }
+    }
+    compiled = compile_config(config)
+    
+    for feature in ["age", "income"]:
+        assert get_threshold(compiled, metric="psi", feature=feature) == \
+            get_threshold(config, metric="psi", feature=feature)
+    
+    with pytest.raises(ValueError, match="not configured"):
+        get_threshold(compiled, metric="ks", feature="age")
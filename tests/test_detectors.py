@@ -342,3 +342,128 @@ def test_chi_square_detector_is_deterministic():
     
     assert result1 == result2, "Chi-Square detector must be deterministic"
 
+
+def test_detectors_return_python_bool_for_numpy_inputs():
+    """Test that drift_detected is a Python bool even for NumPy scalar inputs."""
+    import numpy as np
+    from drift.detectors import detect_psi_drift, detect_chi_square_drift
+    
+    psi = detect_psi_drift(psi_value=np.float64(0.3), threshold=0.1)
+    chi = detect_chi_square_drift(statistic=np.float64(9.0), p_value=np.float64(0.01), threshold=0.05)
+    
+    assert type(psi["drift_detected"]) is bool, "drift_detected must be a Python bool"
+    assert type(chi["drift_detected"]) is bool, "drift_detected must be a Python bool"
+
+
+def test_detector_raises_error_for_nan_threshold():
+    """Test that a NaN threshold is rejected like threshold <= 0."""
+    from drift.detectors import detect_ks_drift
+    
+    with pytest.raises(ValueError, match="threshold must be greater than 0"):
+        detect_ks_drift(statistic=0.2, p_value=0.5, threshold=float("nan"))
+
+
+# ============================================================================
+# DriftResult Detector Tests
+# ============================================================================
+
+def test_detect_result_matches_public_detectors():
+    """Test that _detect_result agrees with the dict-returning detectors."""
+    from drift.detectors import (
+        _detect_result, detect_psi_drift, detect_ks_drift, detect_chi_square_drift
+    )
+    
+    assert _detect_result("psi", 0.25, 0.1).to_dict() == \
+        detect_psi_drift(psi_value=0.25, threshold=0.1)
+    assert _detect_result("ks", 0.2, 0.3, 0.04).to_dict() == \
+        detect_ks_drift(statistic=0.2, p_value=0.04, threshold=0.3)
+    assert _detect_result("chi_square", 12.0, 0.05, 0.01).to_dict() == \
+        detect_chi_square_drift(statistic=12.0, p_value=0.01, threshold=0.05)
+
+
+def test_detect_result_raises_error_for_zero_threshold():
+    """Test that _detect_result raises ValueError for threshold <= 0."""
+    from drift.detectors import _detect_result
+    
+    with pytest.raises(ValueError, match="threshold must be greater than 0"):
+        _detect_result("psi", 0.25, 0)
+
+
+# ============================================================================
+# Batch Detector Tests
+# ============================================================================
+
+def test_psi_batch_detector_matches_scalar_detector():
+    """Test that _detect_psi_batch agrees with detect_psi_drift per entry."""
+    from drift.detectors import _detect_psi_batch, detect_psi_drift
+    
+    values = [0.05, 0.2, 0.1, 0.35]
+    batch = _detect_psi_batch(values, 0.1)
+    
+    for i, value in enumerate(values):
+        expected = detect_psi_drift(psi_value=value, threshold=0.1)
+        assert bool(batch.drift[i]) == expected["drift_detected"], \
+            "Batch PSI drift flag must match scalar detector"
+
+
+def test_ks_and_chi_square_batch_detectors_match_scalar_detectors():
+    """Test that KS/Chi-Square batch detectors agree with the scalar detectors."""
+    from drift.detectors import (
+        _detect_ks_batch, _detect_chi_square_batch,
+        detect_ks_drift, detect_chi_square_drift
+    )
+    
+    statistics = [0.1, 0.4, 12.0]
+    p_values = [0.5, 0.01, 0.04]
+    thresholds = [0.3, 0.3, 0.05]
+    
+    ks_batch = _detect_ks_batch(statistics, p_values, thresholds)
+    chi_batch = _detect_chi_square_batch(statistics, p_values, thresholds)
+    
+    for i in range(3):
+        ks = detect_ks_drift(statistic=statistics[i], p_value=p_values[i], threshold=thresholds[i])
+        chi = detect_chi_square_drift(statistic=statistics[i], p_value=p_values[i], threshold=thresholds[i])
+        assert bool(ks_batch.drift[i]) == ks["drift_detected"], \
+            "Batch KS drift flag must match scalar detector"
+        assert bool(chi_batch.drift[i]) == chi["drift_detected"], \
+            "Batch Chi-Square drift flag must match scalar detector"
+
+
+def test_batch_detector_raises_error_for_non_positive_threshold():
+    """Test that batch detectors raise ValueError when any threshold <= 0."""
+    from drift.detectors import _detect_psi_batch
+    
+    with pytest.raises(ValueError, match="threshold must be greater than 0"):
+        _detect_psi_batch([0.1, 0.2], [0.1, 0])
+
+
+@pytest.mark.parametrize("detector", [
+    "detect_psi_drift_batch", "detect_ks_drift_batch", "detect_chi_square_drift_batch"
+])
+def test_batch_detectors_reject_nan_threshold(detector):
+    """Test that batch detectors reject a NaN threshold, like the scalar detectors."""
+    import numpy as np
+    import drift.detectors as detectors
+    
+    batch_detector = getattr(detectors, detector)
+    args = ([0.1, 0.2],) if detector == "detect_psi_drift_batch" else ([0.1, 0.2], [0.5, 0.01])
+    
+    with pytest.raises(ValueError, match="threshold must be greater than 0"):
+        batch_detector(*args, [0.1, np.nan])
+
+
+def test_public_batch_detectors_return_arrays_per_key():
+    """Test that detect_*_drift_batch mirror the scalar dict keys with arrays."""
+    import numpy as np
+    from drift.detectors import (
+        detect_psi_drift, detect_psi_drift_batch,
+        detect_chi_square_drift, detect_chi_square_drift_batch
+    )
+    
+    psi = detect_psi_drift_batch([0.05, 0.3], [0.1, 0.1])
+    chi = detect_chi_square_drift_batch([3.0, 15.0], [0.4, 0.001], 0.05)
+    
+    assert psi.keys() == detect_psi_drift(psi_value=0.05, threshold=0.1).keys()
+    assert chi.keys() == detect_chi_square_drift(statistic=3.0, p_value=0.4, threshold=0.05).keys()
+    assert np.array_equal(psi["drift_detected"], [False, True]), "PSI drift must be value > threshold"
+    assert np.array_equal(chi["drift_detected"], [False, True]), "Chi-Square drift must be p_value < threshold"
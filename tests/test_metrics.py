@@ -83,6 +83,17 @@ def test_psi_raises_error_for_empty_current():
         calculate_psi(reference, current)
 
 
+def test_psi_checks_empty_before_data_type():
+    """Test that an empty input is reported before the dtype check runs."""
+    from drift.metrics import calculate_psi
+    
+    reference = np.array([1.0, 2.0, 3.0])
+    current = np.array([], dtype=str)
+    
+    with pytest.raises(ValueError, match="current.*empty|empty.*current"):
+        calculate_psi(reference, current)
+
+
 def test_psi_rejects_categorical_data():
     """Test that PSI raises TypeError for categorical/string data."""
     from drift.metrics import calculate_psi
@@ -94,6 +105,23 @@ def test_psi_rejects_categorical_data():
         calculate_psi(reference, current)
 
 
+def test_psi_kernel_matches_numpy_formula():
+    """Test that the fused PSI kernel matches np.histogram-based binning."""
+    from drift._kernels import _psi_kernel
+    
+    ref_props = np.array([0.2, 0.1, 1e-10, 0.3, 0.1, 0.1, 1e-10, 0.1, 0.05, 0.05])
+    current = np.array([0.5, 3.0, 3.5, 6.0, 8.0, 11.0])
+    bins = np.array([-np.inf, 1.9, 2.8, 3.7, 4.6, 5.5, 6.4, 7.3, 8.2, 9.1, np.inf])
+    
+    counts, _ = np.histogram(current, bins=bins)
+    q = np.maximum(counts / len(current), 1e-10)
+    expected = np.sum((q - ref_props) * np.log(q / ref_props))
+    
+    result = _psi_kernel(ref_props, current, bins[1:-1])
+    
+    assert result == pytest.approx(expected), "PSI kernel must match NumPy formula"
+
+
 # ============================================================================
 # KS (Kolmogorov-Smirnov) Test
 # ============================================================================
@@ -227,6 +255,107 @@ def test_ks_rejects_categorical_data():
         calculate_ks(reference, current)
 
 
+@pytest.mark.parametrize("values", [
+    np.array([True, False, True, True]),
+    np.array([1 + 1j, 2.0, 3.0, 4.0])
+], ids=["bool", "complex"])
+def test_numerical_metrics_reject_non_real_dtypes(values):
+    """Test that PSI and KS reject boolean and complex data by dtype."""
+    from drift.metrics import calculate_ks, calculate_psi
+    
+    for metric in (calculate_psi, calculate_ks):
+        with pytest.raises(TypeError, match="requires numerical data"):
+            metric(values, values)
+
+
+def test_kolmogorov_sf_matches_scipy_asymptotic_distribution():
+    """Test that the KS p-value series matches scipy's kstwobign survival function."""
+    from scipy import stats
+    from drift._kernels import _kolmogorov_sf
+    
+    for c in [0.0, 0.05, 0.3, 0.5, 1.0, 1.5, 2.0, 3.0]:
+        assert _kolmogorov_sf(c) == pytest.approx(stats.kstwobign.sf(c), abs=1e-12), \
+            f"KS p-value series must match kstwobign.sf at c={c}"
+
+
+def test_ks_merged_statistic_matches_baseline_with_ties():
+    """Test that the merged-sort KS path matches KSBaseline, including ties."""
+    from drift.baselines import KSBaseline, _ks_sorted_statistic
+    from drift.metrics import calculate_ks
+    
+    rng = np.random.default_rng(0)
+    reference = rng.integers(0, 20, 300).astype(float)
+    current = rng.integers(0, 22, 200).astype(float)
+    
+    expected = KSBaseline(reference).score(current)
+    
+    statistic = _ks_sorted_statistic(np.sort(reference), np.sort(current))
+    assert statistic == pytest.approx(expected["statistic"])
+    assert calculate_ks(reference, current) == pytest.approx(expected), \
+        "Small inputs must give the same result as the baseline path"
+
+
+def test_ks_merge_kernel_handles_tie_runs():
+    """Test that the merge-scan KS kernel consumes tied values on both sides together."""
+    from drift._kernels import _ks_merge_statistic
+    
+    assert _ks_merge_statistic(np.array([1.0]), np.array([1.0, 1.0])) == 0.0, \
+        "Identical tied samples must have zero KS statistic"
+    assert _ks_merge_statistic(np.array([0.0, 1.0]), np.array([1.0, 1.0])) == pytest.approx(0.5)
+    assert _ks_merge_statistic(np.array([0.0, 0.0]), np.array([1.0, 2.0])) == pytest.approx(1.0)
+
+
+def test_ks_small_sample_p_value_matches_scipy_exact():
+    """Test that small-sample KS p-values match scipy's exact distribution."""
+    from scipy import stats
+    from drift.metrics import calculate_ks
+    
+    rng = np.random.default_rng(0)
+    for n, m in [(5, 5), (12, 30), (40, 41), (99, 100)]:
+        reference = rng.normal(0, 1, n)
+        current = rng.normal(0.5, 1, m)
+        
+        expected = stats.ks_2samp(reference, current, method="exact")
+        result = calculate_ks(reference, current)
+        
+        assert result["statistic"] == pytest.approx(expected.statistic)
+        assert result["p_value"] == pytest.approx(expected.pvalue, rel=1e-7, abs=1e-12), \
+            f"Exact p-value must match scipy for n={n}, m={m}"
+
+
+@pytest.mark.parametrize("shift", [1.0, 3.0, 10.0])
+def test_ks_exact_p_value_for_large_statistic(shift):
+    """Test that the banded exact distribution stays exact when D is large."""
+    from scipy import stats
+    from drift.metrics import calculate_ks
+    
+    rng = np.random.default_rng(2)
+    reference = rng.normal(0, 1, 37)
+    current = rng.normal(shift, 1, 53)
+    
+    expected = stats.ks_2samp(reference, current, method="exact")
+    result = calculate_ks(reference, current)
+    
+    assert result["p_value"] == pytest.approx(expected.pvalue, rel=1e-7, abs=1e-12), \
+        f"Exact p-value must match scipy for shift={shift}"
+
+
+def test_ks_large_sample_p_value_close_to_exact():
+    """Test that the corrected asymptotic KS p-value stays close to the exact one."""
+    from scipy import stats
+    from drift.metrics import calculate_ks
+    
+    rng = np.random.default_rng(1)
+    reference = rng.normal(0, 1, 150)
+    current = rng.normal(0.25, 1, 120)
+    
+    expected = stats.ks_2samp(reference, current, method="exact")
+    result = calculate_ks(reference, current)
+    
+    assert result["p_value"] == pytest.approx(expected.pvalue, rel=0.03), \
+        "Asymptotic p-value must be within 3% of the exact p-value"
+
+
 # ============================================================================
 # Chi-Square Test
 # ============================================================================
@@ -347,3 +476,263 @@ def test_chi_square_rejects_continuous_numerical_data():
     with pytest.raises((TypeError, ValueError)):
         calculate_chi_square(reference, current)
 
+
+def test_chi_square_string_categories_match_integer_codes():
+    """Test that string categories give the same result as equivalent integer codes."""
+    from drift.metrics import calculate_chi_square
+    
+    reference = np.array(["x", "y", "z", "x", "y", "x"])
+    current = np.array(["x", "y", "z", "z", "y", "w"])
+    codes = {"w": 0, "x": 1, "y": 2, "z": 3}
+    
+    result_str = calculate_chi_square(reference, current)
+    result_int = calculate_chi_square(
+        np.array([codes[v] for v in reference]),
+        np.array([codes[v] for v in current])
+    )
+    
+    assert result_str["statistic"] == pytest.approx(result_int["statistic"])
+    assert result_str["p_value"] == pytest.approx(result_int["p_value"])
+
+
+@pytest.mark.parametrize("n_categories", [1, 2, 5, 40])
+def test_chi_square_matches_scipy_chi2_contingency(n_categories):
+    """Test that the inline chi-square matches scipy.stats.chi2_contingency."""
+    from scipy import stats
+    from drift.metrics import calculate_chi_square
+    
+    rng = np.random.default_rng(7)
+    reference = rng.integers(0, n_categories, 60)
+    current = rng.integers(0, n_categories, 45)
+    
+    categories = np.union1d(reference, current)
+    table = np.array([
+        [np.sum(reference == c) for c in categories],
+        [np.sum(current == c) for c in categories]
+    ])
+    chi2, p_value, _, _ = stats.chi2_contingency(table)
+    
+    result = calculate_chi_square(reference, current)
+    
+    assert result["statistic"] == pytest.approx(chi2), "statistic must match scipy"
+    assert result["p_value"] == pytest.approx(p_value), "p_value must match scipy"
+
+
+def test_factorize_strings_matches_pandas_factorize():
+    """Test that hashed string factorization matches pd.factorize codes."""
+    import pandas as pd
+    from drift._cat_kernels import factorize_strings
+    
+    values = np.array(["b", "a", "c", "a", "b", "d", "c"])
+    
+    codes, n_categories = factorize_strings(values)
+    expected_codes, uniques = pd.factorize(values, sort=False)
+    
+    assert np.array_equal(codes, expected_codes), "codes must match pd.factorize"
+    assert n_categories == len(uniques), "category count must match pd.factorize"
+
+
+def test_factorize_strings_returns_none_above_category_limit():
+    """Test that hashed factorization gives up above the cardinality limit."""
+    from drift._cat_kernels import factorize_strings
+    
+    values = np.array(["a", "b", "c", "d"])
+    
+    assert factorize_strings(values, max_categories=3) is None, \
+        "factorize_strings must return None above max_categories"
+
+
+def test_factorize_strings_returns_none_on_hash_collision(monkeypatch):
+    """Test that hashed factorization does not merge categories whose hashes collide."""
+    import drift._cat_kernels as cat_kernels
+    
+    values = np.array(["a", "b", "a", "c"])
+    monkeypatch.setattr(cat_kernels, "hash", lambda value: 0 if value in ("a", "b") else 1,
+                        raising=False)
+    
+    assert cat_kernels.factorize_strings(values) is None, \
+        "Colliding categories must not share a code"
+    
+    monkeypatch.setattr(cat_kernels, "hash", lambda value: 0, raising=False)
+    
+    assert cat_kernels.factorize_strings(np.array(["a", "a"]))[1] == 1, \
+        "Equal values sharing a hash must still share a code"
+
+
+def test_psi_batch_matches_per_column_psi():
+    """Test that calculate_psi_batch matches calculate_psi on each column."""
+    from drift.metrics import calculate_psi, calculate_psi_batch
+    
+    rng = np.random.default_rng(0)
+    reference = rng.normal(0, 1, (500, 4))
+    current = rng.normal(0.3, 1, (400, 4))
+    reference[:, 1] = rng.integers(0, 3, 500)  # duplicate quantile edges
+    reference[:, 2] = 1.0                      # constant reference
+    current[:, 2] = rng.integers(0, 2, 400)
+    
+    result = calculate_psi_batch(reference, current)
+    
+    for j in range(4):
+        assert result[j] == pytest.approx(calculate_psi(reference[:, j], current[:, j])), \
+            f"Column {j} must match calculate_psi"
+
+
+def test_psi_batch_with_nan_matches_per_column_psi():
+    """Test that calculate_psi_batch matches calculate_psi when columns hold NaN."""
+    from drift.metrics import calculate_psi, calculate_psi_batch
+    
+    rng = np.random.default_rng(3)
+    reference = rng.normal(0, 1, (200, 3))
+    current = rng.normal(0.3, 1, (150, 3))
+    reference[-5:, 0] = np.nan   # NaN quantile edges
+    reference[7, 1] = np.nan     # NaN in the reference only
+    current[::10, 2] = np.nan    # NaN in the current data only
+    
+    result = calculate_psi_batch(reference, current)
+    
+    for j in range(3):
+        assert result[j] == pytest.approx(calculate_psi(reference[:, j], current[:, j])), \
+            f"Column {j} must match calculate_psi"
+
+
+def test_psi_batch_rejects_mismatched_columns():
+    """Test that calculate_psi_batch requires the same number of columns."""
+    from drift.metrics import calculate_psi_batch
+    
+    with pytest.raises(ValueError, match="same number of columns"):
+        calculate_psi_batch(np.zeros((5, 2)), np.zeros((5, 3)))
+
+
+def test_bin_counts_matches_searchsorted_bincount():
+    """Test that the compiled bin counter matches searchsorted + bincount, ties and NaN included."""
+    from drift._kernels import _bin_counts
+    
+    inner_edges = np.array([-1.0, 0.0, 0.0 + 1e-9, 2.0])
+    values = np.array([-5.0, -1.0, -0.5, 0.0, 1e-9, 1.0, 2.0, 7.0, np.nan])
+    
+    expected = np.bincount(np.searchsorted(inner_edges, values, side='right'), minlength=5)
+    
+    assert _bin_counts(values, inner_edges).tolist() == expected.tolist(), \
+        "Bin counts must match searchsorted(side='right') + bincount"
+    
+    # A reference holding NaN produces NaN edges, which sort above every number
+    nan_edges = np.array([0.0, 2.0, np.nan])
+    expected = np.bincount(np.searchsorted(nan_edges, values, side='right'), minlength=4)
+    
+    assert _bin_counts(values, nan_edges).tolist() == expected.tolist(), \
+        "NaN edges must be ordered as in searchsorted"
+
+
+def test_psi_with_nan_reference_matches_numpy_binning():
+    """Test that PSI with NaN in the reference matches searchsorted binning on every path."""
+    from drift.baselines import clear_baseline_cache
+    from drift.metrics import calculate_psi
+    
+    reference = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, np.nan])
+    current = np.arange(1.0, 10.0)
+    
+    # Independent NumPy computation: quantile edges, searchsorted, bincount
+    inner_edges = np.unique(np.quantile(reference, np.linspace(0, 1, 11)[1:-1]))
+    n_bins = len(inner_edges) + 1
+    ref_props = np.bincount(np.searchsorted(inner_edges, reference, side='right'),
+                            minlength=n_bins) / len(reference)
+    curr_props = np.bincount(np.searchsorted(inner_edges, current, side='right'),
+                             minlength=n_bins) / len(current)
+    ref_props = np.where(ref_props == 0, 1e-10, ref_props)
+    curr_props = np.where(curr_props == 0, 1e-10, curr_props)
+    expected = np.sum((curr_props - ref_props) * np.log(curr_props / ref_props))
+    
+    clear_baseline_cache()
+    
+    assert calculate_psi(reference, current) == pytest.approx(expected), \
+        "PSI must not depend on whether numba is installed"
+
+
+@pytest.mark.parametrize("metric", ["psi", "ks"])
+def test_numerical_metrics_reject_2d_input(metric):
+    """Test that PSI and KS raise ValueError for 2-D input."""
+    from drift.metrics import calculate_ks, calculate_psi
+    
+    calc = calculate_psi if metric == "psi" else calculate_ks
+    data = np.arange(20.0).reshape(10, 2)
+    
+    with pytest.raises(ValueError, match="1-D"):
+        calc(data, data[:, 0])
+    with pytest.raises(ValueError, match="1-D"):
+        calc(data[:, 0], data)
+
+
+def test_psi_from_counts_matches_numpy_formula():
+    """Test that the compiled PSI reduction matches the NumPy formula."""
+    from drift._kernels import _psi_from_counts
+    
+    ref_props = np.array([0.25, 0.25, 1e-10, 0.5])
+    curr_counts = np.array([3, 0, 2, 5])
+    
+    q = np.maximum(curr_counts / curr_counts.sum(), 1e-10)
+    expected = np.sum((q - ref_props) * np.log(q / ref_props))
+    
+    assert _psi_from_counts(ref_props, curr_counts) == pytest.approx(expected), \
+        "PSI reduction must match NumPy formula"
+
+
+def test_psi_batch_kernel_matches_per_feature_psi():
+    """Test that the parallel multi-feature kernel matches per-feature PSI."""
+    from drift._kernels import _psi_batch
+    from drift.baselines import PSIBaseline
+    
+    rng = np.random.default_rng(2)
+    nan_reference = rng.normal(0, 1, 200)
+    nan_reference[::40] = np.nan  # NaN quantile edges (one NaN edge after np.unique)
+    
+    # Features are batched together only when their bin counts agree
+    for baselines in (
+        [PSIBaseline(rng.normal(0, 1, 200)), PSIBaseline(rng.normal(1, 2, 200))],
+        [PSIBaseline(nan_reference)],
+    ):
+        current = np.asfortranarray(rng.normal(0.3, 1, (150, len(baselines))))
+        
+        result = _psi_batch(
+            np.stack([b.ref_props for b in baselines]),
+            current,
+            np.stack([b.inner_edges for b in baselines])
+        )
+        
+        for j, baseline in enumerate(baselines):
+            # Current counts from searchsorted, independent of the compiled kernel
+            counts = np.bincount(
+                np.searchsorted(baseline.inner_edges, current[:, j], side='right'),
+                minlength=baseline.n_bins
+            )
+            expected = baseline.score_counts(counts)
+            assert result[j] == pytest.approx(expected), "Each feature must match PSIBaseline"
+
+
+def test_chi_square_dense_int_counts_match_sorted_counts():
+    """Test that compact integer codes give the same result as the sorted path."""
+    from drift.metrics import calculate_chi_square
+    
+    reference = np.array([-3, 0, 2, 2, 5, 5, 5, 120], dtype=np.int8)
+    current = np.array([-3, -3, 0, 2, 5, 120, 120], dtype=np.int8)
+    
+    result = calculate_chi_square(reference, current)
+    expected = calculate_chi_square(reference.astype(str), current.astype(str))
+    
+    assert result["statistic"] == pytest.approx(expected["statistic"])
+    assert result["p_value"] == pytest.approx(expected["p_value"])
+
+
+def test_chi_square_short_strings_match_object_categories():
+    """Test that short fixed-width strings, packed as integers, match object arrays."""
+    from drift.metrics import calculate_chi_square
+    
+    reference = np.array(["a", "bb", "", "a", "bb", "a"])        # <U2
+    current = np.array(["a", "", "c", "c", "a", "a", "c"])      # <U1
+    
+    expected = calculate_chi_square(reference.astype(object), current.astype(object))
+    
+    for ref, cur in [(reference, current), (reference.astype("S"), current.astype("S"))]:
+        result = calculate_chi_square(ref, cur)
+        assert result["statistic"] == pytest.approx(expected["statistic"]), \
+            f"{ref.dtype}/{cur.dtype} statistic must match object categories"
+        assert result["p_value"] == pytest.approx(expected["p_value"])
@@ -268,6 +268,23 @@ def test_pipeline_raises_error_for_empty_current_data():
         )
 
 
+def test_pipeline_raises_error_for_frame_without_columns():
+    """Test that a DataFrame with no columns is reported as empty data."""
+    from drift.pipeline import run_drift_pipeline
+    
+    reference_data = pd.DataFrame()
+    current_data = pd.DataFrame({"feature": [1.0, 2.0, 3.0]})
+    
+    with pytest.raises(ValueError, match="reference.*empty|empty.*reference"):
+        run_drift_pipeline(
+            reference_data,
+            current_data,
+            feature_type="numerical",
+            metric="psi",
+            threshold=0.1
+        )
+
+
 def test_pipeline_raises_error_for_unsupported_metric():
     """Test that pipeline raises ValueError for unsupported metric."""
     from drift.pipeline import run_drift_pipeline
@@ -285,6 +302,30 @@ def test_pipeline_raises_error_for_unsupported_metric():
         )
 
 
+@pytest.mark.parametrize("metric", ["psi", "ks"])
+@pytest.mark.parametrize("values", [
+    ["a", "b", "c", "d"],
+    [True, False, True, True],
+    np.array(["1.0", "2.0", "3.0", "4.0"], dtype=object),
+])
+def test_pipeline_rejects_non_numerical_column_for_numerical_metric(metric, values):
+    """Test that string, bool and numeric-string columns raise TypeError, not a conversion error."""
+    from drift.pipeline import run_drift_pipeline, run_drift_pipeline_multi
+    
+    data = pd.DataFrame({"feature": values})
+    
+    with pytest.raises(TypeError, match="requires numerical data"):
+        run_drift_pipeline(data, data, feature_type="numerical", metric=metric, threshold=0.1)
+    with pytest.raises(TypeError, match="requires numerical data"):
+        run_drift_pipeline_multi(
+            data,
+            data,
+            feature_types={"feature": "numerical"},
+            metric=metric,
+            thresholds={"feature": 0.1}
+        )
+
+
 def test_pipeline_with_ks_metric():
     """Test pipeline works with KS metric."""
     from drift.pipeline import run_drift_pipeline
@@ -321,3 +362,317 @@ def test_pipeline_with_chi_square_metric():
     
     assert "chi_square" in result["metrics"], "Metrics should contain Chi-Square metric"
     assert isinstance(result["drift_detected"], bool)
+
+
+def test_pipeline_raises_error_for_non_positive_threshold():
+    """Test that pipeline raises ValueError for threshold <= 0."""
+    from drift.pipeline import run_drift_pipeline
+    
+    reference_data = pd.DataFrame({"feature": [1.0, 2.0, 3.0, 4.0, 5.0]})
+    current_data = pd.DataFrame({"feature": [1.5, 2.5, 3.5, 4.5, 5.5]})
+    
+    with pytest.raises(ValueError, match="threshold must be greater than 0"):
+        run_drift_pipeline(
+            reference_data,
+            current_data,
+            feature_type="numerical",
+            metric="psi",
+            threshold=0
+        )
+
+
+def test_pipeline_raises_error_for_unsupported_feature_type():
+    """Test that pipeline raises ValueError for unsupported feature_type."""
+    from drift.pipeline import run_drift_pipeline
+    
+    reference_data = pd.DataFrame({"feature": [1.0, 2.0, 3.0, 4.0, 5.0]})
+    current_data = pd.DataFrame({"feature": [1.5, 2.5, 3.5, 4.5, 5.5]})
+    
+    with pytest.raises(ValueError, match="unsupported.*feature_type"):
+        run_drift_pipeline(
+            reference_data,
+            current_data,
+            feature_type="text",
+            metric="psi",
+            threshold=0.1
+        )
+
+
+def test_multi_feature_pipeline_returns_result_per_feature():
+    """Test that the multi-feature pipeline reports every column."""
+    from drift.pipeline import run_drift_pipeline_multi
+    
+    reference_data = pd.DataFrame({
+        "stable": [1.0, 2.0, 3.0, 4.0, 5.0],
+        "shifted": [1.0, 2.0, 3.0, 4.0, 5.0]
+    })
+    current_data = pd.DataFrame({
+        "stable": [1.0, 2.0, 3.0, 4.0, 5.0],
+        "shifted": [10.0, 20.0, 30.0, 40.0, 50.0]
+    })
+    
+    result = run_drift_pipeline_multi(
+        reference_data,
+        current_data,
+        feature_types={"stable": "numerical", "shifted": "numerical"},
+        metric="psi",
+        thresholds={"stable": 0.1, "shifted": 0.1}
+    )
+    
+    assert list(result["features"]) == ["stable", "shifted"]
+    assert result["features"]["stable"]["drift_detected"] is False
+    assert result["features"]["shifted"]["drift_detected"] is True
+    assert result["drift_detected"] is True
+    assert [alert["feature"] for alert in result["alerts"]] == ["shifted"]
+
+
+def test_multi_feature_pipeline_matches_single_feature_pipeline():
+    """Test that per-feature results match running the pipeline per column."""
+    from drift.pipeline import run_drift_pipeline, run_drift_pipeline_multi
+    
+    reference_data = pd.DataFrame({
+        "a": [1.0, 2.0, 3.0, 4.0, 5.0],
+        "b": [5.0, 3.0, 1.0, 2.0, 4.0]
+    })
+    current_data = pd.DataFrame({
+        "a": [1.5, 2.5, 3.5, 4.5, 5.5],
+        "b": [5.0, 5.0, 1.0, 1.0, 4.0]
+    })
+    
+    result = run_drift_pipeline_multi(
+        reference_data,
+        current_data,
+        feature_types={"a": "numerical", "b": "numerical"},
+        metric="ks",
+        thresholds={"a": 0.3, "b": 0.3},
+        n_jobs=2
+    )
+    
+    for column in ["a", "b"]:
+        single = run_drift_pipeline(
+            reference_data[[column]],
+            current_data[[column]],
+            feature_type="numerical",
+            metric="ks",
+            threshold=0.3
+        )
+        assert result["features"][column]["metrics"] == single["metrics"]
+        assert result["features"][column]["drift_detected"] == single["drift_detected"]
+
+
+@pytest.mark.parametrize("metric,pool_workers", [("ks", [2]), ("psi", [])])
+def test_multi_feature_pipeline_uses_n_jobs_only_for_pooled_metrics(monkeypatch, metric,
+                                                                    pool_workers):
+    """Test that KS is scored on an n_jobs thread pool and PSI by the batch kernel alone."""
+    from concurrent.futures import ThreadPoolExecutor
+    import drift.pipeline as pipeline
+    
+    workers = []
+    
+    class RecordingExecutor(ThreadPoolExecutor):
+        def __init__(self, max_workers=None):
+            workers.append(max_workers)
+            super().__init__(max_workers=max_workers)
+    
+    monkeypatch.setattr(pipeline, "ThreadPoolExecutor", RecordingExecutor)
+    reference_data = pd.DataFrame({"a": [1.0, 2.0, 3.0, 4.0], "b": [4.0, 3.0, 2.0, 1.0]})
+    
+    pipeline.run_drift_pipeline_multi(
+        reference_data,
+        reference_data,
+        feature_types={"a": "numerical", "b": "numerical"},
+        metric=metric,
+        thresholds={"a": 0.2, "b": 0.2},
+        n_jobs=2
+    )
+    
+    assert workers == pool_workers, "Only pooled metrics may start an n_jobs thread pool"
+
+
+def test_pipeline_accepts_numpy_arrays():
+    """Test that 1-D arrays give the same result as single-column DataFrames."""
+    from drift.pipeline import run_drift_pipeline
+    
+    reference = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+    current = np.array([1.5, 2.5, 3.5, 4.5, 5.5])
+    
+    from_arrays = run_drift_pipeline(
+        reference, current, feature_type="numerical", metric="ks", threshold=0.3
+    )
+    from_frames = run_drift_pipeline(
+        pd.DataFrame({"feature": reference}),
+        pd.DataFrame({"feature": current}),
+        feature_type="numerical",
+        metric="ks",
+        threshold=0.3
+    )
+    
+    assert from_arrays == from_frames, "Array input must match DataFrame input"
+
+
+def test_multi_feature_psi_matches_single_feature_pipeline():
+    """Test that multi-feature PSI matches running the pipeline per column."""
+    from drift.pipeline import run_drift_pipeline, run_drift_pipeline_multi
+    
+    rng = np.random.default_rng(0)
+    reference_data = pd.DataFrame({
+        "normal": rng.normal(0, 1, 200),
+        "discrete": rng.integers(0, 3, 200).astype(float)
+    })
+    current_data = pd.DataFrame({
+        "normal": rng.normal(0.5, 1, 150),
+        "discrete": rng.integers(0, 4, 150).astype(float)
+    })
+    
+    result = run_drift_pipeline_multi(
+        reference_data,
+        current_data,
+        feature_types={"normal": "numerical", "discrete": "numerical"},
+        metric="psi",
+        thresholds={"normal": 0.1, "discrete": 0.1}
+    )
+    
+    for column in ["normal", "discrete"]:
+        single = run_drift_pipeline(
+            reference_data[[column]],
+            current_data[[column]],
+            feature_type="numerical",
+            metric="psi",
+            threshold=0.1
+        )
+        assert result["features"][column]["metrics"]["psi"] == pytest.approx(
+            single["metrics"]["psi"]
+        ), f"PSI for {column} must match the single-feature pipeline"
+
+
+@pytest.mark.parametrize("metric", ["psi", "ks"])
+def test_multi_feature_pipeline_handles_mixed_dtypes_and_column_order(metric):
+    """Test that numerical metrics use the right columns when current columns are reordered."""
+    from drift.pipeline import run_drift_pipeline, run_drift_pipeline_multi
+    
+    rng = np.random.default_rng(1)
+    reference_data = pd.DataFrame({
+        "counts": rng.integers(0, 10, 300),
+        "normal": rng.normal(0, 1, 300)
+    })
+    current_data = pd.DataFrame({
+        "normal": rng.normal(0.3, 1, 200),
+        "counts": rng.integers(2, 10, 200)
+    })
+    
+    result = run_drift_pipeline_multi(
+        reference_data,
+        current_data,
+        feature_types={"counts": "numerical", "normal": "numerical"},
+        metric=metric,
+        thresholds={"counts": 0.1, "normal": 0.1}
+    )
+    
+    for column in ["counts", "normal"]:
+        single = run_drift_pipeline(
+            reference_data[[column]],
+            current_data[[column]],
+            feature_type="numerical",
+            metric=metric,
+            threshold=0.1
+        )
+        expected = single["metrics"][metric]
+        assert result["features"][column]["metrics"][metric] == pytest.approx(expected), \
+            f"{metric} for {column} must match the single-feature pipeline"
+
+
+def test_columnar_pipeline_matches_multi_feature_pipeline():
+    """Test that the columnar layout holds the same per-feature results."""
+    from drift.pipeline import run_drift_pipeline_columnar, run_drift_pipeline_multi
+    
+    reference_data = pd.DataFrame({
+        "a": [1.0, 2.0, 3.0, 4.0, 5.0],
+        "b": [5.0, 3.0, 1.0, 2.0, 4.0]
+    })
+    current_data = pd.DataFrame({
+        "a": [1.0, 2.0, 3.0, 4.0, 5.0],
+        "b": [50.0, 30.0, 10.0, 20.0, 40.0]
+    })
+    kwargs = dict(
+        feature_types={"a": "numerical", "b": "numerical"},
+        metric="ks",
+        thresholds={"a": 0.3, "b": 0.3}
+    )
+    
+    columnar = run_drift_pipeline_columnar(reference_data, current_data, **kwargs)
+    multi = run_drift_pipeline_multi(reference_data, current_data, **kwargs)
+    
+    assert columnar["features"] == ["a", "b"]
+    assert columnar["drift"].tolist() == [
+        multi["features"][c]["drift_detected"] for c in ["a", "b"]
+    ]
+    assert columnar["values"].tolist() == [
+        multi["features"][c]["metrics"]["ks"]["statistic"] for c in ["a", "b"]
+    ]
+    assert columnar["p_values"].tolist() == [
+        multi["features"][c]["metrics"]["ks"]["p_value"] for c in ["a", "b"]
+    ]
+    assert columnar["drift_detected"] is multi["drift_detected"]
+    assert columnar["alerts"] == multi["alerts"]
+
+
+def test_multi_feature_pipeline_raises_error_for_missing_current_column():
+    """Test that multi-feature pipeline raises ValueError for a missing column."""
+    from drift.pipeline import run_drift_pipeline_multi
+    
+    reference_data = pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": [1.0, 2.0, 3.0]})
+    current_data = pd.DataFrame({"a": [1.0, 2.0, 3.0]})
+    
+    with pytest.raises(ValueError, match="missing.*columns"):
+        run_drift_pipeline_multi(
+            reference_data,
+            current_data,
+            feature_types={"a": "numerical", "b": "numerical"},
+            metric="psi",
+            thresholds={"a": 0.1, "b": 0.1}
+        )
+
+
+@pytest.mark.parametrize("metric,feature_type,reference,current", [
+    ("psi", "numerical", np.linspace(0, 10, 50), np.linspace(2, 14, 40)),
+    ("ks", "numerical", np.linspace(0, 10, 50), np.linspace(2, 14, 40)),
+    ("chi_square", "categorical", np.array(list("aabbbcccdd") * 4), np.array(list("abccddddee") * 3)),
+])
+def test_chunked_pipeline_matches_pipeline(metric, feature_type, reference, current):
+    """Test that chunked input gives the same result as the in-memory pipeline."""
+    from drift.pipeline import run_drift_pipeline, run_drift_pipeline_chunked
+    
+    expected = run_drift_pipeline(
+        pd.DataFrame({"feature": reference}),
+        pd.DataFrame({"feature": current}),
+        feature_type=feature_type,
+        metric=metric,
+        threshold=0.1
+    )
+    result = run_drift_pipeline_chunked(
+        np.array_split(reference, 3),
+        np.array_split(current, 4),
+        feature_type=feature_type,
+        metric=metric,
+        threshold=0.1
+    )
+    
+    assert list(result) == list(expected), "Chunked result must have the same keys in order"
+    assert result["drift_detected"] == expected["drift_detected"]
+    assert result["window"] == expected["window"]
+    assert result["metrics"][metric] == pytest.approx(expected["metrics"][metric]), \
+        "Chunked metric must match the in-memory metric"
+
+
+def test_chunked_pipeline_raises_error_for_empty_current():
+    """Test that chunked pipeline raises ValueError when no current data arrives."""
+    from drift.pipeline import run_drift_pipeline_chunked
+    
+    with pytest.raises(ValueError, match="current.*empty"):
+        run_drift_pipeline_chunked(
+            [np.array([1.0, 2.0, 3.0])],
+            [],
+            feature_type="numerical",
+            metric="psi",
+            threshold=0.1
+        )
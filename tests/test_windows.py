@@ -8,223 +8,231 @@ This module tests window selection behavior for drift detection:
 - Deterministic behavior
 """
 
+import re
+
 import pytest
+import numpy as np
 import pandas as pd
 
+from drift.windows import get_windows_stream
 
-def test_get_windows_function_exists():
-    """Test that get_windows function exists in drift.windows module."""
-    from drift.windows import get_windows
-    
-    assert callable(get_windows), "get_windows must be a callable function"
+# Error messages of the size checks, compiled once for pytest.raises(match=...)
+_REF_POS = re.compile(r"reference_size must be greater than 0")
+_CUR_POS = re.compile(r"current_size must be greater than 0")
+_REF_EXC = re.compile(r"reference_size.*exceeds.*data")
+_CUR_EXC = re.compile(r"current_size.*exceeds.*data")
 
 
-def test_reference_window_selects_first_n_rows():
-    """Test that reference window consists of the FIRST N rows."""
-    from drift.windows import get_windows
-    
-    # Create test dataset with identifiable rows
-    data = pd.DataFrame({
-        "feature1": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
-        "feature2": [10, 20, 30, 40, 50, 60, 70, 80, 90, 100]
+# Datasets are built once per module; windowing never modifies its input,
+# so the tests can share them
+
+@pytest.fixture(scope="module")
+def df10():
+    """Return a 10-row, two-column dataset with identifiable rows."""
+    return pd.DataFrame({
+        "feature1": np.arange(1, 11),
+        "feature2": np.arange(10, 101, 10)
     })
+
+
+@pytest.fixture(scope="module")
+def df5():
+    """Return a 5-row, single-column dataset."""
+    return pd.DataFrame({"feature1": np.arange(1, 6)})
+
+
+@pytest.fixture(scope="module")
+def df6():
+    """Return a 6-row, two-column dataset."""
+    return pd.DataFrame({
+        "feature1": np.arange(10, 61, 10),
+        "feature2": np.arange(1, 7)
+    })
+
+
+@pytest.fixture(scope="module")
+def df7():
+    """Return a 7-row dataset with a single column named "col"."""
+    return pd.DataFrame({"col": np.arange(1, 8)})
+
+
+@pytest.fixture(scope="module")
+def df_multi():
+    """Return a 5-row dataset with two numeric and one string column."""
+    return pd.DataFrame({
+        "a": np.arange(1, 6),
+        "b": np.arange(10, 51, 10),
+        "c": ["x", "y", "z", "w", "v"]
+    })
+
+
+def test_api_contract(get_windows, df5):
+    """Test that get_windows is callable and returns a (reference, current) tuple."""
+    assert callable(get_windows), "get_windows must be a callable function"
     
+    result = get_windows(df5, 2, 2)
+    
+    assert isinstance(result, tuple), "get_windows must return a tuple"
+    assert len(result) == 2, "get_windows must return a tuple of length 2"
+
+
+def test_reference_window_selects_first_n_rows(get_windows, df10):
+    """Test that reference window consists of the FIRST N rows."""
     reference_size = 4
     current_size = 3
     
-    reference_window, current_window = get_windows(data, reference_size, current_size)
+    reference_window, current_window = get_windows(df10, reference_size, current_size)
     
     # Reference window should be first 4 rows
-    assert len(reference_window) == 4, "Reference window must have correct size"
-    assert list(reference_window["feature1"]) == [1, 2, 3, 4], \
+    assert reference_window.shape[0] == 4, "Reference window must have correct size"
+    assert np.array_equal(reference_window["feature1"].to_numpy(), [1, 2, 3, 4]), \
         "Reference window must contain first N rows in order"
 
 
-def test_current_window_selects_last_n_rows():
+def test_current_window_selects_last_n_rows(get_windows, df10):
     """Test that current window consists of the LAST N rows."""
-    from drift.windows import get_windows
-    
-    # Create test dataset with identifiable rows
-    data = pd.DataFrame({
-        "feature1": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
-        "feature2": [10, 20, 30, 40, 50, 60, 70, 80, 90, 100]
-    })
-    
     reference_size = 4
     current_size = 3
     
-    reference_window, current_window = get_windows(data, reference_size, current_size)
+    reference_window, current_window = get_windows(df10, reference_size, current_size)
     
     # Current window should be last 3 rows
-    assert len(current_window) == 3, "Current window must have correct size"
-    assert list(current_window["feature1"]) == [8, 9, 10], \
+    assert current_window.shape[0] == 3, "Current window must have correct size"
+    assert np.array_equal(current_window["feature1"].to_numpy(), [8, 9, 10]), \
         "Current window must contain last N rows in order"
 
 
-def test_windows_preserve_order():
+def test_windows_preserve_order(get_windows):
     """Test that both windows preserve row order from original dataset."""
-    from drift.windows import get_windows
-    
     data = pd.DataFrame({
-        "feature1": [100, 200, 300, 400, 500],
+        "feature1": np.arange(100, 501, 100),
         "feature2": ["a", "b", "c", "d", "e"]
     })
     
     reference_window, current_window = get_windows(data, 2, 2)
     
     # Reference: first 2 rows in order
-    assert list(reference_window["feature1"]) == [100, 200]
-    assert list(reference_window["feature2"]) == ["a", "b"]
+    assert np.array_equal(reference_window["feature1"].to_numpy(), [100, 200])
+    assert reference_window["feature2"].tolist() == ["a", "b"]
     
     # Current: last 2 rows in order
-    assert list(current_window["feature1"]) == [400, 500]
-    assert list(current_window["feature2"]) == ["d", "e"]
-
-
-def test_get_windows_raises_error_for_zero_reference_size():
-    """Test that ValueError is raised when reference_size <= 0."""
-    from drift.windows import get_windows
-    
-    data = pd.DataFrame({"feature1": [1, 2, 3, 4, 5]})
-    
-    with pytest.raises(ValueError, match="reference_size must be greater than 0"):
-        get_windows(data, reference_size=0, current_size=2)
-
-
-def test_get_windows_raises_error_for_negative_reference_size():
-    """Test that ValueError is raised when reference_size is negative."""
-    from drift.windows import get_windows
-    
-    data = pd.DataFrame({"feature1": [1, 2, 3, 4, 5]})
+    assert np.array_equal(current_window["feature1"].to_numpy(), [400, 500])
+    assert current_window["feature2"].tolist() == ["d", "e"]
+
+
+@pytest.mark.parametrize("reference_size,current_size,message", [
+    (0, 2, _REF_POS),
+    (-5, 2, _REF_POS),
+    (2, 0, _CUR_POS),
+    (2, -3, _CUR_POS),
+    (6, 2, _REF_EXC),
+    (2, 10, _CUR_EXC),
+])
+def test_get_windows_raises_error_for_invalid_sizes(get_windows, df5, reference_size, current_size,
+                                                     message):
+    """Test that ValueError is raised for non-positive sizes or sizes > dataset size."""
+    with pytest.raises(ValueError, match=message):
+        get_windows(df5, reference_size=reference_size, current_size=current_size)
+
+
+def test_get_windows_is_deterministic(get_windows, df6):
+    """Test that calling get_windows multiple times returns identical results."""
+    # Call get_windows twice on the same input
+    ref1, curr1 = get_windows(df6, 3, 2)
+    ref2, curr2 = get_windows(df6, 3, 2)
     
-    with pytest.raises(ValueError, match="reference_size must be greater than 0"):
-        get_windows(data, reference_size=-5, current_size=2)
+    # Both calls should return identical windows
+    assert ref1.equals(ref2), "Reference windows must be deterministic"
+    assert curr1.equals(curr2), "Current windows must be deterministic"
 
 
-def test_get_windows_raises_error_for_zero_current_size():
-    """Test that ValueError is raised when current_size <= 0."""
-    from drift.windows import get_windows
-    
-    data = pd.DataFrame({"feature1": [1, 2, 3, 4, 5]})
+def test_get_windows_with_single_column_dataframe(get_windows, df7):
+    """Test that get_windows works with single-column DataFrames."""
+    reference_window, current_window = get_windows(df7, 3, 2)
     
-    with pytest.raises(ValueError, match="current_size must be greater than 0"):
-        get_windows(data, reference_size=2, current_size=0)
+    assert np.array_equal(reference_window["col"].to_numpy(), [1, 2, 3])
+    assert np.array_equal(current_window["col"].to_numpy(), [6, 7])
 
 
-def test_get_windows_raises_error_for_negative_current_size():
-    """Test that ValueError is raised when current_size is negative."""
-    from drift.windows import get_windows
-    
-    data = pd.DataFrame({"feature1": [1, 2, 3, 4, 5]})
+def test_get_windows_with_multi_column_dataframe(get_windows, df_multi):
+    """Test that get_windows works with multi-column DataFrames."""
+    reference_window, current_window = get_windows(df_multi, 2, 2)
     
-    with pytest.raises(ValueError, match="current_size must be greater than 0"):
-        get_windows(data, reference_size=2, current_size=-3)
-
-
-def test_get_windows_raises_error_when_reference_size_exceeds_data_size():
-    """Test that ValueError is raised when reference_size > dataset size."""
-    from drift.windows import get_windows
+    # Check all columns are preserved
+    assert reference_window.columns.equals(pd.Index(["a", "b", "c"]))
+    assert current_window.columns.equals(pd.Index(["a", "b", "c"]))
     
-    data = pd.DataFrame({"feature1": [1, 2, 3]})
+    # Check reference window (first 2 rows)
+    assert np.array_equal(reference_window["a"].to_numpy(), [1, 2])
+    assert np.array_equal(reference_window["b"].to_numpy(), [10, 20])
+    assert reference_window["c"].tolist() == ["x", "y"]
     
-    with pytest.raises(ValueError, match="reference_size.*exceeds.*data"):
-        get_windows(data, reference_size=5, current_size=2)
+    # Check current window (last 2 rows)
+    assert np.array_equal(current_window["a"].to_numpy(), [4, 5])
+    assert np.array_equal(current_window["b"].to_numpy(), [40, 50])
+    assert current_window["c"].tolist() == ["w", "v"]
 
 
-def test_get_windows_raises_error_when_current_size_exceeds_data_size():
-    """Test that ValueError is raised when current_size > dataset size."""
-    from drift.windows import get_windows
+def test_get_windows_with_equal_reference_and_current_sizes(get_windows):
+    """Test that get_windows works when reference_size == current_size."""
+    data = pd.DataFrame({"feature": np.arange(1, 7)})
     
-    data = pd.DataFrame({"feature1": [1, 2, 3, 4]})
+    reference_window, current_window = get_windows(data, 3, 3)
     
-    with pytest.raises(ValueError, match="current_size.*exceeds.*data"):
-        get_windows(data, reference_size=2, current_size=10)
+    assert reference_window.shape[0] == 3
+    assert current_window.shape[0] == 3
+    assert np.array_equal(reference_window["feature"].to_numpy(), [1, 2, 3])
+    assert np.array_equal(current_window["feature"].to_numpy(), [4, 5, 6])
 
 
-def test_get_windows_is_deterministic():
-    """Test that calling get_windows multiple times returns identical results."""
-    from drift.windows import get_windows
-    
-    data = pd.DataFrame({
-        "feature1": [10, 20, 30, 40, 50, 60],
-        "feature2": [1, 2, 3, 4, 5, 6]
-    })
-    
-    # Call get_windows multiple times
-    ref1, curr1 = get_windows(data, 3, 2)
-    ref2, curr2 = get_windows(data, 3, 2)
-    ref3, curr3 = get_windows(data, 3, 2)
+def test_get_windows_with_columns_returns_array_views(get_windows):
+    """Test that get_windows returns NumPy views when columns is given."""
+    data = pd.DataFrame({"feature": np.arange(1.0, 7.0)})
     
-    # All reference windows should be identical
-    assert ref1.equals(ref2), "Reference windows must be deterministic"
-    assert ref2.equals(ref3), "Reference windows must be deterministic"
+    reference_window, current_window = get_windows(data, 3, 2, columns="feature")
     
-    # All current windows should be identical
-    assert curr1.equals(curr2), "Current windows must be deterministic"
-    assert curr2.equals(curr3), "Current windows must be deterministic"
+    assert isinstance(reference_window, np.ndarray)
+    assert list(reference_window) == [1.0, 2.0, 3.0]
+    assert list(current_window) == [5.0, 6.0]
+    assert np.shares_memory(reference_window, data["feature"].to_numpy()), \
+        "Windows must be views, not copies"
 
 
-def test_get_windows_returns_tuple():
-    """Test that get_windows returns a tuple."""
-    from drift.windows import get_windows
-    
-    data = pd.DataFrame({"feature1": [1, 2, 3, 4, 5]})
+def test_get_windows_with_mixed_dtype_columns_copies_once(get_windows):
+    """Test that mixed-dtype columns are materialized as one copy the windows slice."""
+    data = pd.DataFrame({"a": np.arange(1, 7), "b": np.arange(1.0, 7.0)})
     
-    result = get_windows(data, 2, 2)
+    reference_window, current_window = get_windows(data, 3, 2, columns=["a", "b"])
     
-    assert isinstance(result, tuple), "get_windows must return a tuple"
-    assert len(result) == 2, "get_windows must return a tuple of length 2"
+    assert reference_window.dtype == np.float64, "Mixed columns must be upcast to a common dtype"
+    assert np.array_equal(reference_window, [[1, 1], [2, 2], [3, 3]])
+    assert np.array_equal(current_window, [[5, 5], [6, 6]])
+    assert not np.shares_memory(reference_window, data["b"].to_numpy()), \
+        "Columns of different dtypes cannot be viewed without a copy"
+    assert reference_window.base is current_window.base, \
+        "Both windows must slice the same materialized array"
 
 
-def test_get_windows_with_single_column_dataframe():
-    """Test that get_windows works with single-column DataFrames."""
-    from drift.windows import get_windows
-    
-    data = pd.DataFrame({"col": [1, 2, 3, 4, 5, 6, 7]})
+def test_get_windows_stream_yields_adjacent_windows():
+    """Test that get_windows_stream yields adjacent reference/current slices."""
+    data = np.arange(1, 8)
     
-    reference_window, current_window = get_windows(data, 3, 2)
+    pairs = list(get_windows_stream(data, reference_size=3, current_size=2, stride=2))
     
-    assert list(reference_window["col"]) == [1, 2, 3]
-    assert list(current_window["col"]) == [6, 7]
+    assert [(list(r), list(c)) for r, c in pairs] == [
+        ([1, 2, 3], [4, 5]),
+        ([3, 4, 5], [6, 7]),
+    ]
 
 
-def test_get_windows_with_multi_column_dataframe():
-    """Test that get_windows works with multi-column DataFrames."""
-    from drift.windows import get_windows
-    
-    data = pd.DataFrame({
-        "a": [1, 2, 3, 4, 5],
-        "b": [10, 20, 30, 40, 50],
-        "c": ["x", "y", "z", "w", "v"]
-    })
-    
-    reference_window, current_window = get_windows(data, 2, 2)
-    
-    # Check all columns are preserved
-    assert list(reference_window.columns) == ["a", "b", "c"]
-    assert list(current_window.columns) == ["a", "b", "c"]
-    
-    # Check reference window (first 2 rows)
-    assert list(reference_window["a"]) == [1, 2]
-    assert list(reference_window["b"]) == [10, 20]
-    assert list(reference_window["c"]) == ["x", "y"]
-    
-    # Check current window (last 2 rows)
-    assert list(current_window["a"]) == [4, 5]
-    assert list(current_window["b"]) == [40, 50]
-    assert list(current_window["c"]) == ["w", "v"]
+def test_get_windows_stream_raises_error_when_windows_exceed_data_size():
+    """Test that get_windows_stream raises ValueError when windows exceed data."""
+    with pytest.raises(ValueError, match="exceeds.*data"):
+        get_windows_stream([1, 2, 3, 4], reference_size=3, current_size=2)
 
 
-def test_get_windows_with_equal_reference_and_current_sizes():
-    """Test that get_windows works when reference_size == current_size."""
-    from drift.windows import get_windows
-    
-    data = pd.DataFrame({"feature": [1, 2, 3, 4, 5, 6]})
-    
-    reference_window, current_window = get_windows(data, 3, 3)
-    
-    assert len(reference_window) == 3
-    assert len(current_window) == 3
-    assert list(reference_window["feature"]) == [1, 2, 3]
-    assert list(current_window["feature"]) == [4, 5, 6]
+def test_get_windows_stream_raises_error_for_zero_stride():
+    """Test that get_windows_stream raises ValueError for stride <= 0."""
+    with pytest.raises(ValueError, match="stride must be greater than 0"):
+        get_windows_stream([1, 2, 3, 4], reference_size=2, current_size=2, stride=0)
 